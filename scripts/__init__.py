@@ -0,0 +1,10 @@
+"""
+Content Nuke automation scripts
+Part of Claude AutoBlog SlashCommands Content Nuke
+
+Installed, this package is content_nuke (see setup.py); in a checkout it is
+imported as scripts. Modules import each other relative to the package.
+Each module that also runs as a plain script (python3 scripts/post_x_thread.py)
+starts with a short prologue that puts the checkout on sys.path[0] and sets
+__package__ before its first sibling import; it does nothing on import.
+"""
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Social analytics tables in the shared content analytics database
+Part of Claude AutoBlog SlashCommands Content Nuke
+Engagement metrics, replies and poll cursors for our posts, written in bulk
+"""
+import os
+import time
+import sqlite3
+
+# Same database the slash commands log content to (see commands/post-x.md);
+# CONTENT_ANALYTICS_DB overrides it
+ANALYTICS_DB = os.environ.get(
+    'CONTENT_ANALYTICS_DB', "/home/jeremy/analytics/databases/content_analytics.db")
+
+METRIC_FIELDS = ('impressions', 'likes', 'reposts', 'replies', 'quotes', 'bookmarks', 'comments')
+
+class AnalyticsStore:
+    """Content Nuke's social_* tables; other analytics tables are left alone"""
+
+    def __init__(self, path=ANALYTICS_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS social_metrics (
+                platform TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                source TEXT,
+                posted_at REAL,
+                impressions INTEGER,
+                likes INTEGER,
+                reposts INTEGER,
+                replies INTEGER,
+                quotes INTEGER,
+                bookmarks INTEGER,
+                comments INTEGER,
+                refreshed_at REAL,
+                missing INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (platform, post_id)
+            );
+            CREATE INDEX IF NOT EXISTS social_metrics_refresh ON social_metrics (platform, refreshed_at);
+            CREATE TABLE IF NOT EXISTS social_replies (
+                platform TEXT NOT NULL,
+                reply_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                conversation_id TEXT,
+                in_reply_to TEXT,
+                author_id TEXT,
+                author_username TEXT,
+                text TEXT,
+                created_at TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (platform, reply_id)
+            );
+            CREATE INDEX IF NOT EXISTS social_replies_conversation ON social_replies (conversation_id);
+            CREATE TABLE IF NOT EXISTS social_cursors (
+                name TEXT PRIMARY KEY,
+                since_id TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+
+    def register_posts(self, posts):
+        """Make sure every known post has a row; posts are (platform, post_id, source, posted_at)"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO social_metrics (platform, post_id, source, posted_at) VALUES (?, ?, ?, ?)",
+                posts)
+
+    def due_for_refresh(self, platform, windows, now=None):
+        """Post IDs whose last refresh is older than the window for their age.
+
+        windows is [(max_age_seconds, refresh_every_seconds), ...] from newest to oldest.
+        """
+        now = now or time.time()
+        due = []
+        for row in self.conn.execute(
+                "SELECT post_id, posted_at, refreshed_at FROM social_metrics "
+                "WHERE platform = ? AND missing = 0", (platform,)):
+            age = now - (row['posted_at'] or 0)
+            every = next((interval for max_age, interval in windows if age < max_age), windows[-1][1])
+            if row['refreshed_at'] is None or now - row['refreshed_at'] >= every:
+                due.append(row['post_id'])
+        return due
+
+    def upsert_metrics(self, platform, rows, now=None):
+        """Bulk write {post_id: {field: value}} in one transaction"""
+        now = now or time.time()
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO social_metrics (platform, post_id, {', '.join(METRIC_FIELDS)}, refreshed_at) "
+                f"VALUES (?, ?, {', '.join('?' * len(METRIC_FIELDS))}, ?) "
+                f"ON CONFLICT (platform, post_id) DO UPDATE SET "
+                f"{', '.join(f'{field} = excluded.{field}' for field in METRIC_FIELDS)}, "
+                f"refreshed_at = excluded.refreshed_at, missing = 0",
+                [(platform, post_id, *(metrics.get(field) for field in METRIC_FIELDS), now)
+                 for post_id, metrics in rows.items()])
+
+    def mark_missing(self, platform, post_ids, now=None):
+        """Deleted or unavailable posts stop being refreshed"""
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE social_metrics SET missing = 1, refreshed_at = ? WHERE platform = ? AND post_id = ?",
+                [(now or time.time(), platform, post_id) for post_id in post_ids])
+
+    def get_cursor(self, name):
+        row = self.conn.execute("SELECT since_id FROM social_cursors WHERE name = ?", (name,)).fetchone()
+        return row['since_id'] if row else None
+
+    def set_cursors(self, cursors):
+        """Persist {name: since_id}; cursors only ever move forward"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO social_cursors (name, since_id, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET since_id = excluded.since_id, updated_at = excluded.updated_at "
+                "WHERE CAST(excluded.since_id AS INTEGER) > CAST(social_cursors.since_id AS INTEGER)",
+                [(name, since_id, time.time()) for name, since_id in cursors.items()])
+
+    def add_replies(self, platform, replies):
+        """Bulk insert reply/mention dicts; returns how many were new"""
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO social_replies (platform, reply_id, kind, conversation_id, in_reply_to, "
+                "author_id, author_username, text, created_at, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(platform, reply['id'], reply['kind'], reply.get('conversation_id'), reply.get('in_reply_to'),
+                  reply.get('author_id'), reply.get('author_username'), reply.get('text'),
+                  reply.get('created_at'), time.time()) for reply in replies])
+        return self.conn.total_changes - before
+
+    def recent_replies(self, platform='x', limit=20):
+        return self.conn.execute(
+            "SELECT * FROM social_replies WHERE platform = ? ORDER BY CAST(reply_id AS INTEGER) DESC LIMIT ?",
+            (platform, limit)).fetchall()
+
+    def top_posts(self, platform, limit=10):
+        return self.conn.execute(
+            "SELECT * FROM social_metrics WHERE platform = ? AND missing = 0 AND refreshed_at IS NOT NULL "
+            "ORDER BY COALESCE(impressions, 0) DESC, COALESCE(likes, 0) DESC LIMIT ?",
+            (platform, limit)).fetchall()
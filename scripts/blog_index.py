@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Front-matter index of blog posts across Hugo, Jekyll, Gatsby, Next.js and WordPress exports
+Part of Claude AutoBlog SlashCommands Content Nuke
+Answers "latest post" and cross-link tag queries without opening post bodies
+"""
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import sqlite3
+from datetime import datetime
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "blog-index.db")
+
+DEFAULT_BLOGS = [
+    "/home/jeremy/projects/blog/startaitools",
+    "/home/jeremy/projects/blog/jeremylongshore",
+]
+
+# Where each generator keeps posts, relative to the site root
+POST_DIRS = ['content/posts', 'content/blog', '_posts', 'src/pages/blog', 'posts', 'app/blog', 'pages/blog']
+POST_EXTENSIONS = ('.md', '.markdown', '.mdx')
+
+# Config file -> layout; decides how URLs are derived when front matter has none
+LAYOUT_MARKERS = [
+    ('hugo', ('hugo.toml', 'hugo.yaml', 'config.toml')),
+    ('jekyll', ('_config.yml', '_config.yaml')),
+    ('gatsby', ('gatsby-config.js', 'gatsby-config.ts', 'gatsby-config.mjs')),
+    ('nextjs', ('next.config.js', 'next.config.mjs', 'next.config.ts')),
+]
+
+MAX_FRONT_MATTER_LINES = 200
+JEKYLL_FILENAME = re.compile(r'^(\d{4})-(\d{2})-(\d{2})-(.+)$')
+
+def detect_layout(root):
+    for layout, markers in LAYOUT_MARKERS:
+        if any(os.path.exists(os.path.join(root, marker)) for marker in markers):
+            return layout
+    return 'markdown'
+
+def read_front_matter(path):
+    """(format, raw front matter) read line by line, stopping at the closing delimiter"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        opening = f.readline().strip()
+        if opening not in ('---', '+++'):
+            return None, ''
+        lines = []
+        for _ in range(MAX_FRONT_MATTER_LINES):
+            line = f.readline()
+            if not line or line.strip() == opening:
+                break
+            lines.append(line.rstrip('\n'))
+    return ('toml' if opening == '+++' else 'yaml'), '\n'.join(lines)
+
+def _scalar(value):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    return value
+
+def _inline_list(value):
+    items = value.strip()[1:-1].split(',')
+    return [_scalar(item) for item in items if item.strip()]
+
+def parse_front_matter(kind, raw):
+    """The flat keys we index from YAML or TOML front matter (no YAML/TOML library needed)"""
+    fields, current = {}, None
+    separator = '=' if kind == 'toml' else ':'
+    for line in raw.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if kind == 'toml' and stripped.startswith('['):
+            break    # nested tables hold nothing we index
+        if kind == 'yaml' and stripped.startswith('- ') and current is not None:
+            fields.setdefault(current, [])
+            if isinstance(fields[current], list):
+                fields[current].append(_scalar(stripped[2:]))
+            continue
+        if line[:1].isspace() or separator not in line:
+            continue
+        key, value = line.split(separator, 1)
+        current = key.strip().lower()
+        value = value.strip()
+        if value.startswith('['):
+            fields[current] = _inline_list(value)
+        elif value:
+            fields[current] = _scalar(value)
+    return fields
+
+def parse_date(value):
+    """Front matter dates in the formats the commands write; returns a datetime or None"""
+    if isinstance(value, datetime):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip().replace('Z', '+00:00')
+    value = re.sub(r'\s*([+-]\d{2}):?(\d{2})$', r'\1:\2', value)   # "-0600" / " -06:00" -> "-06:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        match = re.match(r'\d{4}-\d{2}-\d{2}', value)
+        return datetime.fromisoformat(match.group(0)) if match else None
+
+def _as_list(value):
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    if isinstance(value, str) and value:
+        return value.split() if ',' not in value else [item.strip() for item in value.split(',')]
+    return []
+
+def post_url(layout, slug, date, fields, rel_path):
+    """Front matter url/permalink if set, else the generator's default route"""
+    for key in ('url', 'permalink'):
+        if isinstance(fields.get(key), str) and fields[key].startswith('/'):
+            return fields[key]
+    if layout == 'jekyll' and date:
+        return f"/{date:%Y/%m/%d}/{slug}.html"
+    if layout in ('gatsby', 'nextjs'):
+        return f"/blog/{slug}"
+    section = rel_path.split(os.sep)[1] if rel_path.startswith('content' + os.sep) else 'posts'
+    return f"/{section}/{slug}/"
+
+def index_markdown(path, root, layout):
+    """Index record for one markdown post, or None if it has no front matter"""
+    kind, raw = read_front_matter(path)
+    if not kind:
+        return None
+    fields = parse_front_matter(kind, raw)
+    rel_path = os.path.relpath(path, root)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if stem in ('index', '_index', 'page'):
+        stem = os.path.basename(os.path.dirname(path))    # Hugo page bundles, App Router page.mdx
+    filename_date = JEKYLL_FILENAME.match(stem)
+    if filename_date:
+        stem = filename_date.group(4)
+
+    date = parse_date(fields.get('date'))
+    if not date and filename_date:
+        date = datetime(*map(int, filename_date.groups()[:3]))
+    slug = str(fields.get('slug') or stem)
+    return {
+        'title': fields.get('title') or stem.replace('-', ' '),
+        'date': date.isoformat() if date else None,
+        'date_ts': date.timestamp() if date else None,
+        'slug': slug,
+        'url': post_url(layout, slug, date, fields, rel_path),
+        'tags': _as_list(fields.get('tags')),
+        'categories': _as_list(fields.get('categories')),
+        'draft': bool(fields.get('draft')) or fields.get('published') is False,
+        'hash': hashlib.sha256(raw.encode('utf-8')).hexdigest(),
+    }
+
+def index_wordpress_export(path):
+    """{item key: record} for the posts in a WordPress WXR export, streamed with iterparse"""
+    import xml.etree.ElementTree as ET
+
+    wp = '{http://wordpress.org/export/1.2/}'
+    records = {}
+    for _, item in ET.iterparse(path):
+        if item.tag != 'item':
+            continue
+        if item.findtext(f'{wp}post_type') == 'post':
+            date = parse_date(item.findtext(f'{wp}post_date'))
+            slug = item.findtext(f'{wp}post_name') or item.findtext(f'{wp}post_id')
+            terms = item.findall('category')
+            raw = ET.tostring(item)
+            records[f"{path}#{slug}"] = {
+                'title': item.findtext('title') or slug,
+                'date': date.isoformat() if date else None,
+                'date_ts': date.timestamp() if date else None,
+                'slug': slug,
+                'url': item.findtext('link'),
+                'tags': [term.text for term in terms if term.get('domain') == 'post_tag' and term.text],
+                'categories': [term.text for term in terms if term.get('domain') == 'category' and term.text],
+                'draft': item.findtext(f'{wp}status') != 'publish',
+                'hash': hashlib.sha256(raw).hexdigest(),
+            }
+        item.clear()    # post content is the bulk of an export; drop it as we go
+    return records
+
+def find_sources(root):
+    """(path, stat) for every post file and WordPress export under a blog root"""
+    dirs = [os.path.join(root, rel) for rel in POST_DIRS if os.path.isdir(os.path.join(root, rel))]
+    if not dirs and os.path.isdir(root):
+        dirs = [root]    # pointed straight at a posts directory
+    for directory in dirs:
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [name for name in dirnames if not name.startswith('.') and name != 'node_modules']
+            for name in filenames:
+                if name.endswith(POST_EXTENSIONS) and not name.startswith('_index'):
+                    path = os.path.join(dirpath, name)
+                    yield path, os.stat(path)
+    if os.path.isdir(root):
+        for name in os.listdir(root):
+            if name.endswith('.xml') and ('wordpress' in name.lower() or 'export' in name.lower()):
+                path = os.path.join(root, name)
+                yield path, os.stat(path)
+
+class BlogIndex:
+    """Post front matter keyed by file, with the stat data that lets unchanged files be skipped"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                blog TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS posts (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                blog TEXT NOT NULL,
+                layout TEXT NOT NULL,
+                title TEXT,
+                date TEXT,
+                date_ts REAL,
+                slug TEXT,
+                url TEXT,
+                categories TEXT,
+                draft INTEGER NOT NULL DEFAULT 0,
+                hash TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS posts_date ON posts (blog, draft, date_ts);
+            CREATE INDEX IF NOT EXISTS posts_path ON posts (path);
+            CREATE TABLE IF NOT EXISTS post_tags (
+                key TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                PRIMARY KEY (tag, key)
+            );
+        """)
+
+    def _write_posts(self, path, blog, layout, records):
+        existing = {row['key']: row['hash'] for row in
+                    self.conn.execute("SELECT key, hash FROM posts WHERE path = ?", (path,))}
+        for key in set(existing) - set(records):
+            self._delete_post(key)
+        changed = 0
+        for key, record in records.items():
+            if existing.get(key) == record['hash']:
+                continue    # touched but front matter unchanged
+            self._delete_post(key)
+            self.conn.execute(
+                "INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, path, blog, layout, record['title'], record['date'], record['date_ts'], record['slug'],
+                 record['url'], json.dumps(record['categories']), int(record['draft']), record['hash']))
+            self.conn.executemany("INSERT OR IGNORE INTO post_tags VALUES (?, ?)",
+                                  [(key, tag.lower()) for tag in record['tags']])
+            changed += 1
+        return changed
+
+    def _delete_post(self, key):
+        self.conn.execute("DELETE FROM posts WHERE key = ?", (key,))
+        self.conn.execute("DELETE FROM post_tags WHERE key = ?", (key,))
+
+    def update(self, root):
+        """Re-read only files whose mtime or size changed; returns (changed posts, removed files)"""
+        blog = os.path.abspath(os.path.expanduser(root))
+        layout = detect_layout(blog)
+        known = {row['path']: (row['mtime'], row['size']) for row in
+                 self.conn.execute("SELECT path, mtime, size FROM files WHERE blog = ?", (blog,))}
+        seen, changed = set(), 0
+        with self.conn:
+            for path, stat in find_sources(blog):
+                seen.add(path)
+                if known.get(path) == (stat.st_mtime, stat.st_size):
+                    continue
+                try:
+                    if path.endswith('.xml'):
+                        records = index_wordpress_export(path)
+                        file_layout = 'wordpress'
+                    else:
+                        record = index_markdown(path, blog, layout)
+                        records = {path: record} if record else {}
+                        file_layout = layout
+                except Exception as e:
+                    print(f"⚠️  Could not index {path}: {e}")
+                    continue
+                changed += self._write_posts(path, blog, file_layout, records)
+                self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                  (path, blog, stat.st_mtime, stat.st_size))
+            removed = set(known) - seen
+            for path in removed:
+                for row in self.conn.execute("SELECT key FROM posts WHERE path = ?", (path,)).fetchall():
+                    self._delete_post(row['key'])
+                self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        return changed, len(removed)
+
+    def _blog_filter(self, blogs):
+        if not blogs:
+            return '', ()
+        blogs = [os.path.abspath(os.path.expanduser(blog)) for blog in blogs]
+        return f" AND posts.blog IN ({','.join('?' * len(blogs))})", tuple(blogs)
+
+    def latest(self, blogs=None, limit=1, drafts=False):
+        where, params = self._blog_filter(blogs)
+        return self.conn.execute(
+            f"SELECT * FROM posts WHERE date_ts IS NOT NULL{'' if drafts else ' AND draft = 0'}{where} "
+            f"ORDER BY date_ts DESC LIMIT ?", (*params, limit)).fetchall()
+
+    def by_tags(self, tags, blogs=None, limit=10):
+        """Published posts sharing the most tags with the given ones (cross-link candidates)"""
+        tags = [tag.lower() for tag in tags]
+        where, params = self._blog_filter(blogs)
+        return self.conn.execute(
+            f"SELECT posts.*, COUNT(*) AS shared, GROUP_CONCAT(post_tags.tag) AS matched FROM post_tags "
+            f"JOIN posts ON posts.key = post_tags.key "
+            f"WHERE post_tags.tag IN ({','.join('?' * len(tags))}) AND posts.draft = 0{where} "
+            f"GROUP BY posts.key ORDER BY shared DESC, posts.date_ts DESC LIMIT ?",
+            (*tags, *params, limit)).fetchall()
+
+    def tags(self, blogs=None, limit=30):
+        where, params = self._blog_filter(blogs)
+        return self.conn.execute(
+            f"SELECT post_tags.tag, COUNT(*) AS posts FROM post_tags JOIN posts ON posts.key = post_tags.key "
+            f"WHERE posts.draft = 0{where} GROUP BY post_tags.tag ORDER BY posts DESC LIMIT ?",
+            (*params, limit)).fetchall()
+
+def update_all(index, blogs):
+    started = time.time()
+    for blog in blogs:
+        if not os.path.isdir(blog):
+            print(f"⚠️  Blog directory not found: {blog}")
+            continue
+        changed, removed = index.update(blog)
+        if changed or removed:
+            print(f"🔄 {os.path.basename(blog)}: {changed} posts re-indexed, {removed} files removed")
+    return time.time() - started
+
+def _print_post(row):
+    print(f"   {(row['date'] or '')[:10]}  {row['title']}")
+    print(f"      {row['url']}  ({os.path.basename(row['blog'])})")
+
+def main():
+    args = sys.argv[1:]
+    commands = ('update', 'latest', 'tag', 'tags')
+    if not args or args[0] not in commands:
+        print("Usage: python3 blog_index.py <command> [args] [--blog DIR ...]")
+        print("  update          re-index changed posts (only files whose mtime/size changed are opened)")
+        print("  latest [N]      most recent published posts (date for 'commits since the last post')")
+        print("  tag TAG [TAG]   posts sharing these tags, best cross-link candidates first")
+        print("  tags            most used tags")
+        sys.exit(1)
+
+    blogs = [args[i + 1] for i, arg in enumerate(args[:-1]) if arg == '--blog'] or DEFAULT_BLOGS
+    positional = [arg for i, arg in enumerate(args[1:], 1) if not arg.startswith('--') and args[i - 1] != '--blog']
+
+    index = BlogIndex()
+    elapsed = update_all(index, blogs)
+    command = args[0]
+    if command == 'update':
+        print(f"✅ Index up to date in {elapsed * 1000:.0f}ms")
+    elif command == 'latest':
+        rows = index.latest(blogs, limit=int(positional[0]) if positional else 1)
+        if '--json' in args:
+            print(json.dumps([dict(row) for row in rows], indent=2))
+            return
+        for row in rows:
+            _print_post(row)
+    elif command == 'tag':
+        if not positional:
+            print("❌ Usage: python3 blog_index.py tag TAG [TAG ...]")
+            sys.exit(1)
+        for row in index.by_tags(positional, blogs):
+            _print_post(row)
+            print(f"      shared tags: {row['matched']}")
+    else:
+        for row in index.tags(blogs):
+            print(f"   {row['posts']:>4}  {row['tag']}")
+
+if __name__ == "__main__":
+    main()
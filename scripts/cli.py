@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+content-nuke command line
+Part of Claude AutoBlog SlashCommands Content Nuke
+Subcommand modules are imported only when that subcommand runs, keeping startup fast
+"""
+import os
+import sys
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+# Keep this module's imports to the bare minimum: anything imported here is
+# paid by every invocation. See startup_budget.py for the enforced budget.
+SUBCOMMANDS = {
+    # name: (module, help)
+    'post-x': ('post_x_thread', "Post a tweet or a thread file to X"),
+    'post-linkedin': ('post_linkedin', "Post a content file to LinkedIn (or 'test')"),
+    'refresh': ('refresh_tokens', "Refresh API tokens [x|linkedin|check]"),
+    'health': ('health', "Credential health for X and LinkedIn [--refresh|--gate|--json]"),
+    'auth': (None, "Authorize accounts [x-oauth2|x-oauth1|x-oauth1-test]"),
+    'schedule': ('post_scheduler', "Scheduled post queue [add|scan|list|retry|cancel|run]"),
+    'batch': ('content_api', "Post many files in one process, results as JSON [x|linkedin] files..."),
+    'watch': ('thread_watcher', "Auto-post ready files in x-threads/ and x-posts/ (inotify)"),
+    'launch': ('launch', "Pre-stage a thread and fire on a signal or time"),
+    'daemon': ('content_daemon', "Warm local daemon [serve|status]"),
+    'limits': ('rate_limiter', "Shared rate-limit ledger [show|clear]"),
+    'quota': ('x_quota', "Monthly X write quota [report|record <count>]"),
+    'journal': ('posting_journal', "Posting journal [list|show|verify] <id|file|tweet id>"),
+    'rollback': ('rollback_thread', "Delete a partially posted thread <journal id|file|tweet id>"),
+    'metrics': ('metrics_collector', "Engagement metrics [collect|top] [x|linkedin]"),
+    'replies': ('reply_poller', "Replies to our threads and mentions [poll|show]"),
+    'list': ('x_list_builder', "Create or sync an X list from a markdown handle list <file.md>"),
+    'digest': ('git_digest', "Incremental git history digest [repo ...] [--since DATE|--days N] [--json]"),
+    'blog': ('blog_index', "Blog front-matter index [update|latest|tag|tags] [--blog DIR]"),
+    'dedup': ('dedup_index', "Exact-duplicate index [seed|check|stats]"),
+    'similar': ('similarity_index', "Near-duplicate index [seed|query|stats]"),
+}
+
+AUTH_FLOWS = {
+    'x-oauth2': ('oauth2_pkce_setup', 'main'),
+    'x-oauth1': ('oauth1_flow', 'oauth1_flow'),
+    'x-oauth1-test': ('get_oauth1_tokens', 'test_oauth1_tokens'),
+}
+
+def usage():
+    print("Usage: content-nuke <command> [args...]")
+    print()
+    for name, (_, help_text) in SUBCOMMANDS.items():
+        print(f"  {name:<14} {help_text}")
+
+def _import(module_name):
+    from importlib import import_module
+    return import_module(f".{module_name}", __package__)
+
+def run_auth(argv):
+    flow = argv[0] if argv else 'x-oauth2'
+    if flow not in AUTH_FLOWS:
+        print(f"Usage: content-nuke auth [{'|'.join(AUTH_FLOWS)}]")
+        return False
+    module_name, function_name = AUTH_FLOWS[flow]
+    result = getattr(_import(module_name), function_name)()
+    return result is not False
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help', 'help'):
+        usage()
+        sys.exit(0 if argv else 1)
+
+    command, args = argv[0], argv[1:]
+    if command not in SUBCOMMANDS:
+        print(f"❌ Unknown command: {command}")
+        usage()
+        sys.exit(1)
+
+    if command == 'auth':
+        sys.exit(0 if run_auth(args) else 1)
+
+    module = _import(SUBCOMMANDS[command][0])
+    if hasattr(module, 'run'):
+        sys.exit(0 if module.run(args) else 1)
+
+    # Older scripts only have main(), which reads sys.argv
+    sys.argv = [f"content-nuke {command}"] + args
+    module.main()
+
+if __name__ == "__main__":
+    main()
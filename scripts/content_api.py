@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Importable posting API with structured results
+Part of Claude AutoBlog SlashCommands Content Nuke
+Runs many posts in one process over shared connections; nothing to scrape from stdout
+"""
+import os
+import sys
+import json
+import time
+import contextlib
+from dataclasses import dataclass, field, asdict
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+@dataclass
+class TweetResult:
+    """One tweet of a posted thread"""
+    position: int
+    text: str
+    tweet_id: str
+    url: str
+    elapsed: float              # seconds from the start of publishing
+
+@dataclass
+class ThreadResult:
+    """Outcome of posting one thread file"""
+    path: str
+    ok: bool = False
+    skipped: bool = False       # already published, nothing was sent
+    tweets: list = field(default_factory=list)
+    error: str = None
+    status_code: int = None     # HTTP status of the failed request, if it got a response
+    retry_after: float = None   # seconds until the API accepts posts again, if known
+    journal_id: int = None      # posting journal entry of a partially posted thread
+    elapsed: float = 0.0
+    rate_limits: dict = field(default_factory=dict)
+
+    @property
+    def url(self):
+        return self.tweets[0].url if self.tweets else None
+
+    @property
+    def partial(self):
+        """Some tweets went out but the thread did not finish"""
+        return bool(self.tweets) and not self.ok
+
+@dataclass
+class LinkedInResult:
+    """Outcome of posting one LinkedIn content file"""
+    path: str
+    ok: bool = False
+    skipped: bool = False
+    post_id: str = None
+    url: str = None
+    error: str = None
+    status_code: int = None
+    retry_after: float = None
+    elapsed: float = 0.0
+
+def _set_error(result, error):
+    result.error = error.message
+    result.status_code = error.status_code
+    result.retry_after = error.retry_after
+
+def post_thread(path, force=False, delay=2):
+    """Post one thread file; returns a ThreadResult"""
+    from . import post_x_thread
+    from .post_common import PostError
+
+    result = ThreadResult(path=path)
+    started = time.time()
+
+    def on_posted(i, tweet_id):
+        result.tweets.append(TweetResult(
+            position=i + 1,
+            text=prepared['tweets'][i],
+            tweet_id=tweet_id,
+            url=f"https://twitter.com/i/web/status/{tweet_id}",
+            elapsed=time.time() - started,
+        ))
+
+    try:
+        prepared, _ = post_x_thread.prepare_thread(path, force=force)
+        if prepared is None:
+            result.ok = result.skipped = True
+        else:
+            started = time.time()
+            post_x_thread.publish_thread(prepared, delay=delay, on_posted=on_posted)
+            result.ok = True
+    except PostError as e:
+        _set_error(result, e)
+        result.journal_id = e.thread_id
+    except Exception as e:
+        result.error = str(e)
+
+    result.elapsed = time.time() - started
+    result.rate_limits = dict(post_x_thread.rate_limits)
+    return result
+
+def post_threads(paths, force=False, delay=2, stop_on_error=False):
+    """Post several thread files in order over one set of connections; returns ThreadResults"""
+    from . import post_x_thread
+    post_x_thread.warm_up()
+
+    results = []
+    for path in paths:
+        result = post_thread(path, force=force, delay=delay)
+        results.append(result)
+        if stop_on_error and not result.ok:
+            break
+    return results
+
+def post_linkedin(path, force=False):
+    """Post one LinkedIn content file; returns a LinkedInResult"""
+    from . import post_linkedin as linkedin
+    from .post_common import PostError
+
+    result = LinkedInResult(path=path)
+    started = time.time()
+
+    try:
+        prepared, _ = linkedin.prepare_linkedin_content(path, force=force)
+        if prepared is None:
+            result.ok = result.skipped = True
+        else:
+            result.post_id = linkedin.publish_linkedin_content(prepared)
+            result.url = f"https://www.linkedin.com/feed/update/urn:li:share:{result.post_id}"
+            result.ok = True
+    except PostError as e:
+        _set_error(result, e)
+    except Exception as e:
+        result.error = str(e)
+
+    result.elapsed = time.time() - started
+    return result
+
+def post_many_linkedin(paths, force=False, stop_on_error=False):
+    """Post several LinkedIn content files over one connection; returns LinkedInResults"""
+    from . import post_linkedin as linkedin
+    linkedin.warm_up()
+
+    results = []
+    for path in paths:
+        result = post_linkedin(path, force=force)
+        results.append(result)
+        if stop_on_error and not result.ok:
+            break
+    return results
+
+def to_json(results):
+    """Serialize results for other tooling"""
+    rows = []
+    for result in results:
+        row = asdict(result)
+        if isinstance(result, ThreadResult):
+            row['url'] = result.url
+        rows.append(row)
+    return json.dumps(rows, indent=2)
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ('x', 'linkedin'):
+        print("Usage: python3 content_api.py [x|linkedin] file.txt [more files...] [--force]")
+        print("Posts every file in one process and prints the results as JSON")
+        sys.exit(1)
+
+    force = '--force' in sys.argv
+    paths = [arg for arg in sys.argv[2:] if arg != '--force']
+    # Progress goes to stderr so stdout carries only the JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        if sys.argv[1] == 'x':
+            results = post_threads(paths, force=force)
+        else:
+            results = post_many_linkedin(paths, force=force)
+
+    print(to_json(results))
+    sys.exit(0 if all(result.ok for result in results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Thin client for the Content Nuke daemon
+Part of Claude AutoBlog SlashCommands Content Nuke
+Sends post/refresh/status requests over a Unix socket, or runs in-process if no daemon
+"""
+import os
+import sys
+import json
+import socket
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+SOCKET_PATH = os.path.join(os.path.expanduser("~/.content-nuke"), "daemon.sock")
+
+def send(command, argv):
+    """Run a command on the daemon, echoing its output; returns True/False, or None if unreachable"""
+    if '-' in argv:
+        return None  # only this process can read our stdin
+
+    # The daemon has its own working directory: send paths it can open
+    argv = [os.path.abspath(arg) if os.path.exists(arg) else arg for arg in argv]
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(SOCKET_PATH)
+    except OSError:
+        sock.close()
+        return None
+
+    with sock, sock.makefile('rb') as responses:
+        sock.sendall((json.dumps({'command': command, 'argv': argv}) + '\n').encode('utf-8'))
+        for line in responses:
+            message = json.loads(line)
+            if 'out' in message:
+                sys.stdout.write(message['out'])
+                sys.stdout.flush()
+            if 'status' in message:
+                print(json.dumps(message['status'], indent=2))
+            if 'ok' in message:
+                return message['ok']
+    print("❌ Daemon closed the connection unexpectedly")
+    return False
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 content_client.py [post-x|post-linkedin|refresh|status] [args...]")
+        print("Uses the warm daemon (python3 content_daemon.py serve) when it is running")
+        sys.exit(1)
+
+    command, argv = sys.argv[1], sys.argv[2:]
+    ok = send(command, argv)
+
+    if ok is None:
+        if command == 'status':
+            print("⚪ Daemon not running")
+            sys.exit(1)
+        # No daemon: same code path, just in this process
+        from .content_daemon import run_command
+        ok = run_command(command, argv)
+
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
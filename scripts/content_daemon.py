@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Warm local Content Nuke service on a Unix domain socket
+Part of Claude AutoBlog SlashCommands Content Nuke
+Holds sessions, credentials and rate-limit state so slash commands skip cold starts
+"""
+import os
+import sys
+import json
+import time
+import socket
+import signal
+import threading
+import socketserver
+import contextlib
+from importlib import import_module
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+SOCKET_PATH = os.path.join(STATE_DIR, "daemon.sock")
+
+# Command name -> module whose run(argv) implements it. Modules are only
+# imported when a command runs, so the thin client stays cheap to start.
+COMMANDS = {
+    'post-x': 'post_x_thread',
+    'post-linkedin': 'post_linkedin',
+    'refresh': 'refresh_tokens',
+}
+
+def run_command(command, argv):
+    """Run a command in this process; returns True on success"""
+    if command not in COMMANDS:
+        print(f"❌ Unknown command: {command} (expected {', '.join(COMMANDS)} or status)")
+        return False
+    module = import_module(f".{COMMANDS[command]}", __package__)
+    return module.run(argv)
+
+class _RoutedStdout:
+    """sys.stdout for the daemon: a request thread's prints go to its own client, everything else to the log"""
+
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+
+    def _target(self):
+        return getattr(self.local, 'writer', None) or self.default
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    @contextlib.contextmanager
+    def to(self, writer):
+        """Route this thread's output to writer for the duration of a request"""
+        self.local.writer = writer
+        try:
+            yield
+        finally:
+            self.local.writer = None
+
+    def __getattr__(self, name):
+        return getattr(self.default, name)
+
+class _SocketWriter:
+    """stdout replacement that streams printed output to the client"""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text):
+        if text:
+            self.wfile.write((json.dumps({'out': text}) + '\n').encode('utf-8'))
+        return len(text)
+
+    def flush(self):
+        self.wfile.flush()
+
+class ContentDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path):
+        # Create the socket owner-only: a chmod after bind() leaves a window where anyone can connect
+        umask = os.umask(0o077)
+        try:
+            super().__init__(path, RequestHandler)
+        finally:
+            os.umask(umask)
+        self.started_at = time.time()
+        self.served = 0
+        # Posting from one account is serialized; output is routed per request thread
+        self.command_lock = threading.Lock()
+        self.stdout = _RoutedStdout(sys.stdout)
+        # Every request gets a new handler thread: one set of rate-limit, quota and journal
+        # stores for the whole server (used under command_lock) instead of one per thread
+        from . import post_x_thread
+        post_x_thread.share_ledgers()
+
+    def status(self):
+        from . import post_x_thread
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(time.time() - self.started_at),
+            'requests_served': self.served,
+            'x_auth_loaded': bool(post_x_thread._auth_cache),
+            'rate_limits': post_x_thread.rate_limits,
+        }
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        command = request.get('command')
+        self.server.served += 1
+
+        if command == 'status':
+            self._send({'status': self.server.status(), 'ok': True})
+            return
+
+        argv = request.get('argv', [])
+        if '-' in argv:
+            # The daemon's stdin is not the client's
+            self._send({'out': "❌ stdin ('-') can't be read by the daemon; run the command in-process\n", 'ok': False})
+            return
+
+        with self.server.command_lock:
+            try:
+                with self.server.stdout.to(_SocketWriter(self.wfile)):
+                    ok = run_command(command, argv)
+            except Exception as e:
+                self._send({'out': f"❌ {command} failed in daemon: {e}\n"})
+                ok = False
+        self._send({'ok': bool(ok)})
+
+    def _send(self, message):
+        self.wfile.write((json.dumps(message) + '\n').encode('utf-8'))
+        self.wfile.flush()
+
+def is_running():
+    """True if a daemon is accepting connections on the socket"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(SOCKET_PATH)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+def serve():
+    if is_running():
+        print(f"ℹ️  Daemon already running on {SOCKET_PATH}")
+        return False
+    os.makedirs(STATE_DIR, exist_ok=True)
+    if os.path.exists(SOCKET_PATH):
+        os.remove(SOCKET_PATH)  # stale socket from a crashed daemon
+
+    # Pay the import, credential and connection costs once
+    print("🔥 Warming up (imports, credentials, connections)...")
+    from . import post_x_thread
+    from . import post_linkedin
+    from . import refresh_tokens  # noqa: F401
+    post_x_thread.warm_up()
+    post_linkedin.warm_up()
+
+    # The daemon outlives any single OAuth2 token
+    from . import token_keeper
+    token_keeper.start()
+
+    server = ContentDaemon(SOCKET_PATH)
+    # Installed once: redirect_stdout would swap the process-wide stdout under
+    # concurrent requests and the token keeper thread
+    sys.stdout = server.stdout
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown).start())
+    print(f"🟢 Content Nuke daemon listening on {SOCKET_PATH} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sys.stdout = server.stdout.default
+        server.server_close()
+        if os.path.exists(SOCKET_PATH):
+            os.remove(SOCKET_PATH)
+        print("👋 Daemon stopped")
+    return True
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] not in ('serve', 'status'):
+        print("Usage: python3 content_daemon.py [serve|status]")
+        sys.exit(1)
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'status':
+        print("🟢 running" if is_running() else "⚪ not running")
+        sys.exit(0)
+
+    sys.exit(0 if serve() else 1)
+
+if __name__ == "__main__":
+    main()
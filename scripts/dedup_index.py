@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Content-hash dedup index for published X and LinkedIn posts
+Part of Claude AutoBlog SlashCommands Content Nuke
+Lets posting scripts skip already-published content before any network call
+"""
+import os
+import re
+import sys
+import json
+import time
+import fcntl
+import hashlib
+import tempfile
+import contextlib
+import unicodedata
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+INDEX_PATH = os.path.join(STATE_DIR, "posted-index.json")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SEED_DIRS = [os.path.join(REPO_ROOT, 'x-posts')]
+
+def normalize_text(text):
+    """Normalize post text so trivial edits hash the same"""
+    text = unicodedata.normalize('NFKC', text)
+    text = text.strip()
+    # Drop a leading "3/7" thread counter, it changes when threads are re-split
+    text = re.sub(r'^\d+/\d+\s+', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.casefold()
+
+def content_hash(text):
+    """SHA-256 of the normalized text"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+class DedupIndex:
+    """Persistent hash -> publish record map stored as JSON"""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.entries = {}
+        self.added = set()   # digests added since the last save; only these are merged into the file
+        self.load()
+
+    def load(self):
+        """Load the index from disk (empty if missing or unreadable; save() then moves it aside)"""
+        self.unreadable = False
+        if not os.path.exists(self.path):
+            self.entries = {}
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f).get('entries', {})
+        except (ValueError, OSError) as e:
+            print(f"⚠️  Could not read dedup index {self.path}: {e}")
+            self.entries = {}
+            self.unreadable = True
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Exclusive lock around read-modify-write so concurrent saves and forgets don't lose each other"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(f"{self.path}.lock", 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def save(self):
+        """Atomically write the index, merging our new entries into what other runs wrote.
+
+        Only entries added since the last save are written back: an entry we merely
+        loaded may have been forgotten by another process since, and must stay gone.
+        """
+        with self._locked():
+            new = {digest: self.entries[digest] for digest in self.added if digest in self.entries}
+            self.load()
+            if self.unreadable:
+                self._set_aside()
+            self.entries.update(new)
+            self._write()
+            self.added.clear()
+
+    def _set_aside(self):
+        """Keep an unreadable index for recovery instead of replacing the whole history with our entries"""
+        aside = f"{self.path}.corrupt-{int(time.time())}"
+        os.replace(self.path, aside)
+        print(f"⚠️  Moved the unreadable dedup index to {aside}")
+        print("   Rebuild it from posting records with: python3 scripts/dedup_index.py seed")
+
+    def _write(self):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix='.posted-index-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': 1, 'entries': self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def forget(self, post_ids):
+        """Drop entries for deleted posts so they can be published again; returns the count"""
+        post_ids = set(post_ids)
+        with self._locked():
+            self.load()  # start from disk so entries other runs added since are kept
+            removed = [digest for digest, entry in self.entries.items() if entry.get('post_id') in post_ids]
+            for digest in removed:
+                del self.entries[digest]
+                self.added.discard(digest)
+            if removed:
+                self._write()
+        return len(removed)
+
+    def lookup(self, text):
+        """Return the publish record for text, or None if never posted"""
+        if not normalize_text(text):
+            return None  # media-only tweets have nothing to compare
+        return self.entries.get(content_hash(text))
+
+    def is_published(self, text):
+        return self.lookup(text) is not None
+
+    def add(self, text, platform, post_id=None, url=None, source=None, posted_at=None):
+        """Record text as published (call save() to persist)"""
+        if not normalize_text(text):
+            return None
+        digest = content_hash(text)
+        self.entries[digest] = {
+            'platform': platform,
+            'post_id': post_id,
+            'url': url,
+            'source': source,
+            'posted_at': posted_at or datetime.now().isoformat(timespec='seconds'),
+            'preview': normalize_text(text)[:80],
+        }
+        self.added.add(digest)
+        return digest
+
+    def record(self, text, platform, post_id=None, url=None, source=None):
+        """Add a single entry and persist immediately"""
+        self.add(text, platform, post_id=post_id, url=url, source=source)
+        self.save()
+
+    def split_published(self, texts):
+        """Partition texts into (unpublished, published) index lists"""
+        unpublished, published = [], []
+        for i, text in enumerate(texts):
+            (published if self.is_published(text) else unpublished).append(i)
+        return unpublished, published
+
+    def __len__(self):
+        return len(self.entries)
+
+def parse_posted_record(content):
+    """Extract (platform, text, post_id, url) from an x-posts/ record, or None"""
+    # /post-x records: "POSTED TEXT:" ... "CHARACTER COUNT:" ... "TWEET ID:"
+    match = re.search(r'POSTED TEXT:\s*\n(.*?)\n\s*CHARACTER COUNT:', content, re.DOTALL)
+    if match:
+        tweet_id = re.search(r'TWEET ID:\s*(\d+)', content)
+        url = re.search(r'TWEET URL:\s*(\S+)', content)
+        return ('x', match.group(1).strip(),
+                tweet_id.group(1) if tweet_id else None,
+                url.group(1) if url else None)
+
+    # post_linkedin.py records: "POSTED TO LINKEDIN:" ... "Content:"
+    if content.startswith('POSTED TO LINKEDIN:'):
+        post_id = re.search(r'Post ID:\s*(\S+)', content)
+        text = content.split('Content:\n', 1)[-1].strip()
+        return ('linkedin', text, post_id.group(1) if post_id else None, None)
+
+    return None
+
+def seed_from_dirs(index, dirs=None):
+    """Seed the index from existing posting records"""
+    added = 0
+    for directory in dirs or DEFAULT_SEED_DIRS:
+        if not os.path.isdir(directory):
+            print(f"⚠️  Skipping missing directory: {directory}")
+            continue
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not name.endswith('.txt') or not os.path.isfile(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                record = parse_posted_record(f.read())
+            if not record:
+                continue
+            platform, text, post_id, url = record
+            if not index.is_published(text):
+                index.add(text, platform, post_id=post_id, url=url, source=path)
+                added += 1
+                print(f"➕ {platform}: {name}")
+    index.save()
+    return added
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Seed from records: python3 dedup_index.py seed [dir ...]")
+        print("  Check text/file:   python3 dedup_index.py check 'text' | /path/to/thread.txt")
+        print("  Show stats:        python3 dedup_index.py stats")
+        sys.exit(1)
+
+    index = DedupIndex()
+    command = sys.argv[1]
+
+    if command == "seed":
+        added = seed_from_dirs(index, sys.argv[2:])
+        print(f"✅ Seeded {added} posts ({len(index)} total in {index.path})")
+    elif command == "check" and len(sys.argv) > 2:
+        target = sys.argv[2]
+        if os.path.exists(target):
+            from .post_x_thread import load_thread_tweets
+            texts = load_thread_tweets(target)
+        else:
+            texts = [target]
+        duplicates = 0
+        for i, text in enumerate(texts, 1):
+            record = index.lookup(text)
+            if record:
+                duplicates += 1
+                print(f"🔁 {i}: already posted to {record['platform']} ({record.get('url') or record.get('post_id')})")
+            else:
+                print(f"🆕 {i}: not published")
+        sys.exit(1 if duplicates else 0)
+    elif command == "stats":
+        platforms = {}
+        for entry in index.entries.values():
+            platforms[entry['platform']] = platforms.get(entry['platform'], 0) + 1
+        print(f"📊 {len(index)} published posts in {index.path}")
+        for platform, count in sorted(platforms.items()):
+            print(f"   {platform}: {count}")
+    else:
+        print("Usage: python3 dedup_index.py [seed|check|stats]")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Incremental git-history digest for the content commands
+Part of Claude AutoBlog SlashCommands Content Nuke
+Streams git log --numstat once per commit, then answers "what changed since X" from a local store
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import subprocess
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "git-digest.db")
+
+DEFAULT_DAYS = 14            # the commands' fallback when there is no previous post
+SCAN_WORKERS = 4
+WRITE_BATCH = 1000           # commits per transaction on the first, full scan
+
+RECORD_SEP = '\x1e'
+FIELD_SEP = '\x1f'
+LOG_FORMAT = f"{RECORD_SEP}%H{FIELD_SEP}%ct{FIELD_SEP}%an{FIELD_SEP}%s"
+
+class LogFailed(Exception):
+    """git log exited with an error, so the commits read may be incomplete"""
+
+class DigestStore:
+    """Commits, per-file churn and per-repo cursors in SQLite"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS commits (
+                repo TEXT NOT NULL,
+                sha TEXT NOT NULL,
+                committed_at INTEGER NOT NULL,
+                author TEXT,
+                subject TEXT,
+                files INTEGER NOT NULL,
+                insertions INTEGER NOT NULL,
+                deletions INTEGER NOT NULL,
+                PRIMARY KEY (repo, sha)
+            );
+            CREATE INDEX IF NOT EXISTS commits_time ON commits (repo, committed_at);
+            CREATE TABLE IF NOT EXISTS commit_files (
+                repo TEXT NOT NULL,
+                sha TEXT NOT NULL,
+                path TEXT NOT NULL,
+                insertions INTEGER,
+                deletions INTEGER,
+                PRIMARY KEY (repo, sha, path)
+            );
+            CREATE TABLE IF NOT EXISTS cursors (
+                repo TEXT PRIMARY KEY,
+                head TEXT NOT NULL,
+                scanned_at REAL NOT NULL
+            );
+        """)
+
+    def cursor(self, repo):
+        row = self.conn.execute("SELECT head FROM cursors WHERE repo = ?", (repo,)).fetchone()
+        return row['head'] if row else None
+
+    def add_commits(self, repo, commits):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(repo, c['sha'], c['committed_at'], c['author'], c['subject'], len(c['files']),
+                  sum(added or 0 for _, added, _ in c['files']),
+                  sum(deleted or 0 for _, _, deleted in c['files'])) for c in commits])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO commit_files VALUES (?, ?, ?, ?, ?)",
+                [(repo, c['sha'], path, added, deleted) for c in commits for path, added, deleted in c['files']])
+
+    def set_cursor(self, repo, head):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)", (repo, head, time.time()))
+
+    def close(self):
+        self.conn.close()
+
+    def forget_repo(self, repo):
+        """History was rewritten: drop everything and rescan"""
+        with self.conn:
+            for table in ('commits', 'commit_files', 'cursors'):
+                self.conn.execute(f"DELETE FROM {table} WHERE repo = ?", (repo,))
+
+def _git(repo, *args):
+    result = subprocess.run(['git', '-C', repo, *args], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def iter_log(repo, revision_range):
+    """Stream commits from git log --numstat without holding the whole log in memory"""
+    process = subprocess.Popen(
+        ['git', '-C', repo, 'log', '--no-merges', '--numstat', '--no-renames', f'--format={LOG_FORMAT}', revision_range],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors='replace')
+    commit = None
+    for line in process.stdout:
+        line = line.rstrip('\n')
+        if line.startswith(RECORD_SEP):
+            if commit:
+                yield commit
+            sha, committed_at, author, subject = line[1:].split(FIELD_SEP, 3)
+            commit = {'sha': sha, 'committed_at': int(committed_at), 'author': author, 'subject': subject, 'files': []}
+        elif line and commit:
+            added, deleted, path = line.split('\t', 2)
+            # Binary files show "-" instead of line counts
+            commit['files'].append((path, None if added == '-' else int(added), None if deleted == '-' else int(deleted)))
+    if commit:
+        yield commit
+    # git writes little to stderr, so reading it only after stdout can't block
+    error = process.stderr.read().strip()
+    if process.wait() != 0:
+        raise LogFailed(error.splitlines()[-1] if error else f"git log exited with {process.returncode}")
+
+def scan_repo(repo, path=DB_PATH):
+    """Process commits added since the last scan; returns (repo, new commit count) or (repo, error).
+
+    The cursor only moves once git log has finished cleanly, so a failed scan is retried in full.
+    """
+    repo = os.path.abspath(os.path.expanduser(repo))
+    head = _git(repo, 'rev-parse', 'HEAD')
+    if not head:
+        return repo, "not a git repository (or no commits)"
+
+    store = DigestStore(path)    # one connection per worker thread
+    try:
+        cursor = store.cursor(repo)
+        if cursor == head:
+            return repo, 0
+        if cursor and _git(repo, 'merge-base', '--is-ancestor', cursor, head) is None:
+            print(f"🔄 {repo}: history rewritten since the last scan, rescanning")
+            store.forget_repo(repo)
+            cursor = None
+
+        count, batch = 0, []
+        try:
+            for commit in iter_log(repo, f"{cursor}..{head}" if cursor else head):
+                batch.append(commit)
+                if len(batch) >= WRITE_BATCH:
+                    store.add_commits(repo, batch)
+                    count += len(batch)
+                    batch = []
+        except LogFailed as e:
+            # Commits already written are kept; rows are keyed by sha, so the rescan just overwrites them
+            return repo, f"git log failed, cursor left at {cursor[:8] if cursor else 'start'}: {e}"
+        store.add_commits(repo, batch)
+        store.set_cursor(repo, head)
+        return repo, count + len(batch)
+    finally:
+        store.close()
+
+def scan(repos, workers=SCAN_WORKERS, path=DB_PATH):
+    """Scan repos in parallel (git does the work, so threads overlap well)"""
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(repos)))) as pool:
+        return dict(pool.map(lambda repo: scan_repo(repo, path), repos))
+
+def digest(repos, since, store=None, top=10):
+    """Commits, distinct files and churn since a timestamp, per repo and overall"""
+    store = store or DigestStore()
+    repos = [os.path.abspath(os.path.expanduser(repo)) for repo in repos]
+    marks = ','.join('?' * len(repos))
+    since = int(since)
+
+    totals = store.conn.execute(
+        f"SELECT COUNT(*) AS commits, COALESCE(SUM(insertions), 0) AS insertions, "
+        f"COALESCE(SUM(deletions), 0) AS deletions FROM commits WHERE repo IN ({marks}) AND committed_at >= ?",
+        (*repos, since)).fetchone()
+    files = store.conn.execute(
+        f"SELECT f.repo, f.path, COUNT(*) AS commits, COALESCE(SUM(f.insertions), 0) + COALESCE(SUM(f.deletions), 0) AS churn "
+        f"FROM commit_files f JOIN commits c ON c.repo = f.repo AND c.sha = f.sha "
+        f"WHERE c.repo IN ({marks}) AND c.committed_at >= ? GROUP BY f.repo, f.path ORDER BY churn DESC",
+        (*repos, since)).fetchall()
+    per_repo = store.conn.execute(
+        f"SELECT repo, COUNT(*) AS commits, SUM(insertions) AS insertions, SUM(deletions) AS deletions "
+        f"FROM commits WHERE repo IN ({marks}) AND committed_at >= ? GROUP BY repo ORDER BY commits DESC",
+        (*repos, since)).fetchall()
+    recent = store.conn.execute(
+        f"SELECT repo, sha, committed_at, subject FROM commits WHERE repo IN ({marks}) AND committed_at >= ? "
+        f"ORDER BY committed_at DESC LIMIT ?", (*repos, since, top * 3)).fetchall()
+
+    return {
+        'since': datetime.fromtimestamp(since).isoformat(timespec='seconds'),
+        'commits': totals['commits'],
+        'files': len(files),
+        'insertions': totals['insertions'],
+        'deletions': totals['deletions'],
+        'repos': [dict(row) for row in per_repo],
+        'top_files': [dict(row) for row in files[:top]],
+        'recent': [{'repo': os.path.basename(row['repo']), 'sha': row['sha'][:8],
+                    'date': datetime.fromtimestamp(row['committed_at']).strftime('%Y-%m-%d'),
+                    'subject': row['subject']} for row in recent],
+    }
+
+def print_digest(summary):
+    print(f"📜 Since {summary['since']}: {summary['commits']} commits, {summary['files']} files, "
+          f"+{summary['insertions']} -{summary['deletions']}")
+    for repo in summary['repos']:
+        print(f"   {os.path.basename(repo['repo'])}: {repo['commits']} commits, +{repo['insertions']} -{repo['deletions']}")
+    if summary['top_files']:
+        print("🔥 Most changed files:")
+        for entry in summary['top_files']:
+            print(f"   {entry['churn']:>6}  {os.path.basename(entry['repo'])}/{entry['path']} ({entry['commits']} commits)")
+    if summary['recent']:
+        print("📝 Recent commits:")
+        for commit in summary['recent']:
+            print(f"   {commit['date']} {commit['repo']} {commit['sha']} {commit['subject']}")
+
+def parse_since(args):
+    """(timestamp, where it came from) for --since YYYY-MM-DD, --since-last-post or --days N.
+
+    Defaults to the last 14 days. Raises ValueError for a bad value or for --since with --since-last-post.
+    """
+    fallback = ''
+    if '--since-last-post' in args:
+        if '--since' in args:
+            raise ValueError("--since and --since-last-post can't be combined, pick one")
+        from .blog_index import BlogIndex, DEFAULT_BLOGS, update_all
+        index = BlogIndex()
+        update_all(index, DEFAULT_BLOGS)
+        latest = index.latest(DEFAULT_BLOGS)
+        if latest:
+            return latest[0]['date_ts'], f"last post \"{latest[0]['title']}\" ({os.path.basename(latest[0]['blog'])})"
+        fallback = ', no published post found for --since-last-post'
+    if '--since' in args and args.index('--since') + 1 < len(args):
+        try:
+            return datetime.fromisoformat(args[args.index('--since') + 1]).timestamp(), "--since"
+        except ValueError as e:
+            raise ValueError(f"Invalid --since: {e}")
+    if '--days' in args and args.index('--days') + 1 < len(args):
+        try:
+            days = int(args[args.index('--days') + 1])
+        except ValueError as e:
+            raise ValueError(f"Invalid --days: {e}")
+        source = f"--days {days}"
+    else:
+        days, source = DEFAULT_DAYS, f"default of {DEFAULT_DAYS} days"
+    return (datetime.now() - timedelta(days=days)).timestamp(), source + fallback
+
+def main():
+    args = sys.argv[1:]
+    if '--help' in args or '-h' in args:
+        print("Usage: python3 git_digest.py [repo ...] [--since YYYY-MM-DD | --since-last-post | --days N] [--json]")
+        print("Scans only commits added since the last run, then summarizes the period (default: last 14 days)")
+        sys.exit(0)
+
+    values = {args[i + 1] for i, arg in enumerate(args[:-1]) if arg in ('--since', '--days')}
+    repos = [arg for arg in args if not arg.startswith('--') and arg not in values] or [os.getcwd()]
+    try:
+        since, since_source = parse_since(args)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    if '--json' not in args:
+        print(f"📅 Since {datetime.fromtimestamp(since):%Y-%m-%d %H:%M}: {since_source}")
+
+    started = time.time()
+    results = scan(repos)
+    for repo, outcome in results.items():
+        if isinstance(outcome, str):
+            print(f"⚠️  {repo}: {outcome}")
+        elif '--json' not in args:
+            print(f"🔍 {os.path.basename(repo)}: {outcome} new commits indexed")
+
+    scanned = [repo for repo, outcome in results.items() if not isinstance(outcome, str)]
+    if not scanned:
+        sys.exit(1)
+    summary = digest(scanned, since)
+    summary['since_source'] = since_source
+    summary['scan_seconds'] = round(time.time() - started, 2)
+    if '--json' in args:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_digest(summary)
+
+if __name__ == "__main__":
+    main()
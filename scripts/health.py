@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Credential health check for X (OAuth 1.0a and OAuth2) and LinkedIn
+Part of Claude AutoBlog SlashCommands Content Nuke
+Checks all platforms concurrently and caches the results so preflight gating is free
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+CACHE_PATH = os.path.join(STATE_DIR, "health.json")
+
+CACHE_TTL_SECONDS = 600
+FAILURE_TTL_SECONDS = 60     # re-check failures sooner (network blips, fresh refreshes)
+REQUEST_TIMEOUT = 10
+
+# Credentials each check depends on; a change to any of them invalidates its cached result
+CHECK_KEYS = {
+    'x-oauth1': ('X_API_KEY', 'X_API_SECRET', 'X_ACCESS_TOKEN', 'X_ACCESS_SECRET'),
+    'x-oauth2': ('X_OAUTH2_ACCESS_TOKEN', 'X_OAUTH2_EXPIRES_AT', 'X_OAUTH2_ISSUED_AT'),
+    'linkedin': ('LINKEDIN_ACCESS_TOKEN', 'LINKEDIN_EXPIRES_AT', 'LINKEDIN_ISSUED_AT'),
+}
+
+def load_credentials():
+    from .refresh_tokens import load_credentials_from_waygate
+    creds = load_credentials_from_waygate()
+    for keys in CHECK_KEYS.values():
+        for key in keys:
+            if not creds.get(key) and os.environ.get(key):
+                creds[key] = os.environ[key]
+    return creds
+
+def credentials_fingerprint(creds, name):
+    values = '\0'.join(creds.get(key, '') for key in CHECK_KEYS[name])
+    return hashlib.sha256(values.encode('utf-8')).hexdigest()[:16]
+
+def _result(status, detail='', user=None, expires_at=None):
+    return {'status': status, 'detail': detail, 'user': user, 'expires_at': expires_at}
+
+def check_x_oauth1(creds):
+    keys = CHECK_KEYS['x-oauth1']
+    if not all(creds.get(key) for key in keys):
+        return _result('missing', "X_API_KEY/X_API_SECRET/X_ACCESS_TOKEN/X_ACCESS_SECRET not set")
+    import requests
+    from requests_oauthlib import OAuth1
+    auth = OAuth1(*(creds[key] for key in keys), signature_method='HMAC-SHA1', signature_type='AUTH_HEADER')
+    response = requests.get("https://api.twitter.com/2/users/me", auth=auth, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 200:
+        return _result('ok', "permanent tokens", user=f"@{response.json()['data']['username']}")
+    return _result('error', f"{response.status_code}: {response.text[:200]}")
+
+def check_x_oauth2(creds):
+    token = creds.get('X_OAUTH2_ACCESS_TOKEN')
+    if not token:
+        return _result('missing', "X_OAUTH2_ACCESS_TOKEN not set")
+    expires_at = float(creds['X_OAUTH2_EXPIRES_AT']) if creds.get('X_OAUTH2_EXPIRES_AT') else None
+    if expires_at and expires_at <= time.time():
+        # No network call needed to know this one
+        return _result('expired', "run: content-nuke refresh x", expires_at=expires_at)
+    import requests
+    response = requests.get("https://api.twitter.com/2/users/me",
+                            headers={"Authorization": f"Bearer {token}"}, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 200:
+        return _result('ok', '', user=f"@{response.json()['data']['username']}", expires_at=expires_at)
+    if response.status_code == 401:
+        return _result('expired', "run: content-nuke refresh x", expires_at=expires_at)
+    return _result('error', f"{response.status_code}: {response.text[:200]}", expires_at=expires_at)
+
+def check_linkedin(creds):
+    token = creds.get('LINKEDIN_ACCESS_TOKEN')
+    if not token:
+        return _result('missing', "LINKEDIN_ACCESS_TOKEN not set")
+    expires_at = float(creds['LINKEDIN_EXPIRES_AT']) if creds.get('LINKEDIN_EXPIRES_AT') else None
+    if expires_at and expires_at <= time.time():
+        return _result('expired', "run: content-nuke refresh linkedin", expires_at=expires_at)
+    import requests
+    response = requests.get("https://api.linkedin.com/v2/userinfo",
+                            headers={"Authorization": f"Bearer {token}"}, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 200:
+        return _result('ok', '', user=response.json().get('name'), expires_at=expires_at)
+    if response.status_code == 401:
+        return _result('expired', "run: content-nuke refresh linkedin", expires_at=expires_at)
+    return _result('error', f"{response.status_code}: {response.text[:200]}", expires_at=expires_at)
+
+CHECKS = {
+    'x-oauth1': check_x_oauth1,
+    'x-oauth2': check_x_oauth2,
+    'linkedin': check_linkedin,
+}
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
+
+def run_check(name, creds):
+    try:
+        result = CHECKS[name](creds)
+    except Exception as e:
+        result = _result('error', str(e))
+    # Token age, where the refresh recorded when it was issued
+    issued_key = next((key for key in CHECK_KEYS[name] if key.endswith('_ISSUED_AT')), None)
+    result['issued_at'] = float(creds[issued_key]) if issued_key and creds.get(issued_key) else None
+    result['checked_at'] = time.time()
+    result['fingerprint'] = credentials_fingerprint(creds, name)
+    return result
+
+def check_health(ttl=CACHE_TTL_SECONDS, names=None):
+    """Results for every platform: fresh cache entries are reused, the rest are checked concurrently"""
+    creds = load_credentials()
+    cache = load_cache()
+    now = time.time()
+
+    results = {}
+    stale = []
+    for name in names or CHECKS:
+        cached = cache.get(name)
+        max_age = ttl if cached and cached['status'] in ('ok', 'missing') else min(ttl, FAILURE_TTL_SECONDS)
+        if (cached and now - cached['checked_at'] < max_age
+                and cached['fingerprint'] == credentials_fingerprint(creds, name)
+                and not (cached.get('expires_at') and cached['expires_at'] <= now)):
+            results[name] = dict(cached, cached=True)
+        else:
+            stale.append(name)
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+            for name, result in zip(stale, pool.map(lambda name: run_check(name, creds), stale)):
+                results[name] = dict(result, cached=False)
+                cache[name] = result
+        save_cache(cache)
+
+    return results
+
+def is_healthy(results, creds):
+    """The X auth method posting will use must work; LinkedIn must work if it is configured"""
+    from .post_common import uses_oauth1
+    # Posting never falls back: with all four OAuth 1.0a keys set it signs with them
+    x_check = results.get('x-oauth1' if uses_oauth1(creds) else 'x-oauth2')
+    x_ok = bool(x_check) and x_check['status'] == 'ok'
+    linkedin = results.get('linkedin')
+    linkedin_ok = not linkedin or linkedin['status'] in ('ok', 'missing')
+    return x_ok and linkedin_ok
+
+def _duration(seconds):
+    seconds = abs(int(seconds))
+    if seconds >= 86400:
+        return f"{seconds // 86400}d {seconds % 86400 // 3600}h"
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    return f"{seconds // 60}m"
+
+def print_report(results):
+    icons = {'ok': '✅', 'missing': '⚪', 'expired': '⏰', 'error': '❌'}
+    now = time.time()
+    for name, result in results.items():
+        line = f"{icons[result['status']]} {name:<9} {result['status']:<8}"
+        if result.get('user'):
+            line += f" {result['user']}"
+        if result.get('issued_at'):
+            line += f"  age {_duration(now - result['issued_at'])}"
+        if result.get('expires_at'):
+            remaining = result['expires_at'] - now
+            line += f"  expires {'in ' + _duration(remaining) if remaining > 0 else _duration(remaining) + ' ago'}"
+        if result.get('detail'):
+            line += f"  ({result['detail']})"
+        line += f"  [checked {_duration(now - result['checked_at'])} ago{', cached' if result['cached'] else ''}]"
+        print(line)
+
+def run(argv):
+    """health [--refresh] [--gate] [--json]; returns True when posting credentials are usable"""
+    ttl = 0 if '--refresh' in argv else CACHE_TTL_SECONDS
+    results = check_health(ttl)
+    healthy = is_healthy(results, load_credentials())
+
+    if '--json' in argv:
+        print(json.dumps({'healthy': healthy, 'checks': results}, indent=2))
+    elif '--gate' not in argv:
+        print(f"🩺 Credential health ({datetime.now():%Y-%m-%d %H:%M:%S})")
+        print_report(results)
+        print(f"\n{'✅ Ready to post' if healthy else '❌ Fix credentials before posting'}")
+    elif not healthy:
+        print("❌ Credential health check failed: python3 scripts/health.py")
+    return healthy
+
+def main():
+    if any(arg not in ('--refresh', '--gate', '--json') for arg in sys.argv[1:]):
+        print("Usage: python3 health.py [--refresh] [--gate] [--json]")
+        print("  --refresh  ignore cached results")
+        print("  --gate     quiet; exit status only (for slash command preflight)")
+        sys.exit(1)
+    sys.exit(0 if run(sys.argv[1:]) else 1)
+
+if __name__ == "__main__":
+    main()
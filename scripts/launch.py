@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Latency-critical launch mode for time-sensitive announcements
+Part of Claude AutoBlog SlashCommands Content Nuke
+Prepares everything up front, then fires on a signal or at a wall-clock time
+"""
+import os
+import sys
+import time
+import signal
+import threading
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+from .post_common import PostError
+
+KEEPALIVE_SECONDS = 30       # re-touch idle connections so servers don't close them
+
+def keep_warm(platforms):
+    """Touch each host so its pooled TLS connection stays open"""
+    for module in platforms:
+        module.warm_up()
+
+def wait_for_trigger(fire_at, platforms):
+    """Block until SIGUSR1 or fire_at (epoch); returns the trigger time"""
+    fired = threading.Event()
+    trigger = {}
+
+    def on_signal(signum, frame):
+        trigger.setdefault('at', time.time())
+        fired.set()
+
+    signal.signal(signal.SIGUSR1, on_signal)
+
+    if fire_at:
+        print(f"⏰ Armed: firing at {datetime.fromtimestamp(fire_at):%Y-%m-%d %H:%M:%S} "
+              f"(or on: kill -USR1 {os.getpid()})")
+    else:
+        print(f"🎯 Armed: fire with  kill -USR1 {os.getpid()}")
+
+    while not fired.is_set():
+        remaining = fire_at - time.time() if fire_at else KEEPALIVE_SECONDS
+        if fire_at and remaining <= 0:
+            trigger.setdefault('at', fire_at)
+            break
+        if fired.wait(min(remaining, KEEPALIVE_SECONDS)):
+            break
+        if not fire_at or fire_at - time.time() > 1:
+            keep_warm(platforms)
+
+    return trigger['at']
+
+def main():
+    args = []
+    fire_at = None
+    linkedin_file = None
+    force = False
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg == '--at':
+            from .post_scheduler import parse_due
+            fire_at = parse_due(next(argv, 'now'))
+        elif arg == '--linkedin':
+            linkedin_file = next(argv, None)
+        elif arg == '--force':
+            force = True
+        else:
+            args.append(arg)
+
+    if not args:
+        print("Usage: python3 launch.py /path/to/thread.txt [--linkedin post.txt] [--at '2025-10-20 09:00' | +10m] [--force]")
+        print("Prepares the thread (and LinkedIn post), then fires on SIGUSR1 or at --at")
+        sys.exit(1)
+
+    from . import post_x_thread
+    platforms = [post_x_thread]
+
+    # Everything that can happen before the trigger happens now: credentials,
+    # token refresh, parsing, preflight, media uploads, connections
+    started = time.time()
+    print("🔧 Preparing launch...")
+    try:
+        x_prepared, _ = post_x_thread.prepare_thread(args[0], force=force)
+    except PostError:
+        print("❌ Thread is not launchable")
+        sys.exit(1)
+    if x_prepared is None:
+        print("⏭️  Thread already published")
+        sys.exit(0)
+
+    linkedin_prepared = None
+    if linkedin_file:
+        from . import post_linkedin
+        platforms.append(post_linkedin)
+        try:
+            linkedin_prepared, _ = post_linkedin.prepare_linkedin_content(linkedin_file, force=force)
+        except PostError:
+            print("❌ LinkedIn post is not launchable")
+            sys.exit(1)
+
+    keep_warm(platforms)
+
+    # A launch can be armed for longer than an OAuth2 token lives
+    from . import token_keeper
+    token_keeper.start()
+
+    print(f"✅ Ready in {time.time() - started:.2f}s: {len(x_prepared['tweets'])} tweets"
+          f"{', LinkedIn post' if linkedin_prepared else ''}")
+
+    try:
+        trigger_at = wait_for_trigger(fire_at, platforms)
+    except KeyboardInterrupt:
+        print("\n🚫 Launch aborted, nothing was posted")
+        sys.exit(1)
+
+    print(f"🚀 Fired at {datetime.fromtimestamp(trigger_at):%H:%M:%S.%f}")
+    timings = {}
+
+    # LinkedIn goes out alongside tweet 1 instead of after the whole thread.
+    # The worker only makes the API call: the dedup and similarity stores hold
+    # SQLite connections from this thread, so they are updated here after join()
+    linkedin_thread = None
+    linkedin_posted = {}
+    if linkedin_prepared:
+        def publish_linkedin():
+            try:
+                linkedin_posted['id'] = post_linkedin.publish_linkedin_content(linkedin_prepared, record=False)
+            except PostError:
+                return
+            timings['LinkedIn post'] = time.time() - trigger_at
+        linkedin_thread = threading.Thread(target=publish_linkedin)
+        linkedin_thread.start()
+
+    def on_posted(i, tweet_id):
+        if i == 0:
+            timings['Tweet 1'] = time.time() - trigger_at
+
+    try:
+        tweet_ids = post_x_thread.publish_thread(x_prepared, on_posted=on_posted)
+        timings['Full thread'] = time.time() - trigger_at
+    except PostError:
+        tweet_ids = None
+    if linkedin_thread:
+        linkedin_thread.join()
+        if 'id' in linkedin_posted:
+            post_linkedin.record_linkedin_post(linkedin_prepared, linkedin_posted['id'])
+
+    print()
+    print("⏱️  Trigger-to-publish latency:")
+    for label, seconds in timings.items():
+        print(f"   {label}: {seconds * 1000:.0f} ms")
+
+    sys.exit(0 if tweet_ids and (not linkedin_prepared or 'LinkedIn post' in timings) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+LinkedIn image and video upload via registerUpload
+Part of Claude AutoBlog SlashCommands Content Nuke
+Streams media from disk (multipart for large video) and returns asset URNs for ugcPosts
+"""
+import os
+import sys
+import time
+import mimetypes
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+ASSETS_URL = "https://api.linkedin.com/v2/assets"
+
+IMAGE_RECIPE = "urn:li:digitalmediaRecipe:feedshare-image"
+VIDEO_RECIPE = "urn:li:digitalmediaRecipe:feedshare-video"
+
+MULTIPART_THRESHOLD = 200 * 1024 * 1024   # LinkedIn single-PUT limit for video
+PART_WORKERS = 4                           # concurrent part uploads (bounds memory to 4 parts)
+FILE_WORKERS = 4
+PART_RETRIES = 3
+PROCESSING_TIMEOUT = 600                   # seconds to wait for video processing
+
+_local = threading.local()
+
+def _session():
+    """One requests session per worker thread so connections are reused"""
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+def _api_headers(access_token):
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json",
+        "X-Restli-Protocol-Version": "2.0.0"
+    }
+
+def is_video(path):
+    mime_type = mimetypes.guess_type(path)[0] or ''
+    return mime_type.startswith('video/')
+
+def share_media_category(paths):
+    """shareMediaCategory for a set of attachments"""
+    if not paths:
+        return "NONE"
+    return "VIDEO" if any(is_video(p) for p in paths) else "IMAGE"
+
+def register_upload(path, access_token, owner_urn):
+    """Register an upload; returns the registerUpload 'value' object"""
+    video = is_video(path)
+    file_size = os.path.getsize(path)
+    request = {
+        "recipes": [VIDEO_RECIPE if video else IMAGE_RECIPE],
+        "owner": owner_urn,
+        "serviceRelationships": [{
+            "relationshipType": "OWNER",
+            "identifier": "urn:li:userGeneratedContent"
+        }]
+    }
+    if video and file_size > MULTIPART_THRESHOLD:
+        request["supportedUploadMechanism"] = ["MULTIPART_UPLOAD"]
+        request["fileSize"] = file_size
+
+    response = _session().post(f"{ASSETS_URL}?action=registerUpload",
+                               headers=_api_headers(access_token),
+                               json={"registerUploadRequest": request})
+    if response.status_code != 200:
+        raise RuntimeError(f"registerUpload failed for {path}: {response.status_code} {response.text}")
+    return response.json()['value']
+
+class _FileRange:
+    """File-like view of [first_byte, last_byte] so requests streams it from disk"""
+
+    def __init__(self, path, first_byte, last_byte):
+        self.f = open(path, 'rb')
+        self.f.seek(first_byte)
+        self.remaining = last_byte - first_byte + 1
+
+    def __len__(self):
+        return self.remaining
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.f.close()
+
+def _put_range(url, path, first_byte, last_byte, headers):
+    """PUT one byte range, retrying transient failures; returns the response"""
+    last_error = None
+    for attempt in range(PART_RETRIES):
+        body = _FileRange(path, first_byte, last_byte)
+        try:
+            response = _session().put(url, data=body, headers=headers)
+            if 200 <= response.status_code < 300:
+                return response
+            last_error = f"{response.status_code} {response.text}"
+        except requests.RequestException as e:
+            last_error = str(e)
+        finally:
+            body.close()
+        time.sleep(2 ** attempt)
+    raise RuntimeError(f"Upload of bytes {first_byte}-{last_byte} of {path} failed: {last_error}")
+
+def _upload_single(path, mechanism, access_token):
+    request = mechanism["com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest"]
+    headers = dict(request.get("headers", {}))
+    headers["Authorization"] = f"Bearer {access_token}"
+    _put_range(request["uploadUrl"], path, 0, os.path.getsize(path) - 1, headers)
+
+def _upload_multipart(path, mechanism, access_token):
+    """Upload every part in parallel, then complete the multipart upload"""
+    multipart = mechanism["com.linkedin.digitalmedia.uploading.MultipartUpload"]
+    parts = multipart["partUploadRequests"]
+
+    def upload_part(part):
+        byte_range = part["byteRange"]
+        response = _put_range(part["url"], path, byte_range["firstByte"], byte_range["lastByte"],
+                              part.get("headers", {}))
+        return {"httpStatusCode": response.status_code, "headers": {"ETag": response.headers.get("ETag")}}
+
+    with ThreadPoolExecutor(max_workers=min(PART_WORKERS, len(parts))) as pool:
+        part_responses = list(pool.map(upload_part, parts))
+
+    response = _session().post(f"{ASSETS_URL}?action=completeMultiPartUpload",
+                               headers=_api_headers(access_token),
+                               json={"completeMultipartUploadRequest": {
+                                   "mediaArtifact": multipart["mediaArtifact"],
+                                   "metadata": multipart["metadata"],
+                                   "partUploadResponses": part_responses
+                               }})
+    if response.status_code != 200:
+        raise RuntimeError(f"completeMultiPartUpload failed for {path}: {response.status_code} {response.text}")
+
+def wait_for_asset(asset_urn, access_token):
+    """Poll the asset until LinkedIn has finished processing it"""
+    asset_id = asset_urn.split(':')[-1]
+    deadline = time.time() + PROCESSING_TIMEOUT
+    while True:
+        response = _session().get(f"{ASSETS_URL}/{asset_id}", headers=_api_headers(access_token))
+        if response.status_code == 200:
+            statuses = [r.get('status') for r in response.json().get('recipes', [])]
+            if statuses and all(s == 'AVAILABLE' for s in statuses):
+                return
+            if any(s in ('PROCESSING_FAILED', 'CLIENT_ERROR') for s in statuses):
+                raise RuntimeError(f"LinkedIn could not process {asset_urn}: {statuses}")
+        if time.time() > deadline:
+            raise RuntimeError(f"Timed out waiting for LinkedIn to process {asset_urn}")
+        time.sleep(3)
+
+def upload_media(path, access_token, owner_urn):
+    """Register and upload one file; returns its asset URN"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Media file not found: {path}")
+
+    value = register_upload(path, access_token, owner_urn)
+    mechanism = value["uploadMechanism"]
+    if "com.linkedin.digitalmedia.uploading.MultipartUpload" in mechanism:
+        _upload_multipart(path, mechanism, access_token)
+    else:
+        _upload_single(path, mechanism, access_token)
+
+    if is_video(path):
+        wait_for_asset(value["asset"], access_token)
+    return value["asset"]
+
+def upload_all(paths, access_token, owner_urn):
+    """Upload every distinct file in parallel; returns asset URNs in input order"""
+    unique_paths = list(dict.fromkeys(paths))
+    if not unique_paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(FILE_WORKERS, len(unique_paths))) as pool:
+        return list(pool.map(lambda p: upload_media(p, access_token, owner_urn), unique_paths))
+
+def validate_attachments(paths):
+    """Return a list of problems with a post's attachments (empty if fine)"""
+    problems = [f"missing file {p}" for p in paths if not os.path.exists(p)]
+    if any(is_video(p) for p in paths) and len(paths) > 1:
+        problems.append("a video must be the only attachment")
+    return problems
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 linkedin_media_upload.py /path/to/media [more files...]")
+        sys.exit(1)
+
+    from .post_linkedin import load_linkedin_credentials, resolve_person_id
+    access_token, person_id = load_linkedin_credentials()
+    if not access_token:
+        print("❌ LinkedIn credentials not found")
+        sys.exit(1)
+    person_id = resolve_person_id(access_token, person_id)
+    if not person_id:
+        sys.exit(1)
+
+    start = time.time()
+    try:
+        assets = upload_all(sys.argv[1:], access_token, f"urn:li:person:{person_id}")
+    except Exception as e:
+        print(f"❌ LinkedIn media upload failed: {e}")
+        sys.exit(1)
+
+    for path, asset in zip(dict.fromkeys(sys.argv[1:]), assets):
+        print(f"✅ {path}: {asset}")
+    print(f"⏱️  Uploaded {len(assets)} files in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Content-addressed media preprocessing cache
+Part of Claude AutoBlog SlashCommands Content Nuke
+Resizes, recompresses and strips metadata from images to each platform's limits
+"""
+import os
+import io
+import sys
+import json
+import hashlib
+import mimetypes
+from concurrent.futures import ProcessPoolExecutor
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+CACHE_DIR = os.path.join(STATE_DIR, "media-cache")
+
+# Platform image limits; bump 'version' when the processing itself changes
+PROFILES = {
+    'x': {'max_side': 4096, 'max_bytes': 5 * 1024 * 1024, 'quality': 85, 'version': 1},
+    'linkedin': {'max_side': 4096, 'max_bytes': 8 * 1024 * 1024, 'quality': 85, 'version': 1},
+}
+
+MIN_QUALITY = 60
+HASH_BLOCK = 1024 * 1024
+
+def file_hash(path):
+    """SHA-256 of a file, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def profile_key(profile_name):
+    """Short hash of a profile's settings so changed limits never hit stale entries"""
+    settings = json.dumps(PROFILES[profile_name], sort_keys=True).encode('utf-8')
+    return f"{profile_name}-{hashlib.sha256(settings).hexdigest()[:8]}"
+
+def is_processable(path):
+    """Still images only; GIFs and video are uploaded untouched"""
+    mime_type = mimetypes.guess_type(path)[0] or ''
+    return mime_type.startswith('image/') and mime_type != 'image/gif'
+
+def cache_lookup(source_hash, profile_name):
+    """Return the cached output path for (source, profile), or None"""
+    prefix = os.path.join(CACHE_DIR, source_hash[:2], f"{source_hash}-{profile_key(profile_name)}")
+    for ext in ('.jpg', '.png'):
+        if os.path.exists(prefix + ext):
+            return prefix + ext
+    return None
+
+def _encode(image, fmt, quality):
+    buffer = io.BytesIO()
+    if fmt == 'PNG':
+        image.save(buffer, 'PNG', optimize=True)
+    else:
+        image.save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+def process_image(source, source_hash, profile_name):
+    """Resize/recompress one image into the cache; runs in a worker process"""
+    from PIL import Image, ImageOps
+
+    profile = PROFILES[profile_name]
+    with Image.open(source) as original:
+        # Bake in EXIF rotation before the metadata is dropped
+        image = ImageOps.exif_transpose(original)
+        image.thumbnail((profile['max_side'], profile['max_side']))
+
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        if has_alpha:
+            fmt, ext = 'PNG', '.png'
+        else:
+            fmt, ext = 'JPEG', '.jpg'
+            image = image.convert('RGB')
+
+        # Re-encoding from pixels writes no EXIF/XMP/ICC metadata
+        quality = profile['quality']
+        data = _encode(image, fmt, quality)
+        while len(data) > profile['max_bytes']:
+            if fmt == 'JPEG' and quality > MIN_QUALITY:
+                quality -= 10
+            else:
+                image = image.resize((image.width * 3 // 4, image.height * 3 // 4))
+            data = _encode(image, fmt, quality)
+
+    dest_dir = os.path.join(CACHE_DIR, source_hash[:2])
+    os.makedirs(dest_dir, exist_ok=True)
+    dest = os.path.join(dest_dir, f"{source_hash}-{profile_key(profile_name)}{ext}")
+    tmp_path = f"{dest}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, dest)
+    return dest
+
+def preprocess_all(paths, profile_name, max_workers=None):
+    """Map each path to an upload-ready file, processing cache misses in a process pool"""
+    results = {}
+    misses = {}
+    for path in dict.fromkeys(paths):
+        if not is_processable(path) or not os.path.exists(path):
+            results[path] = path
+            continue
+        source_hash = file_hash(path)
+        cached = cache_lookup(source_hash, profile_name)
+        if cached:
+            results[path] = cached
+        else:
+            misses[path] = source_hash
+
+    if not misses:
+        return results
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("⚠️  Pillow not installed, uploading images as-is (pip install Pillow)")
+        results.update({path: path for path in misses})
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {path: pool.submit(process_image, path, source_hash, profile_name)
+                   for path, source_hash in misses.items()}
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                print(f"⚠️  Could not preprocess {path}, uploading as-is: {e}")
+                results[path] = path
+
+    return results
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in PROFILES:
+        print("Usage: python3 media_preprocess.py [x|linkedin] /path/to/image [more files...]")
+        sys.exit(1)
+
+    profile_name = sys.argv[1]
+    results = preprocess_all(sys.argv[2:], profile_name)
+    for source, output in results.items():
+        if output == source:
+            print(f"➡️  {source} (unchanged)")
+        else:
+            before, after = os.path.getsize(source), os.path.getsize(output)
+            print(f"✅ {source} -> {output} ({before // 1024}KB -> {after // 1024}KB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Batched engagement-metrics collector for X and LinkedIn
+Part of Claude AutoBlog SlashCommands Content Nuke
+Refreshes metrics for posted content in batches, newest posts most often, into content_analytics.db
+"""
+import os
+import sys
+import time
+import urllib.parse
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+X_BATCH = 100                # GET /2/tweets ids= limit
+LINKEDIN_BATCH = 50          # keeps the batch-get URL comfortably short
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# (post age below, refresh at most every): recent posts move, old ones barely do
+REFRESH_WINDOWS = [
+    (DAY, HOUR),
+    (7 * DAY, 6 * HOUR),
+    (30 * DAY, DAY),
+    (float('inf'), 7 * DAY),
+]
+
+def known_posts():
+    """Every post we have published: the dedup index plus the posting journal"""
+    from .dedup_index import DedupIndex
+    from .posting_journal import PostingJournal
+    from .post_common import iso_timestamp
+
+    posts = {}
+    for entry in DedupIndex().entries.values():
+        if entry.get('post_id') and entry.get('platform') in ('x', 'linkedin'):
+            posts[(entry['platform'], entry['post_id'])] = (
+                entry['platform'], entry['post_id'], entry.get('source'), iso_timestamp(entry.get('posted_at')))
+
+    journal = PostingJournal()
+    for tweet in journal.conn.execute(
+            "SELECT tweets.tweet_id, tweets.posted_at, threads.source FROM tweets "
+            "JOIN threads ON threads.id = tweets.thread_id WHERE tweets.deleted_at IS NULL"):
+        posts.setdefault(('x', tweet['tweet_id']), ('x', tweet['tweet_id'], tweet['source'], tweet['posted_at']))
+    return list(posts.values())
+
+def fetch_x_metrics(tweet_ids):
+    """public_metrics for up to 100 tweets per request; returns ({id: metrics}, missing ids)"""
+    from . import post_x_thread
+
+    auth, headers = post_x_thread.get_x_auth()
+    if auth is None and headers is None:
+        return {}, []
+
+    limiter = post_x_thread.get_rate_limiter()
+    account = post_x_thread.x_account()
+    metrics, missing = {}, []
+    for start in range(0, len(tweet_ids), X_BATCH):
+        batch = tweet_ids[start:start + X_BATCH]
+        if not limiter.acquire(account, 'GET /2/tweets'):
+            print("⚠️  GET /2/tweets budget exhausted, remaining posts wait for the next run")
+            break
+        params = {'ids': ','.join(batch), 'tweet.fields': 'public_metrics'}
+        if auth:  # OAuth 1.0a
+            response = post_x_thread.session().get("https://api.twitter.com/2/tweets", auth=auth, params=params)
+        else:  # OAuth2 Bearer token
+            response = post_x_thread.session().get("https://api.twitter.com/2/tweets", headers=headers, params=params)
+        post_x_thread.record_rate_limit('GET /2/tweets', response)
+
+        if response.status_code != 200:
+            print(f"❌ X metrics lookup failed: {response.status_code}")
+            print(f"Response: {response.text}")
+            break
+
+        body = response.json()
+        for tweet in body.get('data', []):
+            public = tweet.get('public_metrics', {})
+            metrics[tweet['id']] = {
+                'impressions': public.get('impression_count'),
+                'likes': public.get('like_count'),
+                'reposts': public.get('retweet_count'),
+                'replies': public.get('reply_count'),
+                'quotes': public.get('quote_count'),
+                'bookmarks': public.get('bookmark_count'),
+            }
+        # Deleted or protected tweets come back as per-ID errors
+        missing.extend(error['resource_id'] for error in body.get('errors', [])
+                       if error.get('resource_id') and error.get('resource_type') == 'tweet')
+    return metrics, missing
+
+def fetch_linkedin_metrics(post_ids):
+    """Like and comment counts via the socialActions batch get; returns ({id: metrics}, missing ids)"""
+    from . import post_linkedin
+
+    access_token, _ = post_linkedin.load_linkedin_credentials()
+    if not access_token:
+        return {}, []
+
+    headers = {"Authorization": f"Bearer {access_token}", "X-Restli-Protocol-Version": "2.0.0"}
+    metrics, missing = {}, []
+    for start in range(0, len(post_ids), LINKEDIN_BATCH):
+        batch = post_ids[start:start + LINKEDIN_BATCH]
+        # post_to_linkedin keeps the numeric part of the share URN
+        urns = {f"urn:li:share:{post_id}": post_id for post_id in batch}
+        ids = ','.join(urllib.parse.quote(urn, safe='') for urn in urns)
+        response = post_linkedin.http.get(f"https://api.linkedin.com/v2/socialActions?ids=List({ids})",
+                                          headers=headers)
+        if response.status_code != 200:
+            print(f"❌ LinkedIn metrics lookup failed: {response.status_code}")
+            print(f"Response: {response.text}")
+            break
+
+        body = response.json()
+        for urn, actions in body.get('results', {}).items():
+            metrics[urns.get(urn, urn.split(':')[-1])] = {
+                'likes': actions.get('likesSummary', {}).get('totalLikes'),
+                'comments': actions.get('commentsSummary', {}).get('aggregatedTotalComments'),
+            }
+        missing.extend(urns[urn] for urn, error in body.get('errors', {}).items()
+                       if urn in urns and error.get('status') == 404)
+    return metrics, missing
+
+FETCHERS = {
+    'x': fetch_x_metrics,
+    'linkedin': fetch_linkedin_metrics,
+}
+
+def collect(platforms=('x', 'linkedin'), force=False):
+    """Refresh metrics that are due; returns {platform: refreshed count}"""
+    from .analytics_store import AnalyticsStore
+
+    store = AnalyticsStore()
+    store.register_posts(known_posts())
+
+    refreshed = {}
+    for platform in platforms:
+        windows = [(float('inf'), 0)] if force else REFRESH_WINDOWS
+        due = store.due_for_refresh(platform, windows)
+        if not due:
+            refreshed[platform] = 0
+            continue
+        print(f"📈 Refreshing {len(due)} {platform} posts...")
+        try:
+            metrics, missing = FETCHERS[platform](due)
+        except Exception as e:
+            print(f"❌ {platform} metrics refresh failed: {e}")
+            metrics, missing = {}, []
+        store.upsert_metrics(platform, metrics)
+        store.mark_missing(platform, missing)
+        refreshed[platform] = len(metrics)
+    return refreshed
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] not in ('collect', 'top'):
+        print("Usage: python3 metrics_collector.py [collect [x|linkedin] [--force] | top [x|linkedin]]")
+        print("  collect: refresh due metrics (run hourly; --force refreshes everything)")
+        sys.exit(1)
+
+    platforms = [arg for arg in args[1:] if arg in FETCHERS] or list(FETCHERS)
+
+    if args and args[0] == 'top':
+        from .analytics_store import AnalyticsStore
+        store = AnalyticsStore()
+        for platform in platforms:
+            print(f"🏆 Top {platform} posts")
+            for row in store.top_posts(platform):
+                print(f"   {row['post_id']}: {row['impressions'] or 0} impressions, {row['likes'] or 0} likes, "
+                      f"{row['replies'] if row['replies'] is not None else row['comments'] or 0} replies  "
+                      f"{row['source'] or ''}")
+        return
+
+    started = time.time()
+    refreshed = collect(platforms, force='--force' in args)
+    summary = ', '.join(f"{count} {platform}" for platform, count in refreshed.items())
+    print(f"✅ Refreshed {summary} posts in {time.time() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ OAuth 2.0 Authorization Code Flow with PKCE for X API
 Part of Claude AutoBlog SlashCommands
 """
 import os
+import sys
+import time
 import base64
 import hashlib
 import secrets
@@ -12,27 +14,67 @@ import requests
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+from .post_common import x_oauth2_key
+
+CALLBACK_TIMEOUT = 300  # 5 minutes
+DEFAULT_PORT = 8081     # the callback URI registered in the X app: http://localhost:8081/callback
+
+class CallbackServer(HTTPServer):
+    """Loopback server shared by every authorization flow in this process.
+
+    Redirects are routed by their state parameter to the flow that started them,
+    so several accounts can authorize at once on the one registered port.
+    """
+
+    def __init__(self, port=DEFAULT_PORT):
+        super().__init__(('localhost', port), CallbackHandler)
+        self.flows = {}
+
+    @property
+    def redirect_uri(self):
+        return f"http://localhost:{self.server_address[1]}/callback"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+class AuthorizationFlow:
+    """One account's authorization: PKCE values, state and the callback's outcome"""
+
+    def __init__(self, account=None):
+        self.account = account
+        self.state = secrets.token_urlsafe(32)
+        self.code_verifier, self.code_challenge = generate_pkce_challenge()
+        self.auth_code = None
+        self.error = None
+        self.received = threading.Event()
 
-# Global variables to capture the callback
-auth_code = None
-state_value = None
-server_running = False
+    def wait(self, timeout=CALLBACK_TIMEOUT):
+        """Block until this flow's callback arrives; returns the auth code or None"""
+        self.received.wait(timeout)
+        return self.auth_code
 
 class CallbackHandler(BaseHTTPRequestHandler):
     def do_GET(self):
-        global auth_code, state_value, server_running
-
         # Parse the callback URL
         parsed_path = urllib.parse.urlparse(self.path)
         query_params = urllib.parse.parse_qs(parsed_path.query)
+        flow = self.server.flows.get(query_params.get('state', [None])[0])
 
         if 'code' in query_params and 'state' in query_params:
-            auth_code = query_params['code'][0]
-            received_state = query_params['state'][0]
-
-            # Verify state matches
-            if received_state == state_value:
+            # Verify state matches one of our flows
+            if flow:
                 # Send success response
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html')
@@ -47,7 +89,8 @@ class CallbackHandler(BaseHTTPRequestHandler):
                 </html>
                 """
                 self.wfile.write(success_html.encode())
-                server_running = False
+                flow.auth_code = query_params['code'][0]
+                flow.received.set()
             else:
                 # State mismatch - security issue
                 self.send_response(400)
@@ -63,7 +106,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
                 """
                 self.wfile.write(error_html.encode())
         else:
-            # Missing required parameters
+            # Missing required parameters (or the user denied access)
             self.send_response(400)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
@@ -76,6 +119,9 @@ class CallbackHandler(BaseHTTPRequestHandler):
             </html>
             """
             self.wfile.write(error_html.encode())
+            if 'error' in query_params and flow:
+                flow.error = query_params['error'][0]
+                flow.received.set()
 
     def log_message(self, format, *args):
         # Suppress default HTTP server logging
@@ -168,8 +214,13 @@ def exchange_code_for_tokens(client_id, client_secret, code, redirect_uri, code_
         print(f"❌ Error during token exchange: {e}")
         return None
 
-def save_tokens_to_env(tokens):
-    """Save OAuth 2.0 tokens to environment variables"""
+def save_tokens_to_env(tokens, account=None):
+    """Save OAuth 2.0 tokens to the waygate .env, where the posters and refresher read them.
+
+    With an account, the names are suffixed (X_OAUTH2_ACCESS_TOKEN_<NAME>); posting with
+    X_ACCOUNT=<name> in the environment selects them.
+    """
+    from . import refresh_tokens
 
     access_token = tokens.get('access_token')
     refresh_token = tokens.get('refresh_token')
@@ -178,22 +229,75 @@ def save_tokens_to_env(tokens):
         print("❌ No access token received")
         return False
 
-    # Add to ~/.bashrc
-    bashrc_path = os.path.expanduser('~/.bashrc')
-
-    with open(bashrc_path, 'a') as f:
-        f.write('\n# X API OAuth 2.0 Tokens\n')
-        f.write(f'export X_OAUTH2_ACCESS_TOKEN="{access_token}"\n')
-        if refresh_token:
-            f.write(f'export X_OAUTH2_REFRESH_TOKEN="{refresh_token}"\n')
+    if not os.path.exists(refresh_tokens.WAYGATE_ENV_PATH):
+        print(f"❌ waygate .env not found: {refresh_tokens.WAYGATE_ENV_PATH}")
+        return False
 
-    print("✅ OAuth 2.0 tokens saved to ~/.bashrc")
-    print("✅ Run 'source ~/.bashrc' to load them")
+    # '' rather than None keeps an unset account on the default names even if X_ACCOUNT is set
+    account = account or ''
+    now = int(time.time())
+    updates = {x_oauth2_key('ACCESS_TOKEN', account): access_token,
+               x_oauth2_key('ISSUED_AT', account): str(now)}
+    if refresh_token:
+        updates[x_oauth2_key('REFRESH_TOKEN', account)] = refresh_token
+    if tokens.get('expires_in'):
+        updates[x_oauth2_key('EXPIRES_AT', account)] = str(now + int(tokens['expires_in']))
+    refresh_tokens.save_waygate_env(updates)
+
+    print(f"✅ OAuth 2.0 tokens{f' for {account}' if account else ''} saved to "
+          f"{refresh_tokens.WAYGATE_ENV_PATH} ({x_oauth2_key('ACCESS_TOKEN', account)})")
+    if account:
+        print(f"   Post as this account with: X_ACCOUNT={account}")
 
     return True
 
-def main():
-    global state_value, server_running
+def authorize(client_id, client_secret, server, account=None, open_browser=True):
+    """Run one authorization flow through the shared callback server; returns the tokens or None"""
+    flow = AuthorizationFlow(account)
+    server.flows[flow.state] = flow
+    redirect_uri = server.redirect_uri
+    auth_url = create_authorization_url(client_id, redirect_uri, flow.code_challenge, flow.state)
+    label = f"[{account}] " if account else ""
+
+    print(f"{label}📱 Client ID: {client_id[:10]}...")
+    print(f"{label}🔗 Redirect URI: {redirect_uri}")
+    print(f"{label}🎲 State: {flow.state[:10]}...")
+    print(f"{label}🔒 Code Challenge: {flow.code_challenge[:10]}...")
+    print()
+    print(f"{label}🌐 Opening authorization URL in your browser...")
+    print(f"URL: {auth_url}")
+    print()
+    print("📋 Steps:")
+    print(f"1. Authorize the app in your browser{f' while logged in as {account}' if account else ''}")
+    print("2. You'll be redirected back to localhost")
+    print("3. Return here to complete the setup")
+    print()
+
+    if open_browser:
+        webbrowser.open(auth_url)
+
+    # Wait for callback; the handler wakes us as soon as the redirect lands
+    print(f"{label}⏳ Waiting for authorization callback...")
+    try:
+        auth_code = flow.wait()
+    finally:
+        server.flows.pop(flow.state, None)
+
+    if flow.error:
+        print(f"{label}❌ Authorization denied: {flow.error}")
+        return None
+    if not auth_code:
+        print(f"{label}❌ Authorization timeout. Please try again.")
+        return None
+
+    print(f"{label}✅ Authorization code received!")
+    print(f"{label}🔄 Exchanging code for tokens...")
+    return exchange_code_for_tokens(client_id, client_secret, auth_code, redirect_uri, flow.code_verifier)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    port = int(argv[argv.index('--port') + 1]) if '--port' in argv else DEFAULT_PORT
+    accounts = [argv[i + 1] for i, arg in enumerate(argv[:-1]) if arg == '--account'] or [None]
 
     print("🔐 Setting up OAuth 2.0 Authorization Code Flow with PKCE")
     print("=" * 60)
@@ -201,88 +305,49 @@ def main():
     # Get client credentials
     client_id, client_secret = get_client_credentials()
     if not client_id or not client_secret:
-        return
-
-    # OAuth parameters
-    redirect_uri = 'http://localhost:8081/callback'
-    state_value = secrets.token_urlsafe(32)
-    code_verifier, code_challenge = generate_pkce_challenge()
-
-    # Create authorization URL
-    auth_url = create_authorization_url(client_id, redirect_uri, code_challenge, state_value)
-
-    print(f"📱 Client ID: {client_id[:10]}...")
-    print(f"🔗 Redirect URI: {redirect_uri}")
-    print(f"🎲 State: {state_value[:10]}...")
-    print(f"🔒 Code Challenge: {code_challenge[:10]}...")
-    print()
-
-    # Start local server for callback
-    server = HTTPServer(('localhost', 8081), CallbackHandler)
-    server_thread = threading.Thread(target=server.serve_forever)
-    server_thread.daemon = True
-    server_running = True
-
-    print("🚀 Starting local callback server on http://localhost:8081")
-    server_thread.start()
+        return False
 
-    print()
-    print("🌐 Opening authorization URL in your browser...")
-    print(f"URL: {auth_url}")
-    print()
-    print("📋 Steps:")
-    print("1. Authorize the app in your browser")
-    print("2. You'll be redirected back to localhost")
-    print("3. Return here to complete the setup")
+    try:
+        server = CallbackServer(port).start()
+    except OSError as e:
+        print(f"❌ Could not listen on port {port}: {e}")
+        print("   Use --port to pick the port registered in your X app's callback URI")
+        return False
+    print(f"🚀 Local callback server listening on {server.redirect_uri}")
+    print("   The redirect URI must be registered in your X app settings")
     print()
 
-    # Open browser
-    webbrowser.open(auth_url)
-
-    # Wait for callback
-    print("⏳ Waiting for authorization callback...")
-
-    timeout = 300  # 5 minutes
-    start_time = time.time()
-
-    while server_running and auth_code is None:
-        time.sleep(1)
-        if time.time() - start_time > timeout:
-            print("❌ Authorization timeout. Please try again.")
-            server.shutdown()
-            return
-
-    server.shutdown()
-
-    if auth_code:
-        print("✅ Authorization code received!")
-        print("🔄 Exchanging code for tokens...")
-
-        # Exchange code for tokens
-        tokens = exchange_code_for_tokens(
-            client_id, client_secret, auth_code, redirect_uri, code_verifier
-        )
-
-        if tokens:
-            print("🎉 OAuth 2.0 setup complete!")
-            print()
-            print("📋 Received tokens:")
-            print(f"   Access Token: {tokens.get('access_token', 'N/A')[:20]}...")
-            if tokens.get('refresh_token'):
-                print(f"   Refresh Token: {tokens.get('refresh_token', 'N/A')[:20]}...")
-            print(f"   Token Type: {tokens.get('token_type', 'N/A')}")
-            print(f"   Expires In: {tokens.get('expires_in', 'N/A')} seconds")
-
-            # Save tokens
-            if save_tokens_to_env(tokens):
-                print()
-                print("🚀 Ready to post tweets with OAuth 2.0!")
-                print("Run: source ~/.bashrc")
-                print("Then test: python3 scripts/post_x_thread_oauth2.py 'Test message'")
-        else:
-            print("❌ Failed to exchange code for tokens")
-    else:
-        print("❌ No authorization code received")
+    # Each account waits on its own flow, so a code is exchanged the moment it arrives
+    # (authorization codes are short-lived)
+    try:
+        with ThreadPoolExecutor(max_workers=len(accounts)) as pool:
+            results = list(pool.map(lambda account: authorize(client_id, client_secret, server, account), accounts))
+    finally:
+        server.close()
+
+    saved = 0
+    for account, tokens in zip(accounts, results):
+        if not tokens:
+            print(f"❌ OAuth 2.0 setup{f' for {account}' if account else ''} did not complete")
+            continue
+        print(f"🎉 OAuth 2.0 setup{f' for {account}' if account else ''} complete!")
+        print()
+        print("📋 Received tokens:")
+        print(f"   Access Token: {tokens.get('access_token', 'N/A')[:20]}...")
+        if tokens.get('refresh_token'):
+            print(f"   Refresh Token: {tokens.get('refresh_token', 'N/A')[:20]}...")
+        print(f"   Token Type: {tokens.get('token_type', 'N/A')}")
+        print(f"   Expires In: {tokens.get('expires_in', 'N/A')} seconds")
+
+        # Save tokens
+        if save_tokens_to_env(tokens, account):
+            saved += 1
+
+    if saved:
+        print()
+        print("🚀 Ready to post tweets with OAuth 2.0!")
+        print("Test: python3 scripts/post_x_thread.py 'Test message'")
+    return saved == len(accounts)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(0 if main() else 1)
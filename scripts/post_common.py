@@ -0,0 +1,95 @@
+"""
+Helpers shared by the X and LinkedIn posters
+Part of Claude AutoBlog SlashCommands Content Nuke
+Kept free of API clients so either poster can import it without loading the other
+"""
+import os
+import re
+import time
+from datetime import datetime
+
+MEDIA_LINE = re.compile(r'^\s*MEDIA:\s*(.+?)\s*$')
+
+def split_media_lines(text, base_dir=None):
+    """Separate "MEDIA: path" attachment lines from a post; returns (text, paths)"""
+    media = []
+    text_lines = []
+    for line in text.split('\n'):
+        match = MEDIA_LINE.match(line)
+        if match:
+            path = os.path.expanduser(match.group(1))
+            # Relative paths are relative to the content file
+            if base_dir and not os.path.isabs(path):
+                path = os.path.join(base_dir, path)
+            media.append(path)
+        else:
+            text_lines.append(line)
+    return '\n'.join(text_lines).strip(), media
+
+# OAuth2 values stored per account as X_OAUTH2_<FIELD>_<NAME> by oauth2_pkce_setup.py --account
+X_OAUTH2_FIELDS = ('ACCESS_TOKEN', 'REFRESH_TOKEN', 'EXPIRES_AT', 'ISSUED_AT')
+
+def account_suffix(account):
+    """'' for the default account, else _NAME for per-account variable names"""
+    return '_' + re.sub(r'[^A-Z0-9]+', '_', account.upper()).strip('_') if account else ''
+
+def x_oauth2_key(field, account=None):
+    """Waygate .env name of an X OAuth2 value for account (default: the one X_ACCOUNT selects)"""
+    account = os.environ.get('X_ACCOUNT') if account is None else account
+    return f"X_OAUTH2_{field}{account_suffix(account)}"
+
+def select_x_account(creds):
+    """With X_ACCOUNT set, put that account's OAuth2 values under the unsuffixed names.
+
+    Values the account lacks are dropped rather than left at the default account's,
+    so a half-configured account never posts as someone else.
+    """
+    if os.environ.get('X_ACCOUNT'):
+        for field in X_OAUTH2_FIELDS:
+            value = creds.get(x_oauth2_key(field))
+            if value is None:
+                creds.pop(f"X_OAUTH2_{field}", None)
+            else:
+                creds[f"X_OAUTH2_{field}"] = value
+    return creds
+
+def uses_oauth1(creds):
+    """True when OAuth 1.0a keys are configured (they take precedence over OAuth2)"""
+    oauth1_keys = ('X_API_KEY', 'X_API_SECRET', 'X_ACCESS_TOKEN', 'X_ACCESS_SECRET')
+    return all(creds.get(key) or os.environ.get(key) for key in oauth1_keys)
+
+class PostError(Exception):
+    """A post that did not go out, with what callers need to react to it"""
+
+    def __init__(self, message, status_code=None, retry_after=None, response_text=None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code          # HTTP status, None if no response came back
+        self.retry_after = retry_after          # seconds until the API accepts posts again, if known
+        self.response_text = response_text
+        self.tweet_ids = []                     # tweets of a thread that went out before the failure
+        self.thread_id = None                   # posting journal entry of that partial thread
+
+def iso_timestamp(value):
+    """Epoch seconds for an ISO date/time as stored in the dedup index, or None if missing or malformed"""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+def report(error):
+    """Print a PostError the way the command line always has; returns it for raising"""
+    print(f"❌ {error.message}")
+    if error.response_text:
+        print(f"Response: {error.response_text}")
+    return error
+
+def retry_after_seconds(response, reset_header=None):
+    """Seconds to wait after a 429, from Retry-After or an epoch reset header"""
+    value = response.headers.get('Retry-After')
+    if value and value.isdigit():
+        return int(value)
+    reset = response.headers.get(reset_header) if reset_header else None
+    if reset and reset.isdigit():
+        return max(0, int(reset) - int(time.time()))
+    return None
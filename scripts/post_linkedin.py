@@ -8,8 +8,31 @@ import os
 import sys
 import requests
 import json
+import hashlib
+import time
 from datetime import datetime
 
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+from .dedup_index import DedupIndex
+from .similarity_index import SimilarityIndex, check_near_duplicates
+from .post_common import PostError, report, retry_after_seconds, split_media_lines
+from . import linkedin_media_upload
+from .media_preprocess import preprocess_all
+from .rate_limiter import RateLimiter
+
+# Shared session keeps TLS connections to the LinkedIn API alive between requests
+http = requests.Session()
+
+# Member URN resolved from /v2/userinfo, cached per access token so the
+# lookup happens once per token lifetime instead of once per post
+MEMBER_ID_KEY = 'LINKEDIN_MEMBER_ID'
+MEMBER_TOKEN_KEY = 'LINKEDIN_MEMBER_ID_TOKEN'
+_member_ids = {}
+
 def load_linkedin_credentials():
     """Load LinkedIn API credentials from waygate .env file"""
     waygate_env_path = "/home/jeremy/waygate-mcp/.env"
@@ -38,7 +61,7 @@ def get_user_info(access_token):
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = http.get(url, headers=headers)
         if response.status_code == 200:
             return response.json()
         else:
@@ -49,15 +72,60 @@ def get_user_info(access_token):
         print(f"❌ Error getting user info: {e}")
         return None
 
-def post_to_linkedin(text_content, access_token, person_id=None):
-    """Post content to LinkedIn"""
+def token_fingerprint(access_token):
+    """Short, non-reversible identifier for an access token"""
+    return hashlib.sha256(access_token.encode('utf-8')).hexdigest()[:16]
+
+def load_cached_member_id(access_token):
+    """Return the member ID stored for this exact access token, or None"""
+    fingerprint = token_fingerprint(access_token)
+    if fingerprint in _member_ids:
+        return _member_ids[fingerprint]
+
+    from .refresh_tokens import load_credentials_from_waygate
+    creds = load_credentials_from_waygate()
+    if creds.get(MEMBER_TOKEN_KEY) == fingerprint and creds.get(MEMBER_ID_KEY):
+        _member_ids[fingerprint] = creds[MEMBER_ID_KEY]
+        return creds[MEMBER_ID_KEY]
+    return None
+
+def save_member_id(access_token, member_id):
+    """Persist the member ID next to the token it was resolved with"""
+    fingerprint = token_fingerprint(access_token)
+    _member_ids[fingerprint] = member_id
+    try:
+        from .refresh_tokens import update_waygate_env
+        update_waygate_env(MEMBER_ID_KEY, member_id)
+        update_waygate_env(MEMBER_TOKEN_KEY, fingerprint)
+    except OSError as e:
+        print(f"⚠️  Could not cache LinkedIn member ID: {e}")
+
+def resolve_person_id(access_token, person_id=None):
+    """Return person_id, from config, the per-token cache, or user info (in that order)"""
+    if person_id:
+        return person_id
+
+    cached = load_cached_member_id(access_token)
+    if cached:
+        return cached
+
+    # Token changed (or first run): look it up once and remember it
+    user_info = get_user_info(access_token)
+    if not user_info or not user_info.get('sub'):
+        return None
+    save_member_id(access_token, user_info['sub'])  # LinkedIn user ID
+    return user_info['sub']
+
+def send_linkedin_post(text_content, access_token, person_id=None, media_assets=None, media_category="NONE"):
+    """Post content to LinkedIn, optionally with uploaded image/video asset URNs.
+
+    Returns the post ID; raises PostError with the status code and retry-after when it fails.
+    """
 
     # If no person_id provided, get it from user info
+    person_id = resolve_person_id(access_token, person_id)
     if not person_id:
-        user_info = get_user_info(access_token)
-        if not user_info:
-            return None
-        person_id = user_info.get('sub')  # LinkedIn user ID
+        raise PostError("Could not resolve the LinkedIn member ID")
 
     # LinkedIn API v2 endpoint for creating posts
     url = "https://api.linkedin.com/v2/ugcPosts"
@@ -77,7 +145,7 @@ def post_to_linkedin(text_content, access_token, person_id=None):
                 "shareCommentary": {
                     "text": text_content
                 },
-                "shareMediaCategory": "NONE"
+                "shareMediaCategory": media_category
             }
         },
         "visibility": {
@@ -85,28 +153,61 @@ def post_to_linkedin(text_content, access_token, person_id=None):
         }
     }
 
+    if media_assets:
+        payload["specificContent"]["com.linkedin.ugc.ShareContent"]["media"] = [
+            {"status": "READY", "media": asset} for asset in media_assets
+        ]
+
+    # LinkedIn sends no quota headers, only Retry-After on 429; share that across processes
+    limiter = RateLimiter()
+    account = f"linkedin:{person_id}"
+    if not limiter.acquire(account, 'POST /v2/ugcPosts'):
+        raise PostError("LinkedIn rate limit hit recently, try again later",
+                        retry_after=max(0, limiter.reset_time(account, 'POST /v2/ugcPosts') - time.time()))
+
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = http.post(url, headers=headers, json=payload)
+    except requests.RequestException as e:
+        raise PostError(f"Error posting to LinkedIn: {e}")
 
-        if response.status_code == 201:
-            result = response.json()
-            post_id = result.get('id', '').split(':')[-1]
-            return post_id
-        else:
-            print(f"❌ Failed to post to LinkedIn: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
+    retry_after = None
+    if response.status_code == 429:
+        retry_after = retry_after_seconds(response)
+        limiter.exhausted(account, 'POST /v2/ugcPosts', time.time() + retry_after if retry_after is not None else None)
 
-    except Exception as e:
-        print(f"❌ Error posting to LinkedIn: {e}")
+    if response.status_code != 201:
+        raise PostError(f"Failed to post to LinkedIn: {response.status_code}", status_code=response.status_code,
+                        retry_after=retry_after, response_text=response.text)
+    # Keep the numeric part of the share URN
+    return response.json().get('id', '').split(':')[-1]
+
+def post_to_linkedin(text_content, access_token, person_id=None, media_assets=None, media_category="NONE"):
+    """Post content to LinkedIn; returns the post ID, or None after printing why it failed"""
+    try:
+        return send_linkedin_post(text_content, access_token, person_id, media_assets, media_category)
+    except PostError as e:
+        report(e)
         return None
 
-def post_linkedin_content(content_file_path):
-    """Post LinkedIn content from file"""
+def warm_up():
+    """Load credentials and open the connection to the LinkedIn API ahead of the first post"""
+    access_token, person_id = load_linkedin_credentials()
+    if access_token:
+        resolve_person_id(access_token, person_id)
+    try:
+        http.head("https://api.linkedin.com/v2/ugcPosts", timeout=10)
+    except requests.RequestException as e:
+        print(f"⚠️  Could not pre-connect to LinkedIn API: {e}")
+
+def prepare_linkedin_content(content_file_path, force=False):
+    """Read, preflight and upload media for a LinkedIn post without publishing it.
+
+    Returns (prepared, None) when ready for publish_linkedin_content(), or
+    (None, True) when it is already published. Raises PostError when it can't be posted.
+    """
 
     if not os.path.exists(content_file_path):
-        print(f"❌ LinkedIn content file not found: {content_file_path}")
-        return False
+        raise report(PostError(f"LinkedIn content file not found: {content_file_path}"))
 
     print(f"📖 Reading LinkedIn content from: {content_file_path}")
 
@@ -115,47 +216,126 @@ def post_linkedin_content(content_file_path):
 
     # Extract content before posting instructions
     parts = content.split('---')
-    linkedin_text = parts[0].strip()
+    linkedin_text, media_paths = split_media_lines(
+        parts[0].strip(), os.path.dirname(os.path.abspath(content_file_path)))
+
+    problems = linkedin_media_upload.validate_attachments(media_paths)
+    if problems:
+        raise report(PostError(f"Media: {'; '.join(problems)}"))
+
+    # Skip content we have already published (no network call needed)
+    index = DedupIndex()
+    record = index.lookup(linkedin_text)
+    if record and not force:
+        print(f"⏭️  Already posted to {record['platform']} on {record['posted_at']} (Post ID: {record.get('post_id')})")
+        print("   Use --force to post anyway")
+        return None, True
+
+    similar = SimilarityIndex()
+    if not force and check_near_duplicates([linkedin_text], similar, label='Post'):
+        error = report(PostError("Content is too close to an already-published post"))
+        print("   Use --force to post anyway")
+        raise error
 
     # Load credentials
     access_token, person_id = load_linkedin_credentials()
 
     if not access_token:
-        print("❌ Missing LinkedIn API credentials:")
+        error = report(PostError("Missing LinkedIn API credentials"))
         print("   Add LINKEDIN_ACCESS_TOKEN to waygate .env file")
         print("   Run LinkedIn API setup first")
-        return False
+        raise error
+
+    person_id = resolve_person_id(access_token, person_id)
+    if not person_id:
+        raise PostError("Could not resolve the LinkedIn member ID")
+
+    # Upload media first; the post is only created once every asset is ready
+    media_assets = []
+    if media_paths:
+        print(f"🖼️  Uploading {len(media_paths)} media files to LinkedIn...")
+        try:
+            prepared = preprocess_all(media_paths, 'linkedin')
+            media_assets = linkedin_media_upload.upload_all(
+                list(prepared.values()), access_token, f"urn:li:person:{person_id}")
+        except Exception as e:
+            raise report(PostError(f"LinkedIn media upload failed: {e}"))
+
+    return {
+        'path': content_file_path,
+        'text': linkedin_text,
+        'access_token': access_token,
+        'person_id': person_id,
+        'media_assets': media_assets,
+        'media_category': linkedin_media_upload.share_media_category(media_paths),
+        'index': index,
+        'similar': similar,
+    }, None
+
+def publish_linkedin_content(prepared, record=True):
+    """Publish a prepared LinkedIn post; returns the post ID or raises PostError.
+
+    With record=False the caller must pass the ID to record_linkedin_post() itself, from
+    the thread that prepared the post (the dedup and similarity stores are SQLite).
+    """
+    linkedin_text = prepared['text']
 
     print(f"📝 Posting to LinkedIn...")
     print(f"Content preview: {linkedin_text[:100]}...")
 
     # Post to LinkedIn
-    post_id = post_to_linkedin(linkedin_text, access_token, person_id)
+    try:
+        post_id = send_linkedin_post(linkedin_text, prepared['access_token'], prepared['person_id'],
+                                     media_assets=prepared['media_assets'],
+                                     media_category=prepared['media_category'])
+    except PostError as e:
+        report(e)
+        print("❌ Failed to post to LinkedIn")
+        raise
 
-    if post_id:
-        print(f"✅ Posted to LinkedIn successfully!")
-        print(f"Post ID: {post_id}")
+    print(f"✅ Posted to LinkedIn successfully!")
+    print(f"Post ID: {post_id}")
+    if record:
+        record_linkedin_post(prepared, post_id)
+    return post_id
 
-        # Save posting record
-        posted_file = content_file_path.replace('.txt', '-POSTED.txt')
-        with open(posted_file, 'w') as f:
-            f.write(f"POSTED TO LINKEDIN: {datetime.now().isoformat()}\n")
-            f.write(f"Post ID: {post_id}\n")
-            f.write(f"Content:\n{linkedin_text}\n")
+def record_linkedin_post(prepared, post_id):
+    """Add a published post to the dedup and similarity indexes and write its -POSTED record"""
+    linkedin_text = prepared['text']
+    content_file_path = prepared['path']
+    prepared['index'].record(linkedin_text, 'linkedin', post_id=post_id, source=content_file_path)
+    prepared['similar'].add(linkedin_text, 'linkedin', post_id=post_id, source=content_file_path)
 
+    # Save posting record
+    posted_file = content_file_path.replace('.txt', '-POSTED.txt')
+    with open(posted_file, 'w') as f:
+        f.write(f"POSTED TO LINKEDIN: {datetime.now().isoformat()}\n")
+        f.write(f"Post ID: {post_id}\n")
+        f.write(f"Content:\n{linkedin_text}\n")
+
+def post_linkedin_content(content_file_path, force=False):
+    """Post LinkedIn content from file"""
+    try:
+        prepared, result = prepare_linkedin_content(content_file_path, force=force)
+        if prepared is None:
+            return result
+        publish_linkedin_content(prepared)
         return True
-    else:
-        print("❌ Failed to post to LinkedIn")
+    except PostError:
         return False
 
-def main():
-    if len(sys.argv) < 2:
+def run(argv):
+    """Run the command line in-process; returns True on success"""
+    if not argv:
         print("Usage:")
         print("  Post LinkedIn content: python3 post_linkedin.py /path/to/linkedin-content.txt")
         print("  Test connection: python3 post_linkedin.py test")
-        sys.exit(1)
+        print("  Re-post duplicates: add --force")
+        print()
+        print("Attach images or a video with 'MEDIA: path' lines before the --- separator")
+        return False
 
-    if sys.argv[1] == "test":
+    if argv[0] == "test":
         # Test connection
         access_token, person_id = load_linkedin_credentials()
         if access_token:
@@ -164,15 +344,21 @@ def main():
                 print("✅ LinkedIn API connection successful!")
                 print(f"User: {user_info.get('name', 'Unknown')}")
                 print(f"User ID: {user_info.get('sub', 'Unknown')}")
+                # Prime the member ID cache so the next post skips this lookup
+                if user_info.get('sub') and load_cached_member_id(access_token) != user_info['sub']:
+                    save_member_id(access_token, user_info['sub'])
+                return True
             else:
                 print("❌ LinkedIn API connection failed")
         else:
             print("❌ LinkedIn credentials not found")
-        return
+        return False
+
+    content_file = argv[0]
+    return post_linkedin_content(content_file, force='--force' in argv[1:])
 
-    content_file = sys.argv[1]
-    success = post_linkedin_content(content_file)
-    sys.exit(0 if success else 1)
+def main():
+    sys.exit(0 if run(sys.argv[1:]) else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
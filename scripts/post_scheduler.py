@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Persistent scheduled-post queue with a timer-driven daemon
+Part of Claude AutoBlog SlashCommands Content Nuke
+Queues X threads and LinkedIn posts in SQLite and posts them at their due time
+"""
+import os
+import sys
+import time
+import heapq
+import select
+import signal
+import sqlite3
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "schedule.db")
+PID_PATH = os.path.join(STATE_DIR, "scheduler.pid")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THREADS_DIR = os.path.join(REPO_ROOT, 'x-threads')
+
+MAX_ATTEMPTS = 3
+RETRY_BASE_SECONDS = 60          # 1m, 2m, 4m ... between attempts
+
+PENDING, POSTING, POSTED, DEAD, CANCELLED = 'pending', 'posting', 'posted', 'dead', 'cancelled'
+PLATFORMS = ('x', 'linkedin')
+
+class PostQueue:
+    """SQLite-backed queue of scheduled posts, including retry and dead-letter state"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS queue (
+                id INTEGER PRIMARY KEY,
+                platform TEXT NOT NULL,
+                path TEXT NOT NULL,
+                due_at REAL NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS queue_due ON queue (status, due_at);
+        """)
+
+    def add(self, platform, path, due_at, max_attempts=MAX_ATTEMPTS):
+        now = time.time()
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO queue (platform, path, due_at, max_attempts, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (platform, os.path.abspath(path), due_at, max_attempts, now, now))
+        return cursor.lastrowid
+
+    def is_known(self, path):
+        """True if the file was ever queued (retrying dead items is explicit)"""
+        row = self.conn.execute(
+            "SELECT 1 FROM queue WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return row is not None
+
+    def pending(self):
+        return self.conn.execute(
+            "SELECT * FROM queue WHERE status = ? ORDER BY due_at", (PENDING,)).fetchall()
+
+    def get(self, item_id):
+        return self.conn.execute("SELECT * FROM queue WHERE id = ?", (item_id,)).fetchone()
+
+    def all(self):
+        return self.conn.execute("SELECT * FROM queue ORDER BY due_at").fetchall()
+
+    def set_status(self, item_id, status, **fields):
+        fields['status'] = status
+        fields['updated_at'] = time.time()
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self.conn:
+            self.conn.execute(f"UPDATE queue SET {assignments} WHERE id = ?",
+                              list(fields.values()) + [item_id])
+
+    def claim(self, item_id):
+        """Atomically move a due item to 'posting'; False if another process got it"""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE queue SET status = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE id = ? AND status = ?", (POSTING, time.time(), item_id, PENDING))
+        return cursor.rowcount == 1
+
+    def fail(self, item_id, error):
+        """Schedule a retry with backoff, or dead-letter the item after max_attempts"""
+        item = self.get(item_id)
+        if item['attempts'] >= item['max_attempts']:
+            self.set_status(item_id, DEAD, last_error=error)
+            return DEAD
+        retry_at = time.time() + RETRY_BASE_SECONDS * 2 ** (item['attempts'] - 1)
+        self.set_status(item_id, PENDING, due_at=retry_at, last_error=error)
+        return PENDING
+
+    def recover_interrupted(self):
+        """Items left in 'posting' by a crash go back through the retry path"""
+        from .posting_journal import PostingJournal, POSTING as JOURNAL_POSTING, FAILED
+        journal = None
+        for item in self.conn.execute("SELECT id, platform, path FROM queue WHERE status = ?", (POSTING,)).fetchall():
+            if item['platform'] == 'x':
+                # The crash cut its thread short: mark it failed so the retry resumes it
+                journal = journal or PostingJournal()
+                thread = journal.latest_for_source(item['path'])
+                if thread and thread['status'] == JOURNAL_POSTING:
+                    journal.finish_thread(thread['id'], FAILED)
+            self.fail(item['id'], 'interrupted while posting')
+
+def post_item(item):
+    """Post one queued item through the normal pipeline; returns True on success"""
+    if item['platform'] == 'linkedin':
+        from .post_linkedin import post_linkedin_content
+        return post_linkedin_content(item['path'])
+    from .post_x_thread import post_thread
+    # A retry continues a partly posted thread from the journal instead of tripping
+    # the partial re-post check on every attempt
+    return post_thread(item['path'], resume=True)
+
+def notify_daemon():
+    """Wake a running daemon so it re-reads the queue"""
+    try:
+        with open(PID_PATH, 'r') as f:
+            os.kill(int(f.read().strip()), signal.SIGUSR1)
+    except (OSError, ValueError):
+        pass
+
+class Wakeup:
+    """Self-pipe wakeup for the daemon: set() is safe from a signal handler because it takes no lock"""
+
+    def __init__(self):
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        os.set_blocking(self.write_fd, False)
+
+    def set(self):
+        try:
+            os.write(self.write_fd, b'\0')
+        except BlockingIOError:
+            pass  # pipe already full, a wakeup is pending anyway
+
+    def clear(self):
+        try:
+            while os.read(self.read_fd, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wait(self, timeout=None):
+        ready, _, _ = select.select([self.read_fd], [], [], timeout)
+        return bool(ready)
+
+def dispatch(queue, wake):
+    """Post items as they come due, sleeping until the next one or until woken"""
+    while True:
+        # Clear before reading the queue: a wakeup from here on stays set for wait()
+        wake.clear()
+        heap = [(item['due_at'], item['id']) for item in queue.pending()]
+        heapq.heapify(heap)
+
+        while heap and heap[0][0] <= time.time():
+            _, item_id = heapq.heappop(heap)
+            if not queue.claim(item_id):
+                continue
+            item = queue.get(item_id)
+            print(f"📤 [{datetime.now():%H:%M:%S}] Posting #{item_id} ({item['platform']}): {item['path']}")
+            try:
+                success = post_item(item)
+                error = None if success else 'posting failed'
+            except Exception as e:
+                success, error = False, str(e)
+
+            if success:
+                queue.set_status(item_id, POSTED, last_error=None)
+                print(f"✅ #{item_id} posted")
+            else:
+                state = queue.fail(item_id, error)
+                print(f"❌ #{item_id} failed ({error}), now {state}")
+
+        heap = [(item['due_at'], item['id']) for item in queue.pending()]
+        timeout = max(0, min(heap)[0] - time.time()) if heap else None
+        wake.wait(timeout)
+
+def run_daemon(queue):
+    """Sleep on a timer heap until the next due item; SIGUSR1 wakes us on new items"""
+    from . import post_x_thread
+    from . import post_linkedin
+
+    # The C-level handler writes to the pipe, so the wakeup never waits on a lock the
+    # interrupted main thread might hold; the Python handler only has to exist
+    wake = Wakeup()
+    signal.set_wakeup_fd(wake.write_fd)
+    signal.signal(signal.SIGUSR1, lambda signum, frame: None)
+
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(PID_PATH, 'w') as f:
+        f.write(str(os.getpid()))
+
+    queue.recover_interrupted()
+
+    # Load credentials and open connections once, not per post
+    print("🔥 Preloading credentials and connections...")
+    post_x_thread.warm_up()
+    post_linkedin.warm_up()
+
+    # Queued posts may be hours apart: keep OAuth2 tokens renewed in the background
+    from . import token_keeper
+    token_keeper.start()
+
+    print(f"⏰ Scheduler running (pid {os.getpid()}), queue: {queue.path}")
+    try:
+        dispatch(queue, wake)
+    except KeyboardInterrupt:
+        print("\n👋 Scheduler stopped")
+    finally:
+        if os.path.exists(PID_PATH):
+            os.remove(PID_PATH)
+
+def parse_due(value):
+    """Parse 'now', an ISO date/time, or '+30m' / '+2h' offsets into an epoch timestamp"""
+    if not value or value == 'now':
+        return time.time()
+    if value.startswith('+'):
+        units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+        return time.time() + int(value[1:-1]) * units[value[-1]]
+    return datetime.fromisoformat(value).timestamp()
+
+def scan_ready(queue, directory=THREADS_DIR):
+    """Queue thread files whose header says 'Status: Ready to post'"""
+    from .post_x_thread import parse_thread_header
+    added = 0
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if not name.endswith('.txt') or queue.is_known(path):
+            continue
+        with open(path, 'r') as f:
+            header = parse_thread_header(f.read())
+        if header.get('Status', '').lower() != 'ready to post':
+            continue
+        due_at = parse_due(header.get('Scheduled', 'now'))
+        item_id = queue.add('x', path, due_at)
+        print(f"➕ #{item_id} {name} at {datetime.fromtimestamp(due_at):%Y-%m-%d %H:%M}")
+        added += 1
+    return added
+
+def find_item(queue, value):
+    """Look up a queue item from a command-line id, exiting if there is none"""
+    item = queue.get(int(value)) if value.isdigit() else None
+    if item is None:
+        print(f"❌ No queued item #{value} (see: post_scheduler.py list)")
+        sys.exit(1)
+    return item
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Schedule a post:   python3 post_scheduler.py add /path/to/file.txt [x|linkedin] [--at '2025-10-20 09:00' | +2h]")
+        print("  Queue ready files: python3 post_scheduler.py scan [x-threads dir]")
+        print("  Show queue:        python3 post_scheduler.py list")
+        print("  Retry dead item:   python3 post_scheduler.py retry <id>")
+        print("  Cancel item:       python3 post_scheduler.py cancel <id>")
+        print("  Run daemon:        python3 post_scheduler.py run")
+        sys.exit(1)
+
+    queue = PostQueue()
+    command = sys.argv[1]
+
+    if command == "add" and len(sys.argv) > 2:
+        args = sys.argv[3:]
+        due = 'now'
+        if '--at' in args:
+            at = args.index('--at')
+            if at + 1 >= len(args):
+                print("❌ --at needs a time, e.g. --at '2025-10-20 09:00' or --at +2h")
+                sys.exit(1)
+            due = args[at + 1]
+            args = args[:at] + args[at + 2:]
+        platform = args[0] if args else 'x'
+        if platform not in PLATFORMS:
+            print(f"❌ Unknown platform: {platform} (use {' or '.join(PLATFORMS)})")
+            sys.exit(1)
+        if not os.path.exists(sys.argv[2]):
+            print(f"❌ File not found: {sys.argv[2]}")
+            sys.exit(1)
+        try:
+            due_at = parse_due(due)
+        except (ValueError, KeyError):
+            print(f"❌ Can't parse time: {due} (use 'now', an ISO date/time or +30m / +2h / +1d)")
+            sys.exit(1)
+        item_id = queue.add(platform, sys.argv[2], due_at)
+        print(f"✅ Scheduled #{item_id} ({platform}) for {datetime.fromtimestamp(due_at):%Y-%m-%d %H:%M:%S}")
+        notify_daemon()
+    elif command == "scan":
+        added = scan_ready(queue, *sys.argv[2:3])
+        print(f"✅ Queued {added} ready threads")
+        if added:
+            notify_daemon()
+    elif command == "list":
+        for item in queue.all():
+            due = datetime.fromtimestamp(item['due_at']).strftime('%Y-%m-%d %H:%M')
+            error = f"  ({item['last_error']})" if item['last_error'] else ''
+            print(f"#{item['id']:<4} {item['status']:<8} {due}  {item['platform']:<8} "
+                  f"{os.path.basename(item['path'])}  tries {item['attempts']}/{item['max_attempts']}{error}")
+    elif command == "retry" and len(sys.argv) > 2:
+        item = find_item(queue, sys.argv[2])
+        queue.set_status(item['id'], PENDING, attempts=0, due_at=time.time())
+        print(f"🔄 #{item['id']} re-queued")
+        notify_daemon()
+    elif command == "cancel" and len(sys.argv) > 2:
+        item = find_item(queue, sys.argv[2])
+        queue.set_status(item['id'], CANCELLED)
+        print(f"🚫 #{item['id']} cancelled")
+        notify_daemon()
+    elif command == "run":
+        run_daemon(queue)
+    else:
+        print("Usage: python3 post_scheduler.py [add|scan|list|retry|cancel|run]")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
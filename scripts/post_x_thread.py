@@ -5,9 +5,36 @@ Part of Claude AutoBlog SlashCommands
 Updated to work with waygate MCP OAuth2 credentials
 """
 import os
+import re
 import sys
 import time
-import requests
+import types
+import threading
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+# requests and the SQLite-backed stores are imported where they are used, so
+# `content-nuke post-x --help` and modules that only parse threads stay fast
+from .post_common import PostError, report, retry_after_seconds, select_x_account, split_media_lines, uses_oauth1
+
+# Shared session keeps TLS connections to the X API alive between requests (see session())
+http = None
+
+_auth_cache = {}
+
+# Latest x-rate-limit-* values seen in this process, keyed by endpoint
+rate_limits = {}
+
+# Rate-limit, quota and journal stores shared with every other process posting from
+# the same account; SQLite connections are per thread (rollback workers) unless a
+# server that serializes its commands opens one set for all threads (share_ledgers)
+_ledgers = threading.local()
+
+LOOKUP_BATCH = 100           # GET /2/tweets accepts up to 100 IDs
 
 def load_waygate_credentials():
     """Load all X API credentials from waygate .env file"""
@@ -23,7 +50,8 @@ def load_waygate_credentials():
                 key, value = line.strip().split('=', 1)
                 creds[key] = value
 
-    return creds
+    # X_ACCOUNT picks which account's OAuth2 tokens the X_OAUTH2_* names refer to
+    return select_x_account(creds)
 
 def load_waygate_oauth2_credentials():
     """Load OAuth2 credentials specifically"""
@@ -33,26 +61,47 @@ def load_waygate_oauth2_credentials():
     access_token = creds.get('X_OAUTH2_ACCESS_TOKEN')
     return client_id, client_secret, access_token
 
-def auto_refresh_x_token():
-    """Automatically refresh X token before posting"""
-    import subprocess
-    import os
+def auto_refresh_x_token(min_valid_seconds=300):
+    """Refresh the X OAuth2 token in-process, only when it is about to expire"""
+    creds = load_waygate_credentials()
+    if uses_oauth1(creds):
+        return True  # OAuth 1.0a tokens never expire
 
-    # Use simplified script directory structure
-    script_dir = "/home/jeremy/projects/content-nuke/scripts"
-    refresh_script = os.path.join(script_dir, 'refresh_tokens.py')
+    expires_at = creds.get('X_OAUTH2_EXPIRES_AT')
+    if expires_at and float(expires_at) - time.time() > min_valid_seconds:
+        return True
 
     try:
-        # Run token refresh
-        result = subprocess.run([sys.executable, refresh_script, 'x'],
-                              capture_output=True, text=True)
-        return result.returncode == 0
+        from .refresh_tokens import refresh_x_token
+        # Re-checked under the refresh lock: another process may have just rotated it
+        return refresh_x_token(min_valid_seconds)
     except Exception as e:
         print(f"⚠️  Token refresh failed: {e}")
         return False
 
-def post_tweet(tweet_text, reply_to_id=None):
-    """Post a single tweet using OAuth 1.0a (permanent) or OAuth2 authentication"""
+def _credentials_version():
+    """Changes whenever the waygate .env or the X_* environment variables change"""
+    try:
+        mtime = os.path.getmtime("/home/jeremy/waygate-mcp/.env")
+    except OSError:
+        mtime = None
+    keys = ('X_API_KEY', 'X_API_SECRET', 'X_ACCESS_TOKEN', 'X_ACCESS_SECRET', 'X_ACCOUNT')
+    return (mtime,) + tuple(os.environ.get(key) for key in keys)
+
+def get_x_auth():
+    """X API auth, built once and reused until the credentials change"""
+    version = _credentials_version()
+    entry = _auth_cache.get('entry')
+    if entry is None or entry[0] != version:
+        auth, headers = build_x_auth()
+        if auth is None and headers is None:
+            return None, None  # don't cache missing credentials
+        # One assignment, so concurrent readers see the old or the new auth, never a mix
+        entry = _auth_cache['entry'] = (version, (auth, headers))
+    return entry[1]
+
+def build_x_auth():
+    """Pick X API auth (OAuth 1.0a first, OAuth2 fallback); returns (auth, headers) or (None, None)"""
 
     # First try OAuth 1.0a from waygate (PERMANENT TOKENS - never expire!)
     creds = load_waygate_credentials()
@@ -102,7 +151,7 @@ def post_tweet(tweet_text, reply_to_id=None):
             print("   Preferred: OAuth 1.0a (permanent): X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_SECRET")
             print("   Fallback: OAuth2 (2hr expiry): X_CLIENT_ID, X_CLIENT_SECRET, X_OAUTH2_ACCESS_TOKEN")
             print("   Run: python3 scripts/get_oauth1_tokens.py")
-            return None
+            return None, None
 
         # Use OAuth2 Bearer token authentication
         auth = None
@@ -111,6 +160,97 @@ def post_tweet(tweet_text, reply_to_id=None):
             "Content-Type": "application/json"
         }
 
+    return auth, headers
+
+def session():
+    """The shared requests session, created on first use"""
+    global http
+    if http is None:
+        import requests
+        http = requests.Session()
+    return http
+
+def share_ledgers():
+    """Open one set of stores used from every thread; the caller serializes access to them"""
+    global _ledgers
+    from .rate_limiter import RateLimiter
+    from .x_quota import QuotaLedger
+    from .posting_journal import PostingJournal
+    _ledgers = types.SimpleNamespace(limiter=RateLimiter(shared=True), quota=QuotaLedger(shared=True),
+                                     journal=PostingJournal(shared=True))
+
+def get_rate_limiter():
+    if not hasattr(_ledgers, 'limiter'):
+        from .rate_limiter import RateLimiter
+        _ledgers.limiter = RateLimiter()
+    return _ledgers.limiter
+
+def get_quota_ledger():
+    if not hasattr(_ledgers, 'quota'):
+        from .x_quota import QuotaLedger
+        _ledgers.quota = QuotaLedger()
+    return _ledgers.quota
+
+def get_journal():
+    if not hasattr(_ledgers, 'journal'):
+        from .posting_journal import PostingJournal
+        _ledgers.journal = PostingJournal()
+    return _ledgers.journal
+
+def check_quota(count):
+    """Preflight: True if count more tweets fit in this month's write quota"""
+    ledger = get_quota_ledger()
+    remaining = ledger.remaining(x_account())
+    if remaining < count:
+        print(f"❌ Monthly X write quota: {remaining}/{ledger.cap} posts left, need {count}")
+        print("   Check usage: python3 scripts/x_quota.py report")
+        return False
+    if remaining - count < ledger.cap // 10:
+        print(f"⚠️  Monthly X write quota nearly used: {remaining - count}/{ledger.cap} left after this")
+    return True
+
+def x_account():
+    """Stable ID for the posting account, read once per credentials version"""
+    version = _credentials_version()
+    entry = _auth_cache.get('account')
+    if entry is None or entry[0] != version:
+        # OAuth 1.0a access tokens start with the user ID
+        creds = load_waygate_credentials()
+        access_token = creds.get('X_ACCESS_TOKEN') or os.environ.get('X_ACCESS_TOKEN')
+        if access_token and '-' in access_token:
+            account = f"x:{access_token.split('-', 1)[0]}"
+        else:
+            account = f"x:client-{creds.get('X_CLIENT_ID', 'default')}"
+        entry = _auth_cache['account'] = (version, account)
+    return entry[1]
+
+def record_rate_limit(endpoint, response, account=None):
+    """Remember the x-rate-limit-* headers from the latest response and share them with other processes"""
+    account = account or x_account()
+    limit = response.headers.get('x-rate-limit-limit')
+    reset = response.headers.get('x-rate-limit-reset')
+    if response.status_code == 429:
+        get_rate_limiter().exhausted(account, endpoint, int(reset) if reset else None)
+    if limit is None:
+        return
+    rate_limits[endpoint] = {
+        'limit': int(limit),
+        'remaining': int(response.headers.get('x-rate-limit-remaining', 0)),
+        'reset': int(reset or 0),
+    }
+    get_rate_limiter().update(account, endpoint, *rate_limits[endpoint].values())
+
+def send_tweet(tweet_text, reply_to_id=None, media_ids=None, account=None):
+    """Post a single tweet using OAuth 1.0a (permanent) or OAuth2 authentication.
+
+    Returns the tweet ID; raises PostError with the status code and retry-after when it fails.
+    """
+    import requests
+
+    auth, headers = get_x_auth()
+    if auth is None and headers is None:
+        raise PostError("Missing X API credentials")
+
     # Twitter API v2 endpoint for posting tweets
     url = "https://api.twitter.com/2/tweets"
 
@@ -121,132 +261,464 @@ def post_tweet(tweet_text, reply_to_id=None):
     if reply_to_id:
         payload["reply"] = {"in_reply_to_tweet_id": reply_to_id}
 
+    # Attach media uploaded beforehand (see x_media_upload.py)
+    if media_ids:
+        payload["media"] = {"media_ids": list(media_ids)}
+
+    # Reserve from the budget shared with every process posting from this account
+    limiter = get_rate_limiter()
+    account = account or x_account()
+    if not limiter.acquire(account, 'POST /2/tweets'):
+        reset_time = limiter.reset_time(account, 'POST /2/tweets')
+        raise PostError(f"POST /2/tweets rate limit exhausted until {datetime.fromtimestamp(reset_time):%Y-%m-%d %H:%M}",
+                        retry_after=max(0, reset_time - time.time()))
+
     try:
         # Make the request with appropriate authentication
         if auth:  # OAuth 1.0a
-            response = requests.post(url, auth=auth, json=payload)
+            response = session().post(url, auth=auth, json=payload)
         else:  # OAuth2 Bearer token
-            response = requests.post(url, headers=headers, json=payload)
+            response = session().post(url, headers=headers, json=payload)
+
+        record_rate_limit('POST /2/tweets', response, account)
+
+        # Another process beat us to the last slot: wait for the window once, then retry
+        if response.status_code == 429 and limiter.acquire(account, 'POST /2/tweets'):
+            if auth:
+                response = session().post(url, auth=auth, json=payload)
+            else:
+                response = session().post(url, headers=headers, json=payload)
+            record_rate_limit('POST /2/tweets', response, account)
+    except requests.RequestException as e:
+        raise PostError(f"Error posting tweet: {e}")
+
+    if response.status_code != 201:
+        raise PostError(f"Failed to post tweet: {response.status_code}", status_code=response.status_code,
+                        retry_after=retry_after_seconds(response, 'x-rate-limit-reset') if response.status_code == 429 else None,
+                        response_text=response.text)
+
+    tweet_id = response.json()['data']['id']
+    get_quota_ledger().record(account)
+    return tweet_id
+
+def post_tweet(tweet_text, reply_to_id=None, media_ids=None):
+    """Post a single tweet; returns the tweet ID, or None after printing why it failed"""
+    try:
+        return send_tweet(tweet_text, reply_to_id, media_ids)
+    except PostError as e:
+        report(e)
+        return None
 
-        if response.status_code == 201:
-            result = response.json()
-            tweet_id = result['data']['id']
-            return tweet_id
-        else:
-            print(f"❌ Failed to post tweet: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
+def x_get(url, params, endpoint):
+    """Authenticated GET against the X API through the shared rate-limit ledger; returns the JSON body or None"""
+    import requests
 
-    except Exception as e:
-        print(f"❌ Error posting tweet: {e}")
+    auth, headers = get_x_auth()
+    if auth is None and headers is None:
         return None
+    if not get_rate_limiter().acquire(x_account(), endpoint):
+        print(f"⚠️  {endpoint} budget exhausted, try again after the window resets")
+        return None
+    try:
+        if auth:  # OAuth 1.0a
+            response = session().get(url, auth=auth, params=params)
+        else:  # OAuth2 Bearer token
+            response = session().get(url, headers=headers, params=params)
+    except requests.RequestException as e:
+        print(f"❌ {endpoint} failed: {e}")
+        return None
+    record_rate_limit(endpoint, response)
+    if response.status_code != 200:
+        print(f"❌ {endpoint} failed: {response.status_code}")
+        print(f"Response: {response.text}")
+        return None
+    return response.json()
+
+def verify_reply_chain(tweet_ids):
+    """Check that each tweet replies to the one before it, looking up to 100 IDs per request.
+
+    Returns (ok, problems), or (None, problems) if the lookup itself failed.
+    """
+    found = {}
+    for start in range(0, len(tweet_ids), LOOKUP_BATCH):
+        params = {
+            'ids': ','.join(tweet_ids[start:start + LOOKUP_BATCH]),
+            'tweet.fields': 'referenced_tweets,conversation_id',
+        }
+        # Through the shared ledger, so lookups draw on the same GET /2/tweets budget
+        body = x_get("https://api.twitter.com/2/tweets", params, 'GET /2/tweets')
+        if body is None:
+            print("⚠️  Could not verify thread")
+            return None, ["lookup failed"]
+        for tweet in body.get('data', []):
+            found[tweet['id']] = tweet
+
+    problems = []
+    for i, tweet_id in enumerate(tweet_ids):
+        tweet = found.get(tweet_id)
+        if tweet is None:
+            problems.append(f"tweet {i+1} ({tweet_id}) not found")
+            continue
+        if i == 0:
+            continue
+        replied_to = [ref['id'] for ref in tweet.get('referenced_tweets', []) if ref['type'] == 'replied_to']
+        if replied_to != [tweet_ids[i-1]]:
+            problems.append(f"tweet {i+1} ({tweet_id}) replies to {replied_to[0] if replied_to else 'nothing'}, "
+                            f"expected {tweet_ids[i-1]}")
+        elif tweet.get('conversation_id') not in (None, tweet_ids[0]):
+            problems.append(f"tweet {i+1} ({tweet_id}) is in conversation {tweet['conversation_id']}")
+
+    if problems:
+        print(f"❌ Reply chain broken: {'; '.join(problems)}")
+    else:
+        print(f"🔗 Reply chain verified ({len(tweet_ids)} tweets, 1 lookup)")
+    return not problems, problems
+
+def post_single_tweet(tweet_text, media=None, force=False):
+    """Preflight and post one standalone tweet; returns True if it is (already) published"""
+    from .dedup_index import DedupIndex
+    from .similarity_index import SimilarityIndex, check_near_duplicates
+    from .x_media_upload import upload_all, validate_attachments
+    from .media_preprocess import preprocess_all
+
+    index = DedupIndex()
+    record = index.lookup(tweet_text)
+    if record and not force:
+        print(f"⏭️  Already posted on {record['posted_at']}: {record.get('url') or record.get('post_id')}")
+        print("   Use --force to post anyway")
+        return True
 
-def post_thread(thread_file_path):
-    """Post a thread from a file"""
-
-    if not os.path.exists(thread_file_path):
-        print(f"❌ Thread file not found: {thread_file_path}")
+    similar = SimilarityIndex()
+    if not force and check_near_duplicates([tweet_text], similar):
+        print("❌ Tweet is too close to an already-published post")
+        print("   Use --force to post anyway")
         return False
 
-    print(f"📖 Reading thread from: {thread_file_path}")
+    if not check_quota(1):
+        return False
 
-    # Auto-refresh OAuth2 token before posting (ensures fresh token)
-    print("🔄 Refreshing X API token...")
-    if not auto_refresh_x_token():
-        print("⚠️  Token refresh failed, attempting with existing token...")
+    media_ids = []
+    if media:
+        problems = validate_attachments(media)
+        if problems:
+            print(f"❌ Media: {'; '.join(problems)}")
+            return False
+        try:
+            prepared = preprocess_all(media, 'x')
+            media_ids = list(upload_all(list(prepared.values()), *get_x_auth()).values())
+        except Exception as e:
+            print(f"❌ Media upload failed: {e}")
+            return False
 
-    with open(thread_file_path, 'r') as f:
-        content = f.read()
+    tweet_id = post_tweet(tweet_text, media_ids=media_ids)
+    if not tweet_id:
+        return False
 
-    # Parse thread content - handle Content Nuke format
+    tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
+    index.record(tweet_text, 'x', post_id=tweet_id, url=tweet_url)
+    similar.add(tweet_text, 'x', post_id=tweet_id, url=tweet_url)
+    print(f"🎉 Tweet posted successfully!")
+    print(f"Tweet URL: {tweet_url}")
+    return True
+
+def clean_tweet_text(tweet_text):
+    """Remove a leading "1/7" counter from a tweet if it exists"""
+    if tweet_text.startswith(('1/', '2/', '3/', '4/', '5/', '6/', '7/', '8/', '9/')):
+        lines = tweet_text.split('\n')
+        if lines:
+            lines[0] = ' '.join(lines[0].split()[1:])  # Remove first part
+            tweet_text = '\n'.join(lines).strip()
+    return tweet_text
+
+def extract_thread(content, base_dir=None):
+    """Extract tweets as [{'text': ..., 'media': [paths]}] from "TWEET X/Y:" thread content"""
     tweets = []
 
     # Use regex to extract TWEET X/Y: sections properly
-    import re
     tweet_pattern = r'TWEET (\d+)/(\d+):\s*(.*?)(?=TWEET \d+/\d+:|===== CHARACTER COUNTS =====|$)'
     matches = re.findall(tweet_pattern, content, re.DOTALL)
 
     for match in matches:
         tweet_num, total_tweets, tweet_content = match
         # Clean up the tweet content
-        clean_content = tweet_content.strip()
+        text, media = split_media_lines(tweet_content.strip(), base_dir)
 
         # Skip empty tweets
-        if not clean_content:
+        if not text and not media:
             continue
 
-        tweets.append(clean_content)
+        tweets.append({'text': clean_tweet_text(text), 'media': media})
 
-    if not tweets:
-        print("❌ No tweets found in thread file")
+    return tweets
+
+def extract_tweets(content):
+    """Extract postable tweet texts from Content Nuke "TWEET X/Y:" thread content"""
+    return [tweet['text'] for tweet in extract_thread(content)]
+
+def load_thread(thread_file_path):
+    """Read a thread file and return its tweets with resolved media paths"""
+    with open(thread_file_path, 'r') as f:
+        content = f.read()
+    return extract_thread(content, os.path.dirname(os.path.abspath(thread_file_path)))
+
+def load_thread_tweets(thread_file_path):
+    """Read a thread file and return its tweet texts"""
+    return [tweet['text'] for tweet in load_thread(thread_file_path)]
+
+def check_already_posted(tweets, index):
+    """Report tweets already in the dedup index; returns True if posting should stop"""
+    unpublished, published = index.split_published(tweets)
+    if not published:
         return False
 
+    for i in published:
+        record = index.lookup(tweets[i])
+        where = record.get('url') or record.get('post_id') or record.get('source')
+        print(f"🔁 Tweet {i+1} already posted ({record['platform']}, {record['posted_at']}): {where}")
+
+    if not unpublished:
+        print("⏭️  Thread already published, skipping")
+    else:
+        print(f"⚠️  {len(published)}/{len(tweets)} tweets already published, refusing to re-post")
+        print("   Use --force to post anyway")
+    return True
+
+def parse_thread_header(content):
+    """Read "Key: value" lines (Date, Status, ...) from the header block at the top of a thread file"""
+    header = {}
+    for line in content.split('\n'):
+        if not line.strip() or line.startswith(('═', '=', 'TWEET ')):
+            break
+        match = re.match(r'^([A-Za-z][\w ]*?):\s*(.+?)\s*$', line)
+        if match:
+            header[match.group(1)] = match.group(2)
+    return header
+
+def warm_up():
+    """Open the connection to the X API and the local stores, and build auth ahead of the first post"""
+    import requests
+
+    get_x_auth()
+    get_rate_limiter()
+    get_quota_ledger()
+    get_journal()
+    try:
+        session().head("https://api.twitter.com/2/tweets", timeout=10)
+    except requests.RequestException as e:
+        print(f"⚠️  Could not pre-connect to X API: {e}")
+
+def prepare_thread(thread_file_path, force=False, resume=False):
+    """Parse, validate, preflight and upload media for a thread without posting it.
+
+    Returns (prepared, None) when the thread is ready for publish_thread(), or
+    (None, True) when it is already published. Raises PostError when it can't be posted.
+    With resume, a journaled run that failed part-way is continued after its last tweet.
+    """
+    from .dedup_index import DedupIndex
+    from .similarity_index import SimilarityIndex, check_near_duplicates
+    from .x_media_upload import upload_all, validate_attachments
+    from .media_preprocess import preprocess_all
+
+    if not os.path.exists(thread_file_path):
+        raise report(PostError(f"Thread file not found: {thread_file_path}"))
+
+    print(f"📖 Reading thread from: {thread_file_path}")
+
+    thread = load_thread(thread_file_path)
+    tweets = [tweet['text'] for tweet in thread]
+
+    if not tweets:
+        raise report(PostError("No tweets found in thread file"))
+
     print(f"📝 Found {len(tweets)} tweets in thread")
 
-    # Post the thread
-    first_tweet_id = None
-    last_tweet_id = None
+    for i, tweet in enumerate(thread):
+        problems = validate_attachments(tweet['media'])
+        if problems:
+            raise report(PostError(f"Tweet {i+1} media: {'; '.join(problems)}"))
+
+    # A retry of a partly posted thread continues it: its first tweets are ours, not duplicates
+    resumed, posted_ids = get_journal().resumable(os.path.abspath(thread_file_path), tweets) if resume else (None, [])
+    if resumed:
+        print(f"↪️  Resuming journal thread #{resumed['id']} after tweet {len(posted_ids)}/{len(tweets)}")
+    remaining = tweets[len(posted_ids):]
+
+    # Preflight: check posting history before touching the network
+    index = DedupIndex()
+    if not force and check_already_posted(remaining, index):
+        unpublished, published = index.split_published(remaining)
+        if not unpublished:
+            return None, True
+        raise PostError(f"{len(published)}/{len(remaining)} tweets already published")
+
+    similar = SimilarityIndex()
+    if not force and check_near_duplicates(remaining, similar):
+        error = report(PostError("Thread is too close to an already-published post"))
+        print("   Use --force to post anyway")
+        raise error
+
+    # Refresh the OAuth2 token if it is close to expiry
+    if not auto_refresh_x_token():
+        print("⚠️  Token refresh failed, attempting with existing token...")
 
-    for i, tweet in enumerate(tweets):
-        print(f"📤 Posting tweet {i+1}/{len(tweets)}...")
+    # Don't start a thread the month's quota or the rate-limit window can't finish
+    if not check_quota(len(remaining)):
+        raise PostError("Monthly X write quota exhausted")
+
+    # Resolved once here and handed to every tweet, so posting never re-reads the .env
+    account = x_account()
+    available = get_rate_limiter().available(account, 'POST /2/tweets')
+    if available is not None and available < len(remaining):
+        reset_time = get_rate_limiter().reset_time(account, 'POST /2/tweets')
+        raise report(PostError(
+            f"Only {available} tweets left in the rate-limit window "
+            f"(resets {datetime.fromtimestamp(reset_time):%H:%M}), thread needs {len(remaining)}",
+            retry_after=max(0, reset_time - time.time())))
+
+    # Upload all media in parallel before tweet 1 so a failed upload never
+    # leaves a half-posted thread
+    media_paths = [path for tweet in thread[len(posted_ids):] for path in tweet['media']]
+    media_ids = {}
+    if media_paths:
+        print(f"🖼️  Uploading {len(set(media_paths))} media files...")
+        auth, headers = get_x_auth()
+        if auth is None and headers is None:
+            raise PostError("Missing X API credentials")
+        try:
+            # Upload the cached, platform-sized copy of each file
+            prepared = preprocess_all(media_paths, 'x')
+            uploaded = upload_all(list(prepared.values()), auth, headers)
+            media_ids = {path: uploaded[prepared[path]] for path in prepared}
+        except Exception as e:
+            raise report(PostError(f"Media upload failed: {e}"))
+
+    return {
+        'path': thread_file_path,
+        'tweets': tweets,
+        'media_ids': [[] for _ in posted_ids] + [[media_ids[path] for path in tweet['media']]
+                                                 for tweet in thread[len(posted_ids):]],
+        'account': account,
+        'journal': get_journal(),
+        'index': index,
+        'similar': similar,
+        'resume_thread': resumed['id'] if resumed else None,
+        'posted': posted_ids,
+    }, None
+
+def publish_thread(prepared, delay=2, on_posted=None, verify=True):
+    """Post a prepared thread as a reply chain; returns the posted tweet IDs.
+
+    Raises PostError when a tweet fails, with the IDs already posted and the journal entry attached.
+    """
+    from .posting_journal import COMPLETE, FAILED
+
+    tweets = prepared['tweets']
+    tweet_ids = list(prepared.get('posted', []))
+
+    # Journal every tweet as it goes out, so a broken run can be verified, rolled back or resumed
+    journal = prepared['journal']
+    if prepared.get('resume_thread'):
+        thread_id = prepared['resume_thread']
+        journal.reopen_thread(thread_id)
+    else:
+        thread_id = journal.start_thread(os.path.abspath(prepared['path']), len(tweets))
 
-        # Clean up the tweet text (remove numbering if it exists)
-        tweet_text = tweet
-        if tweet_text.startswith(('1/', '2/', '3/', '4/', '5/', '6/', '7/', '8/', '9/')):
-            # Remove the "1/7" part
-            lines = tweet_text.split('\n')
-            if lines:
-                lines[0] = ' '.join(lines[0].split()[1:])  # Remove first part
-                tweet_text = '\n'.join(lines).strip()
+    for i, tweet in enumerate(tweets[len(tweet_ids):], len(tweet_ids)):
+        print(f"📤 Posting tweet {i+1}/{len(tweets)}...")
 
         # Post the tweet
-        reply_to = last_tweet_id if i > 0 else None
-        tweet_id = post_tweet(tweet_text, reply_to)
-
-        if tweet_id:
-            if i == 0:
-                first_tweet_id = tweet_id
-            last_tweet_id = tweet_id
-            print(f"✅ Tweet {i+1} posted: https://twitter.com/i/web/status/{tweet_id}")
-
-            # Wait between tweets to avoid rate limits
-            if i < len(tweets) - 1:
-                time.sleep(2)
-        else:
+        reply_to = tweet_ids[-1] if tweet_ids else None
+        try:
+            tweet_id = send_tweet(tweet, reply_to, media_ids=prepared['media_ids'][i], account=prepared['account'])
+        except PostError as e:
+            report(e)
             print(f"❌ Failed to post tweet {i+1}")
-            return False
-
-    if first_tweet_id:
-        print(f"🎉 Thread posted successfully!")
-        print(f"Thread URL: https://twitter.com/i/web/status/{first_tweet_id}")
+            journal.finish_thread(thread_id, FAILED)
+            if tweet_ids:
+                print(f"   Delete the partial thread with: python3 scripts/rollback_thread.py {thread_id}")
+            e.tweet_ids, e.thread_id = tweet_ids, thread_id
+            raise
+
+        tweet_ids.append(tweet_id)
+        journal.record_tweet(thread_id, i + 1, tweet_id, reply_to, tweet)
+        if on_posted:
+            on_posted(i, tweet_id)
+        tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
+        print(f"✅ Tweet {i+1} posted: {tweet_url}")
+        prepared['index'].record(tweet, 'x', post_id=tweet_id, url=tweet_url, source=prepared['path'])
+        prepared['similar'].add(tweet, 'x', post_id=tweet_id, url=tweet_url, source=prepared['path'])
+
+        # Wait between tweets to avoid rate limits
+        if i < len(tweets) - 1:
+            time.sleep(delay)
+
+    journal.finish_thread(thread_id, COMPLETE)
+    print(f"🎉 Thread posted successfully!")
+    print(f"Thread URL: https://twitter.com/i/web/status/{tweet_ids[0]}")
+
+    if verify and len(tweet_ids) > 1:
+        ok, problems = verify_reply_chain(tweet_ids)
+        if ok is not None:
+            journal.record_verification(thread_id, ok, problems)
+    return tweet_ids
+
+def post_thread(thread_file_path, force=False, resume=False):
+    """Post a thread from a file"""
+    try:
+        prepared, result = prepare_thread(thread_file_path, force=force, resume=resume)
+        if prepared is None:
+            return result
+        publish_thread(prepared)
         return True
+    except PostError:
+        return False
 
-    return False
+def run(argv):
+    """Run the command line in-process; returns True on success"""
+    args = []
+    media = []
+    force = False
+    argv = iter(argv)
+    for arg in argv:
+        if arg == '--force':
+            force = True
+        elif arg == '--media':
+            media.append(next(argv, ''))
+        else:
+            args.append(arg)
 
-def main():
-    if len(sys.argv) < 2:
+    # "--help" would otherwise be posted as a tweet
+    wants_help = bool(args) and args[0] in ('-h', '--help')
+    if not args or wants_help:
         print("Usage:")
-        print("  Post single tweet: python3 post_x_thread.py 'Your tweet text here'")
+        print("  Post single tweet: python3 post_x_thread.py 'Your tweet text here' [--media image.png]")
         print("  Post thread:       python3 post_x_thread.py /path/to/thread.txt")
-        sys.exit(1)
+        print("  Stream a thread:   <generator> | python3 post_x_thread.py -")
+        print("  Re-post duplicates: add --force")
+        print("  Post as an account from oauth2_pkce_setup.py --account NAME: set X_ACCOUNT=NAME")
+        print()
+        print("Thread files attach media with 'MEDIA: path' lines inside a TWEET block")
+        return wants_help
 
-    input_arg = sys.argv[1]
+    input_arg = args[0]
+
+    if input_arg == '-':
+        # Post TWEET blocks from stdin as they are generated
+        from .stream_thread import stream_post
+        return stream_post(sys.stdin, force=force) is not None
 
     # Check if it's a file path or tweet text
     if os.path.exists(input_arg):
         # It's a file - post as thread
-        success = post_thread(input_arg)
+        success = post_thread(input_arg, force=force)
     else:
         # It's tweet text - post single tweet
-        tweet_id = post_tweet(input_arg)
-        if tweet_id:
-            print(f"🎉 Tweet posted successfully!")
-            print(f"Tweet URL: https://twitter.com/i/web/status/{tweet_id}")
-            success = True
-        else:
-            success = False
+        success = post_single_tweet(input_arg, media=media, force=force)
 
-    sys.exit(0 if success else 1)
+    return success
+
+def main():
+    sys.exit(0 if run(sys.argv[1:]) else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
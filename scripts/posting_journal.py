@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Posting journal for X threads
+Part of Claude AutoBlog SlashCommands Content Nuke
+Records every tweet of every thread as it is posted, plus reply-chain verification results
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "journal.db")
+
+# Thread states
+POSTING, COMPLETE, FAILED, ROLLED_BACK = 'posting', 'complete', 'failed', 'rolled_back'
+
+class PostingJournal:
+    """SQLite journal of threads and the tweets posted for them"""
+
+    def __init__(self, path=DB_PATH, shared=False):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=not shared)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS threads (
+                id INTEGER PRIMARY KEY,
+                source TEXT,
+                platform TEXT NOT NULL DEFAULT 'x',
+                planned INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                finished_at REAL,
+                verified INTEGER,
+                verify_detail TEXT,
+                verified_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS tweets (
+                thread_id INTEGER NOT NULL REFERENCES threads (id),
+                position INTEGER NOT NULL,
+                tweet_id TEXT NOT NULL,
+                reply_to TEXT,
+                text TEXT,
+                posted_at REAL NOT NULL,
+                deleted_at REAL,
+                PRIMARY KEY (thread_id, position)
+            );
+            CREATE INDEX IF NOT EXISTS tweets_id ON tweets (tweet_id);
+        """)
+
+    def start_thread(self, source, planned, platform='x'):
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO threads (source, platform, planned, status, started_at) VALUES (?, ?, ?, ?, ?)",
+                (source, platform, planned, POSTING, time.time()))
+        return cursor.lastrowid
+
+    def record_tweet(self, thread_id, position, tweet_id, reply_to=None, text=None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tweets (thread_id, position, tweet_id, reply_to, text, posted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (thread_id, position, tweet_id, reply_to, text, time.time()))
+
+    def finish_thread(self, thread_id, status):
+        with self.conn:
+            self.conn.execute("UPDATE threads SET status = ?, finished_at = ? WHERE id = ?",
+                              (status, time.time(), thread_id))
+
+    def reopen_thread(self, thread_id):
+        """Put a failed thread back into 'posting' to continue it"""
+        with self.conn:
+            self.conn.execute("UPDATE threads SET status = ?, finished_at = NULL WHERE id = ?", (POSTING, thread_id))
+
+    def resumable(self, source, tweets):
+        """(thread, posted tweet IDs) if the source's last run failed part-way through these tweets, else (None, [])"""
+        thread = self.latest_for_source(source)
+        if not thread or thread['status'] != FAILED:
+            return None, []
+        posted = self.tweets(thread['id'])
+        # Only an untouched prefix of the same thread can be continued
+        if (not posted or len(posted) >= len(tweets) or any(tweet['deleted_at'] for tweet in posted)
+                or [tweet['position'] for tweet in posted] != list(range(1, len(posted) + 1))
+                or [tweet['text'] for tweet in posted] != tweets[:len(posted)]):
+            return None, []
+        return thread, [tweet['tweet_id'] for tweet in posted]
+
+    def record_verification(self, thread_id, verified, detail):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE threads SET verified = ?, verify_detail = ?, verified_at = ? WHERE id = ?",
+                (int(verified), json.dumps(detail), time.time(), thread_id))
+
+    def mark_deleted(self, tweet_id):
+        with self.conn:
+            self.conn.execute("UPDATE tweets SET deleted_at = ? WHERE tweet_id = ?", (time.time(), tweet_id))
+
+    def get_thread(self, thread_id):
+        return self.conn.execute("SELECT * FROM threads WHERE id = ?", (thread_id,)).fetchone()
+
+    def latest_for_source(self, source):
+        return self.conn.execute(
+            "SELECT * FROM threads WHERE source = ? ORDER BY id DESC LIMIT 1",
+            (os.path.abspath(source),)).fetchone()
+
+    def find_by_tweet(self, tweet_id):
+        return self.conn.execute(
+            "SELECT threads.* FROM threads JOIN tweets ON tweets.thread_id = threads.id "
+            "WHERE tweets.tweet_id = ? ORDER BY threads.id DESC LIMIT 1", (tweet_id,)).fetchone()
+
+    def tweets(self, thread_id):
+        return self.conn.execute(
+            "SELECT * FROM tweets WHERE thread_id = ? ORDER BY position", (thread_id,)).fetchall()
+
+    def recent(self, limit=20):
+        return self.conn.execute("SELECT * FROM threads ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+
+def resolve_thread(journal, ref):
+    """A journal thread from its ID, a thread file path or any of its tweet IDs"""
+    if os.path.exists(ref):
+        return journal.latest_for_source(ref)
+    if ref.isdigit():
+        return journal.find_by_tweet(ref) or journal.get_thread(int(ref))
+    return None
+
+def verify(journal, thread):
+    """Check a journaled thread's reply chain with one batched lookup and record the result"""
+    from .post_x_thread import verify_reply_chain
+    tweet_ids = [tweet['tweet_id'] for tweet in journal.tweets(thread['id'])]
+    ok, problems = verify_reply_chain(tweet_ids)
+    if ok is not None:
+        journal.record_verification(thread['id'], ok, problems)
+    return ok, problems
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('list', 'show', 'verify'):
+        print("Usage:")
+        print("  Recent threads:      python3 posting_journal.py list")
+        print("  Thread details:      python3 posting_journal.py show <journal id|thread file|tweet id>")
+        print("  Verify reply chain:  python3 posting_journal.py verify <journal id|thread file|tweet id>")
+        sys.exit(1)
+
+    journal = PostingJournal()
+    command = sys.argv[1]
+
+    if command == 'list':
+        for thread in journal.recent():
+            posted = len(journal.tweets(thread['id']))
+            verified = {None: '', 1: '  ✅ chain verified', 0: '  ❌ chain broken'}[thread['verified']]
+            print(f"#{thread['id']:<4} {thread['status']:<11} {posted}/{thread['planned']} tweets  "
+                  f"{datetime.fromtimestamp(thread['started_at']):%Y-%m-%d %H:%M}  "
+                  f"{os.path.basename(thread['source'] or '')}{verified}")
+        return
+
+    thread = resolve_thread(journal, sys.argv[2]) if len(sys.argv) > 2 else None
+    if not thread:
+        print(f"❌ No journaled thread for: {sys.argv[2] if len(sys.argv) > 2 else ''}")
+        sys.exit(1)
+
+    if command == 'show':
+        print(f"#{thread['id']} {thread['status']} ({thread['source']})")
+        for tweet in journal.tweets(thread['id']):
+            deleted = '  [deleted]' if tweet['deleted_at'] else ''
+            print(f"  {tweet['position']}. https://twitter.com/i/web/status/{tweet['tweet_id']}{deleted}")
+        if thread['verify_detail']:
+            print(f"  Verification: {'ok' if thread['verified'] else json.loads(thread['verify_detail'])}")
+    else:
+        ok, problems = verify(journal, thread)
+        sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Cross-process rate-limit ledger for the X and LinkedIn APIs
+Part of Claude AutoBlog SlashCommands Content Nuke
+Every poster (scheduler, slash commands, batch runs) draws from one shared budget
+"""
+import os
+import sys
+import time
+import sqlite3
+from datetime import datetime
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "ratelimits.db")
+
+MAX_WAIT_SECONDS = 900       # wait out a 15-minute window, but never a daily one
+RETRY_AFTER_DEFAULT = 60     # 429 without reset headers
+
+class RateLimiter:
+    """Per-account, per-endpoint windows shared through SQLite.
+
+    Callers reserve a request with acquire() before sending and report the
+    response headers with update() afterwards. BEGIN IMMEDIATE serializes the
+    read-decrement-write across processes.
+    """
+
+    def __init__(self, path=DB_PATH, shared=False):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=not shared, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS windows (
+                account TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                limit_total INTEGER,
+                remaining INTEGER NOT NULL,
+                reset_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (account, endpoint)
+            )
+        """)
+
+    def _window(self, account, endpoint):
+        return self.conn.execute(
+            "SELECT * FROM windows WHERE account = ? AND endpoint = ?", (account, endpoint)).fetchone()
+
+    def try_acquire(self, account, endpoint, count=1):
+        """Reserve count requests; returns 0 on success, else seconds until the window resets"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            window = self._window(account, endpoint)
+            now = time.time()
+            if window is None or window['reset_at'] <= now:
+                # Unknown or expired window: let the request through, headers will tell us
+                self.conn.execute("COMMIT")
+                return 0
+            if window['remaining'] < count:
+                self.conn.execute("COMMIT")
+                return window['reset_at'] - now
+            self.conn.execute(
+                "UPDATE windows SET remaining = remaining - ?, updated_at = ? WHERE account = ? AND endpoint = ?",
+                (count, now, account, endpoint))
+            self.conn.execute("COMMIT")
+            return 0
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def acquire(self, account, endpoint, max_wait=MAX_WAIT_SECONDS):
+        """Reserve one request, sleeping until the window resets if needed; False if that is too long"""
+        while True:
+            wait = self.try_acquire(account, endpoint)
+            if not wait:
+                return True
+            if wait > max_wait:
+                return False
+            print(f"⏳ {endpoint} budget used up, waiting {wait:.0f}s for the window to reset...")
+            time.sleep(wait + 1)
+
+    def update(self, account, endpoint, limit, remaining, reset_at):
+        """Record a window from response headers, keeping reservations other processes made since"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            window = self._window(account, endpoint)
+            if window is not None and abs(window['reset_at'] - reset_at) < 1:
+                # Same window: requests other processes reserved may not be counted yet
+                remaining = min(remaining, window['remaining'])
+            self.conn.execute(
+                "INSERT OR REPLACE INTO windows (account, endpoint, limit_total, remaining, reset_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (account, endpoint, limit, remaining, reset_at, time.time()))
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def exhausted(self, account, endpoint, reset_at=None):
+        """Mark a window empty after a 429"""
+        window = self._window(account, endpoint)
+        limit = window['limit_total'] if window else None
+        self.update(account, endpoint, limit, 0, reset_at or time.time() + RETRY_AFTER_DEFAULT)
+
+    def available(self, account, endpoint):
+        """Requests left in the current window, or None if unknown/expired"""
+        window = self._window(account, endpoint)
+        if window is None or window['reset_at'] <= time.time():
+            return None
+        return window['remaining']
+
+    def reset_time(self, account, endpoint):
+        window = self._window(account, endpoint)
+        return window['reset_at'] if window else None
+
+    def all(self):
+        return self.conn.execute("SELECT * FROM windows ORDER BY account, endpoint").fetchall()
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] not in ('show', 'clear'):
+        print("Usage: python3 rate_limiter.py [show|clear]")
+        sys.exit(1)
+
+    limiter = RateLimiter()
+    if len(sys.argv) > 1 and sys.argv[1] == 'clear':
+        limiter.conn.execute("DELETE FROM windows")
+        print("🧹 Rate-limit ledger cleared")
+        return
+
+    now = time.time()
+    for window in limiter.all():
+        state = 'expired' if window['reset_at'] <= now else \
+            f"{window['remaining']}/{window['limit_total'] or '?'} left"
+        print(f"{window['account']:<24} {window['endpoint']:<28} {state:<14} "
+              f"resets {datetime.fromtimestamp(window['reset_at']):%Y-%m-%d %H:%M:%S}")
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,29 @@ Handles X (Twitter) and LinkedIn token refresh automatically
 """
 import os
 import sys
+import time
+import fcntl
+import tempfile
+import contextlib
 import requests
 import json
 from datetime import datetime, timedelta
 
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+from .post_common import select_x_account, x_oauth2_key
+
+WAYGATE_ENV_PATH = "/home/jeremy/waygate-mcp/.env"
+# Serializes refreshes and .env writes across every process and thread: X refresh
+# tokens are single-use, so two refreshers racing would invalidate each other
+LOCK_PATH = os.path.join(os.path.expanduser("~/.content-nuke"), "token-refresh.lock")
+
 def load_credentials_from_waygate():
     """Load all API credentials from waygate .env file"""
-    waygate_env_path = "/home/jeremy/waygate-mcp/.env"
+    waygate_env_path = WAYGATE_ENV_PATH
 
     if not os.path.exists(waygate_env_path):
         return {}
@@ -23,37 +39,78 @@ def load_credentials_from_waygate():
                 key, value = line.strip().split('=', 1)
                 creds[key] = value
 
-    return creds
+    # X_ACCOUNT picks which account's OAuth2 tokens the X_OAUTH2_* names refer to
+    return select_x_account(creds)
 
-def update_waygate_env(key, value):
-    """Update a specific key in waygate .env file"""
-    waygate_env_path = "/home/jeremy/waygate-mcp/.env"
+@contextlib.contextmanager
+def env_lock():
+    """Exclusive lock held around a refresh (read, request, write) or any .env update"""
+    os.makedirs(os.path.dirname(LOCK_PATH), exist_ok=True)
+    with open(LOCK_PATH, 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+def _write_waygate_env(updates):
+    """Set several keys in the waygate .env in one atomic replace; caller holds env_lock()"""
+    waygate_env_path = WAYGATE_ENV_PATH
 
     # Read all lines
     with open(waygate_env_path, 'r') as f:
         lines = f.readlines()
 
-    # Update the specific key
-    updated = False
+    # Update the keys that exist, add the rest
+    remaining = dict(updates)
     for i, line in enumerate(lines):
-        if line.startswith(f"{key}="):
-            lines[i] = f"{key}={value}\n"
-            updated = True
-            break
+        key = line.split('=', 1)[0]
+        if '=' in line and key in remaining:
+            lines[i] = f"{key}={remaining.pop(key)}\n"
+    lines.extend(f"{key}={value}\n" for key, value in remaining.items())
 
-    # If key doesn't exist, add it
-    if not updated:
-        lines.append(f"{key}={value}\n")
+    # Write back atomically: running posters may re-read the file at any moment
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(waygate_env_path), prefix='.env.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.writelines(lines)
+        os.chmod(tmp_path, os.stat(waygate_env_path).st_mode & 0o777)
+        os.replace(tmp_path, waygate_env_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
-    # Write back to file
-    with open(waygate_env_path, 'w') as f:
-        f.writelines(lines)
+def update_waygate_env(key, value):
+    """Update a specific key in waygate .env file"""
+    save_waygate_env({key: value})
+
+def save_waygate_env(updates):
+    """Set several keys in the waygate .env under the refresh lock, in one atomic replace"""
+    with env_lock():
+        _write_waygate_env(updates)
+
+def _still_valid(creds, expires_key, min_valid_seconds):
+    """True if a refresh made by another process while we waited for the lock already covers us"""
+    expires_at = creds.get(expires_key)
+    return (min_valid_seconds is not None and bool(expires_at)
+            and float(expires_at) - time.time() > min_valid_seconds)
+
+def refresh_x_token(min_valid_seconds=None):
+    """Refresh X (Twitter) OAuth2 access token.
+
+    With min_valid_seconds, skips the refresh if the token (re-read under the lock)
+    is still valid that long, e.g. because another process just refreshed it.
+    """
+    with env_lock():
+        return _refresh_x_token(min_valid_seconds)
+
+def _refresh_x_token(min_valid_seconds):
+    # Read inside the lock: the refresh token may have just been rotated
+    creds = load_credentials_from_waygate()
+    if _still_valid(creds, 'X_OAUTH2_EXPIRES_AT', min_valid_seconds):
+        return True
 
-def refresh_x_token():
-    """Refresh X (Twitter) OAuth2 access token"""
     print("🔄 Refreshing X API token...")
-
-    creds = load_credentials_from_waygate()
     client_id = creds.get('X_CLIENT_ID')
     client_secret = creds.get('X_CLIENT_SECRET')
     refresh_token = creds.get('X_OAUTH2_REFRESH_TOKEN')
@@ -77,9 +134,15 @@ def refresh_x_token():
         if response.status_code == 200:
             tokens = response.json()
 
-            # Update waygate .env with new tokens
-            update_waygate_env('X_OAUTH2_ACCESS_TOKEN', tokens['access_token'])
-            update_waygate_env('X_OAUTH2_REFRESH_TOKEN', tokens['refresh_token'])
+            # Update waygate .env with new tokens (one replace, so readers never see half of them),
+            # under the X_ACCOUNT account's names if one is selected
+            _write_waygate_env({
+                x_oauth2_key('ACCESS_TOKEN'): tokens['access_token'],
+                x_oauth2_key('REFRESH_TOKEN'): tokens['refresh_token'],
+                # Lets posters skip the refresh while the token is still fresh
+                x_oauth2_key('EXPIRES_AT'): str(int(time.time()) + int(tokens['expires_in'])),
+                x_oauth2_key('ISSUED_AT'): str(int(time.time())),
+            })
 
             print(f"✅ X token refreshed successfully")
             print(f"   New token expires in: {tokens['expires_in']} seconds (2 hours)")
@@ -93,11 +156,17 @@ def refresh_x_token():
         print(f"❌ Error refreshing X token: {e}")
         return False
 
-def refresh_linkedin_token():
-    """Refresh LinkedIn access token"""
-    print("🔄 Refreshing LinkedIn API token...")
+def refresh_linkedin_token(min_valid_seconds=None):
+    """Refresh LinkedIn access token (see refresh_x_token for min_valid_seconds)"""
+    with env_lock():
+        return _refresh_linkedin_token(min_valid_seconds)
 
+def _refresh_linkedin_token(min_valid_seconds):
     creds = load_credentials_from_waygate()
+    if _still_valid(creds, 'LINKEDIN_EXPIRES_AT', min_valid_seconds):
+        return True
+
+    print("🔄 Refreshing LinkedIn API token...")
     client_id = creds.get('LINKEDIN_CLIENT_ID')
     client_secret = creds.get('LINKEDIN_CLIENT_SECRET')
     refresh_token = creds.get('LINKEDIN_REFRESH_TOKEN')
@@ -124,9 +193,13 @@ def refresh_linkedin_token():
             tokens = response.json()
 
             # Update waygate .env with new tokens
-            update_waygate_env('LINKEDIN_ACCESS_TOKEN', tokens['access_token'])
+            updates = {'LINKEDIN_ACCESS_TOKEN': tokens['access_token']}
             if 'refresh_token' in tokens:
-                update_waygate_env('LINKEDIN_REFRESH_TOKEN', tokens['refresh_token'])
+                updates['LINKEDIN_REFRESH_TOKEN'] = tokens['refresh_token']
+            if 'expires_in' in tokens:
+                updates['LINKEDIN_EXPIRES_AT'] = str(int(time.time()) + int(tokens['expires_in']))
+            updates['LINKEDIN_ISSUED_AT'] = str(int(time.time()))
+            _write_waygate_env(updates)
 
             print(f"✅ LinkedIn token refreshed successfully")
             print(f"   New token expires in: {tokens.get('expires_in', '60 days')} seconds")
@@ -157,23 +230,27 @@ def check_token_expiry():
 
     return x_success and linkedin_success
 
-def main():
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "x":
+def run(argv):
+    """Run the command line in-process; returns True on success"""
+    if argv:
+        if argv[0] == "x":
             success = refresh_x_token()
-        elif sys.argv[1] == "linkedin":
+        elif argv[0] == "linkedin":
             success = refresh_linkedin_token()
-        elif sys.argv[1] == "check":
+        elif argv[0] == "check":
             success = check_token_expiry()
         else:
             print("Usage: python3 refresh_tokens.py [x|linkedin|check]")
-            sys.exit(1)
+            return False
     else:
         # Default: refresh all tokens
         success = check_token_expiry()
 
     print(f"\n{'✅' if success else '❌'} Token refresh {'completed' if success else 'failed'}")
-    sys.exit(0 if success else 1)
+    return success
+
+def main():
+    sys.exit(0 if run(sys.argv[1:]) else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Incremental reply and mention poller for our X threads
+Part of Claude AutoBlog SlashCommands Content Nuke
+Fetches only new replies and mentions using persisted since_id cursors
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+SEARCH_WINDOW_SECONDS = 7 * 24 * 3600    # recent search only reaches back 7 days
+MAX_QUERY_LENGTH = 512
+PAGE_SIZE = 100
+TWEET_FIELDS = 'conversation_id,author_id,created_at,in_reply_to_user_id,referenced_tweets'
+
+def conversation_roots(now=None):
+    """IDs of our threads and single tweets recent enough to search: {root_id: posted_at}"""
+    from .dedup_index import DedupIndex
+    from .posting_journal import PostingJournal
+    from .post_common import iso_timestamp
+
+    cutoff = (now or time.time()) - SEARCH_WINDOW_SECONDS
+    roots = {}
+
+    journal = PostingJournal()
+    for row in journal.conn.execute(
+            "SELECT tweet_id, posted_at FROM tweets WHERE position = 1 AND deleted_at IS NULL AND posted_at >= ?",
+            (cutoff,)):
+        roots[row['tweet_id']] = row['posted_at']
+
+    # Single tweets (and threads from before the journal): one entry per source is a root
+    by_source = {}
+    for entry in DedupIndex().entries.values():
+        if entry.get('platform') == 'x' and entry.get('post_id'):
+            by_source.setdefault(entry.get('source') or entry['post_id'], []).append(entry)
+    for entries in by_source.values():
+        first = min(entries, key=lambda entry: int(entry['post_id']))
+        posted_at = iso_timestamp(first.get('posted_at'))
+        if posted_at and posted_at >= cutoff:
+            roots.setdefault(first['post_id'], posted_at)
+    return roots
+
+def batch_queries(cursors):
+    """Group conversations into OR-queries under the length limit, neighbours by cursor first"""
+    batches, current = [], []
+    for root in sorted(cursors, key=lambda root: int(cursors[root])):
+        candidate = current + [root]
+        query = ' OR '.join(f"conversation_id:{r}" for r in candidate) + ' -is:retweet'
+        if current and len(query) > MAX_QUERY_LENGTH:
+            batches.append(current)
+            candidate = [root]
+        current = candidate
+    if current:
+        batches.append(current)
+    return batches
+
+def fetch_pages(url, params, endpoint, token_param):
+    """All pages newer than since_id; returns (tweets, usernames, newest_id) or None on failure"""
+    from .post_x_thread import x_get
+
+    tweets, users, newest_id = [], {}, None
+    params = dict(params, max_results=PAGE_SIZE, expansions='author_id', **{'tweet.fields': TWEET_FIELDS})
+    while True:
+        body = x_get(url, params, endpoint)
+        if body is None:
+            return None
+        tweets.extend(body.get('data', []))
+        users.update((user['id'], user['username']) for user in body.get('includes', {}).get('users', []))
+        meta = body.get('meta', {})
+        newest_id = newest_id or meta.get('newest_id')   # the first page holds the newest
+        if not meta.get('next_token') or 'since_id' not in params:
+            return tweets, users, newest_id   # first run of a cursor: one page is enough to seed it
+        params[token_param] = meta['next_token']
+
+def my_user_id():
+    from . import post_x_thread
+    account = post_x_thread.x_account()
+    if account.split(':', 1)[1].isdigit():
+        return account.split(':', 1)[1]
+    body = post_x_thread.x_get("https://api.twitter.com/2/users/me", {}, 'GET /2/users/me')
+    return body['data']['id'] if body else None
+
+def _as_reply(tweet, users, kind):
+    replied_to = [ref['id'] for ref in tweet.get('referenced_tweets', []) if ref['type'] == 'replied_to']
+    return {
+        'id': tweet['id'],
+        'kind': kind,
+        'conversation_id': tweet.get('conversation_id'),
+        'in_reply_to': replied_to[0] if replied_to else None,
+        'author_id': tweet.get('author_id'),
+        'author_username': users.get(tweet.get('author_id')),
+        'text': tweet.get('text'),
+        'created_at': tweet.get('created_at'),
+    }
+
+def poll(store=None):
+    """One polling pass over replies and mentions; returns the number of new items"""
+    from .analytics_store import AnalyticsStore
+
+    store = store or AnalyticsStore()
+    user_id = my_user_id()
+    if not user_id:
+        return 0
+
+    roots = conversation_roots()
+    cursors = {root: store.get_cursor(f"x:conversation:{root}") or root for root in roots}
+    found = []
+    new_cursors = {}
+
+    for batch in batch_queries(cursors):
+        query = ' OR '.join(f"conversation_id:{root}" for root in batch) + ' -is:retweet'
+        since_id = min((cursors[root] for root in batch), key=int)
+        result = fetch_pages(SEARCH_URL, {'query': query, 'since_id': since_id},
+                             'GET /2/tweets/search/recent', 'next_token')
+        if result is None:
+            break
+        tweets, users, newest_id = result
+        found.extend(_as_reply(tweet, users, 'reply') for tweet in tweets
+                     if tweet.get('author_id') != user_id and int(tweet['id']) > int(cursors.get(tweet.get('conversation_id'), 0)))
+        # The search covered every conversation in the batch up to newest_id
+        if newest_id:
+            new_cursors.update({f"x:conversation:{root}": newest_id for root in batch})
+
+    mentions_cursor = store.get_cursor(f"x:mentions:{user_id}")
+    params = {'since_id': mentions_cursor} if mentions_cursor else {}
+    result = fetch_pages(f"https://api.twitter.com/2/users/{user_id}/mentions", params,
+                         'GET /2/users/:id/mentions', 'pagination_token')
+    if result is not None:
+        tweets, users, newest_id = result
+        # Mentions inside our own threads are already stored as replies
+        found.extend(_as_reply(tweet, users, 'mention') for tweet in tweets
+                     if tweet.get('conversation_id') not in roots)
+        if newest_id:
+            new_cursors[f"x:mentions:{user_id}"] = newest_id
+
+    new_items = store.add_replies('x', found)
+    store.set_cursors(new_cursors)
+    print(f"💬 {new_items} new replies/mentions across {len(roots)} conversations")
+    return new_items
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] not in ('poll', 'show'):
+        print("Usage: python3 reply_poller.py [poll|show]")
+        print("  poll: fetch new replies to our threads and new mentions (run from cron)")
+        print("  show: latest stored replies and mentions")
+        sys.exit(1)
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'show':
+        from .analytics_store import AnalyticsStore
+        for reply in AnalyticsStore().recent_replies():
+            first_line = (reply['text'] or '').strip().split('\n')[0][:100]
+            print(f"{reply['created_at'] or '':<25} @{reply['author_username'] or reply['author_id']} "
+                  f"({reply['kind']}): {first_line}")
+            print(f"   https://twitter.com/i/web/status/{reply['reply_id']}")
+        return
+
+    started = time.time()
+    poll()
+    print(f"✅ Poll finished in {time.time() - started:.1f}s ({datetime.now():%H:%M:%S})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Roll back a partially posted X thread
+Part of Claude AutoBlog SlashCommands Content Nuke
+Deletes every tweet of a failed thread concurrently, within the delete rate limit
+"""
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+DELETE_WORKERS = 4
+DELETE_ENDPOINT = 'DELETE /2/tweets/:id'
+
+_local = threading.local()
+
+def _session():
+    """One requests session per worker thread so connections are reused"""
+    import requests
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+def delete_tweet(tweet_id, auth, headers):
+    """Delete one tweet; returns 'deleted', 'gone' (already deleted) or an error string"""
+    from . import post_x_thread
+
+    limiter = post_x_thread.get_rate_limiter()
+    if not limiter.acquire(post_x_thread.x_account(), DELETE_ENDPOINT):
+        return 'rate limited'
+
+    url = f"https://api.twitter.com/2/tweets/{tweet_id}"
+    try:
+        if auth:  # OAuth 1.0a
+            response = _session().delete(url, auth=auth)
+        else:  # OAuth2 Bearer token
+            response = _session().delete(url, headers=headers)
+    except Exception as e:
+        return str(e)
+
+    post_x_thread.record_rate_limit(DELETE_ENDPOINT, response)
+    if response.status_code == 200 and response.json().get('data', {}).get('deleted'):
+        return 'deleted'
+    if response.status_code == 404:
+        return 'gone'
+    return f"{response.status_code}: {response.text[:200]}"
+
+def find_tweets(ref):
+    """(journal thread or None, [tweet IDs]) from a journal ID, thread file or tweet ID"""
+    from .posting_journal import PostingJournal, resolve_thread
+    from .dedup_index import DedupIndex
+
+    journal = PostingJournal()
+    thread = resolve_thread(journal, ref)
+    if thread:
+        return thread, [tweet['tweet_id'] for tweet in journal.tweets(thread['id']) if not tweet['deleted_at']]
+
+    # Posted before the journal existed: fall back to the dedup index's records for the file
+    if os.path.exists(ref):
+        index = DedupIndex()
+        sources = (ref, os.path.abspath(ref))
+        return None, [entry['post_id'] for entry in index.entries.values()
+                      if entry.get('source') in sources and entry.get('platform') == 'x' and entry.get('post_id')]
+    return None, []
+
+def ask(question):
+    """y/N prompt; anything but 'y' (or no terminal to ask on) is a no"""
+    try:
+        return input(f"{question} (y/N): ").strip().lower() == 'y'
+    except EOFError:
+        return False
+
+def rollback(ref, workers=DELETE_WORKERS, force=False, confirm=ask):
+    """Delete all tweets of a failed or interrupted thread; returns {tweet_id: outcome}.
+
+    A complete thread is refused unless force is set. Without a journal entry the tweets
+    come from the dedup index, so they are listed and confirm() must agree first.
+    """
+    from . import post_x_thread
+    from .posting_journal import PostingJournal, ROLLED_BACK, FAILED, POSTING
+    from .dedup_index import DedupIndex
+    from .similarity_index import SimilarityIndex
+
+    thread, tweet_ids = find_tweets(ref)
+    if not tweet_ids:
+        print(f"ℹ️  No posted tweets found for {ref}")
+        return {}
+
+    if thread and thread['status'] not in (FAILED, POSTING) and not force:
+        print(f"❌ Journal thread #{thread['id']} is {thread['status']}, not a failed or partial post")
+        print("   Use --force to delete it anyway")
+        return {}
+
+    if not thread:
+        # The index holds every X post ever recorded for the file, earlier complete threads included
+        entries = {entry['post_id']: entry for entry in DedupIndex().entries.values() if entry.get('post_id') in tweet_ids}
+        print(f"⚠️  No journal entry for {ref}; the dedup index records {len(tweet_ids)} tweets for it:")
+        for tweet_id in tweet_ids:
+            entry = entries.get(tweet_id, {})
+            print(f"   {tweet_id}  {entry.get('posted_at', '')}  {entry.get('preview', '')[:60]}")
+        if not confirm(f"Delete all {len(tweet_ids)} tweets?"):
+            print("🚫 Nothing deleted")
+            return {}
+
+    auth, headers = post_x_thread.get_x_auth()
+    if auth is None and headers is None:
+        return {}
+
+    print(f"🗑️  Deleting {len(tweet_ids)} tweets...")
+    with ThreadPoolExecutor(max_workers=min(workers, len(tweet_ids))) as pool:
+        outcomes = dict(zip(tweet_ids, pool.map(lambda tweet_id: delete_tweet(tweet_id, auth, headers), tweet_ids)))
+
+    removed = [tweet_id for tweet_id, outcome in outcomes.items() if outcome in ('deleted', 'gone')]
+    journal = PostingJournal()
+    for tweet_id in removed:
+        journal.mark_deleted(tweet_id)
+    if thread and len(removed) == len(tweet_ids):
+        journal.finish_thread(thread['id'], ROLLED_BACK)
+
+    # Deleted text may be posted again
+    DedupIndex().forget(removed)
+    SimilarityIndex().forget(removed)
+    return outcomes
+
+def print_report(outcomes):
+    icons = {'deleted': '✅', 'gone': '⚪'}
+    for tweet_id, outcome in outcomes.items():
+        print(f"   {icons.get(outcome, '❌')} {tweet_id}: {outcome}")
+    failed = [tweet_id for tweet_id, outcome in outcomes.items() if outcome not in icons]
+    if failed:
+        print(f"⚠️  {len(failed)}/{len(outcomes)} tweets still live; re-run to retry")
+    else:
+        print(f"🎉 Thread rolled back ({len(outcomes)} tweets removed)")
+    return not failed
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != '--force']
+    if not args:
+        print("Usage: python3 rollback_thread.py <journal id | thread file | any tweet ID of the thread> [--force]")
+        print("Deletes every posted tweet of a failed thread (see: python3 posting_journal.py list)")
+        print("  --force: also delete a thread the journal records as complete")
+        sys.exit(1)
+
+    outcomes = rollback(args[0], force='--force' in sys.argv[1:])
+    sys.exit(0 if outcomes and print_report(outcomes) else 1)
+
+if __name__ == "__main__":
+    main()
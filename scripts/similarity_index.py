@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection against posting history with MinHash/LSH
+Part of Claude AutoBlog SlashCommands Content Nuke
+Finds reworded repeats of published posts without pairwise comparison
+"""
+import os
+import re
+import sys
+import sqlite3
+import hashlib
+from array import array
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+from .dedup_index import normalize_text, parse_posted_record, DEFAULT_SEED_DIRS
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "similarity.db")
+
+NUM_PERM = 128
+BANDS = 32                      # 32 bands x 4 rows: candidates from ~0.4 Jaccard up
+ROWS = NUM_PERM // BANDS
+MERSENNE_BITS = 61
+MERSENNE_PRIME = (1 << MERSENNE_BITS) - 1
+MAX_HASH = (1 << 32) - 1
+
+WARN_SIMILARITY = 0.5
+BLOCK_SIMILARITY = 0.85
+
+def _make_permutations():
+    """Deterministic (a, b) pairs so signatures stay comparable across runs"""
+    perms = []
+    seed = b'content-nuke-minhash'
+    for i in range(NUM_PERM):
+        digest = hashlib.blake2b(seed + i.to_bytes(2, 'big'), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], 'big') % (MERSENNE_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:], 'big') % MERSENNE_PRIME
+        perms.append((a, b))
+    return perms
+
+PERMUTATIONS = _make_permutations()
+
+# All permutations side by side in one big int, one 128-bit slot each, so a shingle
+# goes through every permutation in a handful of big-int operations instead of 128
+SLOT_BITS = 128
+
+def _pack(values):
+    return sum(value << (SLOT_BITS * i) for i, value in enumerate(values))
+
+PACKED_A = _pack([a for a, _ in PERMUTATIONS])
+PACKED_B = _pack([b for _, b in PERMUTATIONS])
+PACKED_PRIME = _pack([MERSENNE_PRIME] * NUM_PERM)
+PACKED_ONES = _pack([1] * NUM_PERM)
+PACKED_GUARD = PACKED_ONES << (SLOT_BITS - 1)
+
+def _permute(h):
+    """Packed (a * h + b) % MERSENNE_PRIME for every permutation; h must be below MERSENNE_PRIME"""
+    x = PACKED_A * h + PACKED_B    # each slot stays below MERSENNE_PRIME ** 2, so no carry crosses slots
+    x = (x & PACKED_PRIME) + (x >> MERSENNE_BITS & PACKED_PRIME)    # Mersenne fold: now below 2 * prime
+    return (x + ((x + PACKED_ONES) >> MERSENNE_BITS & PACKED_ONES)) & PACKED_PRIME   # minus prime where >= prime
+
+def shingles(text):
+    """Word bigram shingles of the normalized text (unigrams for one-word posts)"""
+    # URLs differ between reposts of the same idea, so they don't count
+    words = re.findall(r'\w+', re.sub(r'https?://\S+', ' ', normalize_text(text)))
+    if len(words) < 2:
+        return set(words)
+    return {f"{words[i]} {words[i + 1]}" for i in range(len(words) - 1)}
+
+def minhash(text):
+    """MinHash signature (array of NUM_PERM 32-bit ints) for text"""
+    signature = None
+    for s in shingles(text):
+        h = int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big') % MERSENNE_PRIME
+        values = _permute(h)
+        if signature is None:
+            signature = values
+            continue
+        # Slot-wise min: the guard bit survives the subtraction only where signature >= values
+        take = ((signature | PACKED_GUARD) - values) >> (SLOT_BITS - 1) & PACKED_ONES
+        signature ^= (signature ^ values) & (take * MERSENNE_PRIME)
+    if signature is None:
+        return array('I', [MAX_HASH] * NUM_PERM)
+
+    words = array('Q')
+    words.frombytes(signature.to_bytes(SLOT_BITS // 8 * NUM_PERM, 'little'))
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return array('I', [value & MAX_HASH for value in words[::SLOT_BITS // 64]])
+
+def band_keys(signature):
+    """One stable bucket key per LSH band"""
+    keys = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS:(band + 1) * ROWS].tobytes()
+        keys.append(int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), 'big', signed=True))
+    return keys
+
+def estimate_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity from two signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+class SimilarityIndex:
+    """SQLite-backed MinHash/LSH index over published posts"""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                platform TEXT NOT NULL,
+                post_id TEXT,
+                url TEXT,
+                source TEXT,
+                posted_at TEXT NOT NULL,
+                preview TEXT,
+                signature BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                post INTEGER NOT NULL REFERENCES posts(id)
+            );
+            CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def add(self, text, platform, post_id=None, url=None, source=None, posted_at=None):
+        """Index a published post; one row per band, no rebuild needed"""
+        if not shingles(text):
+            return None
+        signature = minhash(text)
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO posts (platform, post_id, url, source, posted_at, preview, signature) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (platform, post_id, url, source,
+                 posted_at or datetime.now().isoformat(timespec='seconds'),
+                 text.strip()[:120], signature.tobytes()))
+            row_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO buckets (band, bucket, post) VALUES (?, ?, ?)",
+                [(band, key, row_id) for band, key in enumerate(band_keys(signature))])
+        return row_id
+
+    def forget(self, post_ids):
+        """Remove deleted posts from the index; returns the count"""
+        post_ids = list(post_ids)
+        marks = ", ".join("?" * len(post_ids))
+        with self.conn:
+            rows = [row[0] for row in self.conn.execute(
+                f"SELECT id FROM posts WHERE post_id IN ({marks})", post_ids)]
+            self.conn.executemany("DELETE FROM buckets WHERE post = ?", [(row,) for row in rows])
+            self.conn.executemany("DELETE FROM posts WHERE id = ?", [(row,) for row in rows])
+        return len(rows)
+
+    def query(self, text, limit=5, min_similarity=0.0):
+        """Most similar published posts as (similarity, record) pairs, best first"""
+        signature = minhash(text)
+        keys = band_keys(signature)
+
+        clauses = " OR ".join(["(band = ? AND bucket = ?)"] * BANDS)
+        params = [value for band, key in enumerate(keys) for value in (band, key)]
+        rows = self.conn.execute(
+            f"SELECT DISTINCT p.id, p.platform, p.post_id, p.url, p.source, p.posted_at, p.preview, p.signature "
+            f"FROM buckets b JOIN posts p ON p.id = b.post WHERE {clauses}", params).fetchall()
+
+        results = []
+        for row in rows:
+            candidate = array('I')
+            candidate.frombytes(row[7])
+            similarity = estimate_similarity(signature, candidate)
+            if similarity >= min_similarity:
+                results.append((similarity, {
+                    'platform': row[1], 'post_id': row[2], 'url': row[3],
+                    'source': row[4], 'posted_at': row[5], 'preview': row[6],
+                }))
+        results.sort(key=lambda item: item[0], reverse=True)
+        return results[:limit]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+def check_near_duplicates(texts, index, label='Tweet'):
+    """Print near-duplicate matches; returns True if any match is close enough to block"""
+    blocked = False
+    for i, text in enumerate(texts, 1):
+        if not shingles(text):
+            continue
+        matches = index.query(text, limit=3, min_similarity=WARN_SIMILARITY)
+        for similarity, record in matches:
+            where = record.get('url') or record.get('post_id') or record.get('source')
+            marker = "🛑" if similarity >= BLOCK_SIMILARITY else "⚠️ "
+            print(f"{marker} {label} {i} is {similarity:.0%} similar to a {record['platform']} post "
+                  f"from {record['posted_at']}: {where}")
+            print(f"      \"{record['preview'][:80]}\"")
+            if similarity >= BLOCK_SIMILARITY:
+                blocked = True
+    return blocked
+
+def seed_from_dirs(index, dirs=None):
+    """Index posting records from x-posts/ style directories"""
+    added = 0
+    known = {row[0] for row in index.conn.execute("SELECT source FROM posts WHERE source IS NOT NULL")}
+    for directory in dirs or DEFAULT_SEED_DIRS:
+        if not os.path.isdir(directory):
+            print(f"⚠️  Skipping missing directory: {directory}")
+            continue
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not name.endswith('.txt') or path in known:
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                record = parse_posted_record(f.read())
+            if record:
+                platform, text, post_id, url = record
+                index.add(text, platform, post_id=post_id, url=url, source=path)
+                added += 1
+    return added
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Seed from records: python3 similarity_index.py seed [dir ...]")
+        print("  Find similar:      python3 similarity_index.py query 'draft text' | /path/to/thread.txt")
+        print("  Show stats:        python3 similarity_index.py stats")
+        sys.exit(1)
+
+    index = SimilarityIndex()
+    command = sys.argv[1]
+
+    if command == "seed":
+        added = seed_from_dirs(index, sys.argv[2:])
+        print(f"✅ Indexed {added} posts ({len(index)} total in {index.path})")
+    elif command == "query" and len(sys.argv) > 2:
+        target = sys.argv[2]
+        if os.path.exists(target):
+            from .post_x_thread import load_thread_tweets
+            texts = load_thread_tweets(target)
+        else:
+            texts = [target]
+        if not check_near_duplicates(texts, index):
+            print("✅ No blocking near-duplicates found")
+    elif command == "stats":
+        print(f"📊 {len(index)} posts indexed in {index.path}")
+    else:
+        print("Usage: python3 similarity_index.py [seed|query|stats]")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Startup-time budget check for the content-nuke CLI
+Part of Claude AutoBlog SlashCommands Content Nuke
+Runs the CLI under -X importtime and fails if imports exceed the budget
+"""
+import os
+import sys
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUDGET_MS = 30               # cumulative import time of the CLI's own modules per invocation
+# The bare CLI plus a real subcommand path, which imports its module before parsing arguments
+CHECKS = (['--help'], ['post-x', '--help'])
+HEAVY_MODULES = ('requests', 'requests_oauthlib', 'http.server', 'sqlite3', 'concurrent.futures')
+
+def measure(cli_args):
+    """Run the CLI with -X importtime; returns {module: cumulative_us} for top-level imports"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         'import sys; from scripts.cli import main; main(sys.argv[1:])'] + cli_args,
+        cwd=REPO_ROOT, capture_output=True, text=True)
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports[name.rstrip()] = int(cumulative_us)
+    return imports
+
+def check(cli_args, budget_ms=BUDGET_MS):
+    imports = measure(cli_args)
+    # Interpreter startup (site, encodings) is a fixed cost; only the CLI's own
+    # top-level imports count against the budget
+    total_ms = sum(us for name, us in imports.items() if name.startswith(' scripts')) / 1000
+    heavy = [name.strip() for name in imports if name.strip() in HEAVY_MODULES]
+
+    label = ' '.join(cli_args) or '(no args)'
+    print(f"⏱️  content-nuke {label}: {total_ms:.1f} ms of imports (budget {budget_ms} ms)")
+    for name in heavy:
+        print(f"   ❌ imports heavy module {name}")
+    return total_ms <= budget_ms and not heavy
+
+def main():
+    ok = all([check(cli_args) for cli_args in CHECKS])
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Streaming thread posting from stdin or a pipe
+Part of Claude AutoBlog SlashCommands Content Nuke
+Posts each "TWEET n/N:" block as soon as it is complete, chaining replies as it goes
+"""
+import os
+import re
+import sys
+import time
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+TWEET_HEADER = re.compile(r'^\s*TWEET (\d+)/(\d+):\s*(.*)$')
+MAX_TWEET_LENGTH = 280
+URL_PATTERN = re.compile(r'https?://\S+')
+URL_LENGTH = 23              # t.co wraps every link to this length
+
+def tweet_length(text):
+    """Length as X counts it: links count 23, emoji and CJK count 2"""
+    text = URL_PATTERN.sub('x' * URL_LENGTH, text)
+    length = 0
+    for char in text:
+        code = ord(char)
+        if code <= 0x10FF or 0x2000 <= code <= 0x200D or 0x2010 <= code <= 0x201F or 0x2032 <= code <= 0x2037:
+            length += 1
+        else:
+            length += 2
+    return length
+
+def iter_blocks(lines):
+    """Yield each TWEET block once complete: at the next header, a --- / ===== separator, or end of input"""
+    block = None
+    for line in lines:
+        line = line.rstrip('\n')
+        match = TWEET_HEADER.match(line)
+        if match:
+            if block:
+                yield block
+            block = {'number': int(match.group(1)), 'total': int(match.group(2)), 'lines': [match.group(3)]}
+        elif block and (line.strip() == '---' or line.startswith('=====')):
+            yield block
+            block = None
+        elif block is not None:
+            block['lines'].append(line)
+    if block:
+        yield block
+
+def validate_block(block, expected_number, total, text, media):
+    """Return a list of problems with a streamed tweet (empty if postable)"""
+    from .x_media_upload import validate_attachments
+
+    problems = []
+    if block['number'] != expected_number:
+        problems.append(f"expected TWEET {expected_number}/{total}, got {block['number']}/{block['total']}")
+    if total and block['total'] != total:
+        problems.append(f"thread length changed from {total} to {block['total']}")
+    if not text and not media:
+        problems.append("empty tweet")
+    length = tweet_length(text)
+    if length > MAX_TWEET_LENGTH:
+        problems.append(f"{length} characters (limit {MAX_TWEET_LENGTH})")
+    problems.extend(validate_attachments(media))
+    return problems
+
+def stream_post(lines, base_dir=None, force=False, delay=2):
+    """Validate and post tweets as their blocks arrive; returns the posted tweet IDs, or None on failure"""
+    from . import post_x_thread
+    from .post_x_thread import clean_tweet_text
+    from .post_common import split_media_lines
+    from .dedup_index import DedupIndex
+    from .similarity_index import SimilarityIndex, check_near_duplicates
+    from .posting_journal import PostingJournal, COMPLETE, FAILED
+
+    base_dir = base_dir or os.getcwd()
+    index = DedupIndex()
+    similar = SimilarityIndex()
+    journal = PostingJournal()
+    thread_id = None
+    tweet_ids = []
+    total = None
+    last_posted_at = 0
+
+    # Credentials, token refresh and connections before the first block arrives
+    if not post_x_thread.auto_refresh_x_token():
+        print("⚠️  Token refresh failed, attempting with existing token...")
+    post_x_thread.warm_up()
+    print("📡 Waiting for TWEET blocks on stdin...")
+
+    for block in iter_blocks(lines):
+        number = len(tweet_ids) + 1
+        text, media = split_media_lines('\n'.join(block['lines']).strip(), base_dir)
+        text = clean_tweet_text(text)
+
+        problems = validate_block(block, number, total, text, media)
+        if not problems and not force:
+            record = index.lookup(text)
+            if record:
+                problems.append(f"already posted on {record['posted_at']}: {record.get('url') or record.get('post_id')}")
+            elif check_near_duplicates([text], similar):
+                problems.append("too close to an already-published post")
+        if problems:
+            print(f"❌ Tweet {number}: {'; '.join(problems)}")
+            break
+
+        if total is None:
+            # The header gives the thread length: check it fits before tweet 1
+            total = block['total']
+            if not post_x_thread.check_quota(total):
+                break
+            limiter = post_x_thread.get_rate_limiter()
+            available = limiter.available(post_x_thread.x_account(), 'POST /2/tweets')
+            if available is not None and available < total:
+                print(f"❌ Only {available} tweets left in the rate-limit window, thread needs {total}")
+                break
+            thread_id = journal.start_thread('stdin', total)
+
+        media_ids = []
+        if media:
+            from .x_media_upload import upload_all
+            from .media_preprocess import preprocess_all
+            try:
+                prepared = preprocess_all(media, 'x')
+                media_ids = list(upload_all(list(prepared.values()), *post_x_thread.get_x_auth()).values())
+            except Exception as e:
+                print(f"❌ Tweet {number} media upload failed: {e}")
+                break
+
+        # Generation is usually slower than this, but keep the usual spacing
+        wait = last_posted_at + delay - time.time()
+        if wait > 0:
+            time.sleep(wait)
+
+        print(f"📤 Posting tweet {number}/{total}...")
+        tweet_id = post_x_thread.post_tweet(text, tweet_ids[-1] if tweet_ids else None, media_ids=media_ids)
+        if not tweet_id:
+            print(f"❌ Failed to post tweet {number}")
+            break
+        last_posted_at = time.time()
+        journal.record_tweet(thread_id, number, tweet_id, tweet_ids[-1] if tweet_ids else None, text)
+        tweet_ids.append(tweet_id)
+        tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
+        print(f"✅ Tweet {number} posted: {tweet_url}")
+        index.record(text, 'x', post_id=tweet_id, url=tweet_url, source='stdin')
+        similar.add(text, 'x', post_id=tweet_id, url=tweet_url, source='stdin')
+
+        if number == total:
+            journal.finish_thread(thread_id, COMPLETE)
+            print(f"🎉 Thread posted successfully!")
+            print(f"Thread URL: https://twitter.com/i/web/status/{tweet_ids[0]}")
+            if len(tweet_ids) > 1:
+                ok, problems = post_x_thread.verify_reply_chain(tweet_ids)
+                if ok is not None:
+                    journal.record_verification(thread_id, ok, problems)
+            return tweet_ids
+
+    if thread_id:
+        journal.finish_thread(thread_id, FAILED)
+    if tweet_ids:
+        print(f"⚠️  Stream stopped after {len(tweet_ids)}/{total} tweets: "
+              f"https://twitter.com/i/web/status/{tweet_ids[0]}")
+    elif total is None:
+        print("❌ No TWEET blocks received")
+    return None
+
+def main():
+    force = '--force' in sys.argv[1:]
+    if sys.stdin.isatty():
+        print("Usage: <generator> | python3 stream_thread.py [--force]")
+        print("Reads 'TWEET n/N:' blocks from stdin and posts each one as soon as it is complete")
+        sys.exit(1)
+
+    tweet_ids = stream_post(sys.stdin, force=force)
+    if tweet_ids is None:
+        # Stop the generator upstream instead of letting it write into a dead thread
+        sys.stdin.close()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
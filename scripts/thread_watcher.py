@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+inotify watcher that auto-posts ready thread files
+Part of Claude AutoBlog SlashCommands Content Nuke
+Files in x-threads/ and x-posts/ marked 'Status: Ready to post' are posted and marked 'Status: Posted'
+"""
+import os
+import re
+import sys
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+from datetime import datetime
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WATCH_DIRS = [os.path.join(REPO_ROOT, 'x-threads'), os.path.join(REPO_ROOT, 'x-posts')]
+
+DEBOUNCE_SECONDS = 2         # editors save in several writes/renames; wait until quiet
+
+# From <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct('iIII')   # wd, mask, cookie, len
+
+class Inotify:
+    """Minimal inotify binding over libc (Linux only, no extra dependency)"""
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+
+    def add_watch(self, directory, mask=IN_CLOSE_WRITE | IN_MOVED_TO):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.dirs[wd] = directory
+
+    def read(self, timeout=None):
+        """Block until events arrive (or timeout); returns the changed file paths"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if name and wd in self.dirs:
+                paths.append(os.path.join(self.dirs[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+def is_candidate(path):
+    name = os.path.basename(path)
+    return name.endswith('.txt') and not name.startswith('.') and not name.endswith('-POSTED.txt')
+
+def read_header(path):
+    from .post_x_thread import parse_thread_header
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return parse_thread_header(f.read())
+    except (OSError, UnicodeDecodeError):
+        return {}
+
+def mark_posted(path, thread_url):
+    """Rewrite the header to 'Status: Posted' with the thread URL (atomic replace).
+
+    Returns False without touching the file when there is no ready status to rewrite:
+    an unchanged rewrite would still fire IN_MOVED_TO and bring the file straight back.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    stamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+    # process() matches the status case-insensitively, so the rewrite must too
+    content, count = re.subn(r'(?mi)^Status:\s*Ready to post\s*$',
+                             f"Status: Posted {stamp}\nThread URL: {thread_url}", content, count=1)
+    if not count:
+        return False
+
+    tmp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+def process(path):
+    """Post a ready file through the normal thread pipeline; safe to call repeatedly"""
+    from . import post_x_thread
+    from .post_common import PostError
+    from .dedup_index import DedupIndex
+
+    if not os.path.exists(path) or not is_candidate(path):
+        return
+    header = read_header(path)
+    if header.get('Status', '').lower() != 'ready to post':
+        return
+
+    scheduled = header.get('Scheduled')
+    if scheduled:
+        from .post_scheduler import parse_due
+        if parse_due(scheduled) > time.time():
+            print(f"⏰ {os.path.basename(path)} is scheduled for {scheduled}, leaving it to the scheduler")
+            return
+
+    print(f"📥 [{datetime.now():%H:%M:%S}] Ready: {os.path.basename(path)}")
+    try:
+        prepared, _ = post_x_thread.prepare_thread(path)
+        if prepared is None:
+            # Posted before (e.g. crashed before the rewrite): just fix the header
+            tweets = post_x_thread.load_thread_tweets(path)
+            record = DedupIndex().lookup(tweets[0]) if tweets else None
+            if record and record.get('url'):
+                mark_posted(path, record['url'])
+            return
+        tweet_ids = post_x_thread.publish_thread(prepared)
+    except PostError:
+        return
+
+    if mark_posted(path, f"https://twitter.com/i/web/status/{tweet_ids[0]}"):
+        print(f"📝 Marked {os.path.basename(path)} as posted")
+
+def watch(directories=WATCH_DIRS):
+    """Process anything already ready, then react to inotify events until interrupted"""
+    from . import post_x_thread
+
+    inotify = Inotify()
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+        inotify.add_watch(directory)
+
+    post_x_thread.warm_up()
+
+    # The watcher runs for days; renew OAuth2 tokens before they expire
+    from . import token_keeper
+    token_keeper.start()
+
+    # Catch up on files that became ready while we weren't running
+    pending = {}
+    for directory in directories:
+        for name in sorted(os.listdir(directory)):
+            pending[os.path.join(directory, name)] = time.time()
+
+    print(f"👀 Watching {', '.join(os.path.relpath(d, REPO_ROOT) for d in directories)} (pid {os.getpid()})")
+    try:
+        while True:
+            now = time.time()
+            for path in sorted(p for p, due in pending.items() if due <= now):
+                del pending[path]
+                try:
+                    process(path)
+                except Exception as e:
+                    print(f"❌ {os.path.basename(path)}: {e}")
+
+            timeout = max(0, min(pending.values()) - time.time()) if pending else None
+            for path in inotify.read(timeout):
+                if is_candidate(path):
+                    pending[path] = time.time() + DEBOUNCE_SECONDS
+    except KeyboardInterrupt:
+        print("\n👋 Watcher stopped")
+    finally:
+        inotify.close()
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("Usage: python3 thread_watcher.py [dir ...]")
+        print("Posts files in x-threads/ and x-posts/ whose header says 'Status: Ready to post'")
+        sys.exit(0)
+
+    if not sys.platform.startswith('linux'):
+        print("❌ The watcher uses inotify and only runs on Linux; use post_scheduler.py scan instead")
+        sys.exit(1)
+
+    watch([os.path.abspath(d) for d in sys.argv[1:]] or WATCH_DIRS)
+
+if __name__ == "__main__":
+    main()
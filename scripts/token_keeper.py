@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Background token keeper for long-running posting processes
+Part of Claude AutoBlog SlashCommands Content Nuke
+Renews OAuth2 tokens ahead of expiry so scheduled and drip posts never hit an expired token
+"""
+import time
+import threading
+from datetime import datetime
+
+REFRESH_MARGIN_SECONDS = 600     # renew 10 minutes before expiry
+RETRY_BASE_SECONDS = 30          # 30s, 1m, 2m, 4m ... while the refresh endpoint is down
+MAX_RETRIES = 6
+UNKNOWN_EXPIRY_SECONDS = 3600    # re-check hourly when no expiry has been recorded
+
+def _x_expiry(creds):
+    """X OAuth2 expiry, or None if X doesn't need refreshing (OAuth 1.0a or not configured)"""
+    from .post_common import uses_oauth1
+    if uses_oauth1(creds) or not creds.get('X_OAUTH2_REFRESH_TOKEN'):
+        return None
+    # No recorded expiry: refresh now to learn it
+    return float(creds.get('X_OAUTH2_EXPIRES_AT') or 0)
+
+def _linkedin_expiry(creds):
+    if not creds.get('LINKEDIN_REFRESH_TOKEN') or not creds.get('LINKEDIN_EXPIRES_AT'):
+        return None  # LinkedIn tokens without a refresh token are renewed by hand
+    return float(creds['LINKEDIN_EXPIRES_AT'])
+
+def _refresh_x(margin):
+    from . import post_x_thread
+    from .refresh_tokens import refresh_x_token
+    # Same margin that made it due, else the refresh would find the token "still valid" and skip
+    if not refresh_x_token(margin):
+        return False
+    # Build the new auth now; in-flight requests keep the auth they started with
+    post_x_thread.get_x_auth()
+    return True
+
+def _refresh_linkedin(margin):
+    from .refresh_tokens import refresh_linkedin_token
+    return refresh_linkedin_token(margin)
+
+PLATFORMS = {
+    'X': (_x_expiry, _refresh_x),
+    'LinkedIn': (_linkedin_expiry, _refresh_linkedin),
+}
+
+class TokenKeeper(threading.Thread):
+    """Daemon thread that renews each platform's token shortly before it expires"""
+
+    def __init__(self, margin=REFRESH_MARGIN_SECONDS):
+        super().__init__(name='token-keeper', daemon=True)
+        self.margin = margin
+        self.stopped = threading.Event()
+        self.failures = {name: 0 for name in PLATFORMS}
+        self.retry_at = {}
+
+    def stop(self):
+        self.stopped.set()
+
+    def next_due(self, creds):
+        """{platform: time its refresh is due}, for platforms that need one"""
+        due = {}
+        for name, (expiry, _) in PLATFORMS.items():
+            if self.failures[name] > MAX_RETRIES:
+                continue  # gave up on this token; preflight refresh still applies
+            expires_at = expiry(creds)
+            if expires_at is not None:
+                due[name] = self.retry_at.get(name) or expires_at - self.margin
+        return due
+
+    def refresh(self, name):
+        try:
+            ok = PLATFORMS[name][1](self.margin)
+        except Exception as e:
+            print(f"⚠️  {name} token refresh failed: {e}")
+            ok = False
+
+        if ok:
+            self.failures[name] = 0
+            self.retry_at.pop(name, None)
+            return
+
+        self.failures[name] += 1
+        if self.failures[name] > MAX_RETRIES:
+            print(f"❌ {name} token refresh failed {MAX_RETRIES + 1} times, giving up until restart")
+            return
+        delay = RETRY_BASE_SECONDS * 2 ** (self.failures[name] - 1)
+        self.retry_at[name] = time.time() + delay
+        print(f"⏳ Retrying {name} token refresh in {delay}s")
+
+    def run(self):
+        from .refresh_tokens import load_credentials_from_waygate
+        while not self.stopped.is_set():
+            due = self.next_due(load_credentials_from_waygate())
+            now = time.time()
+            for name, due_at in due.items():
+                if due_at <= now:
+                    print(f"🔑 [{datetime.now():%H:%M:%S}] Renewing {name} token ahead of expiry")
+                    self.refresh(name)
+
+            due = self.next_due(load_credentials_from_waygate())
+            timeout = max(1, min(due.values()) - time.time()) if due else UNKNOWN_EXPIRY_SECONDS
+            self.stopped.wait(min(timeout, UNKNOWN_EXPIRY_SECONDS))
+
+def start():
+    """Start a token keeper for this process; returns it so callers can stop() it"""
+    keeper = TokenKeeper()
+    keeper.start()
+    return keeper
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Build and sync X lists from markdown handle lists
+Part of Claude AutoBlog SlashCommands Content Nuke
+Resolves handles in batches through a cached username -> ID store, then adds and removes only the difference
+"""
+import os
+import re
+import sys
+import json
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+CACHE_PATH = os.path.join(STATE_DIR, "x-users.json")
+
+USER_TTL_SECONDS = 30 * 24 * 3600       # handles can be renamed or recycled
+NOT_FOUND_TTL_SECONDS = 24 * 3600
+LOOKUP_BATCH = 100                       # GET /2/users/by accepts up to 100 usernames
+MEMBER_WORKERS = 4
+
+HANDLE_PATTERN = re.compile(r'(?<![A-Za-z0-9_@])@([A-Za-z0-9_]{1,15})(?![A-Za-z0-9_@])')
+LIST_NAME_PATTERN = re.compile(r'list called "([^"]+)"', re.IGNORECASE)
+
+_local = threading.local()
+
+class LookupFailed(Exception):
+    """An X API lookup failed, so a missing user or list may just not have been fetched"""
+
+def _session():
+    """One requests session per worker thread so connections are reused"""
+    import requests
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+def parse_handles(content):
+    """Unique handles in order of first appearance"""
+    seen = {}
+    for handle in HANDLE_PATTERN.findall(content):
+        seen.setdefault(handle.lower(), handle)
+    return list(seen.values())
+
+def list_name_for(content, path):
+    """'...list called "Name"' in the file, else its title, else the file name"""
+    match = LIST_NAME_PATTERN.search(content)
+    if match:
+        return match.group(1)
+    for line in content.splitlines():
+        if line.startswith('# '):
+            return re.sub(r'\s+(X/Twitter|X|Twitter)?\s*List$', '', line[2:].strip(), flags=re.IGNORECASE)
+    return os.path.splitext(os.path.basename(path))[0].replace('-', ' ')
+
+class UserCache:
+    """Persistent lowercase username -> {id, username, resolved_at} map stored as JSON"""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.users = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.users = json.load(f).get('users', {})
+            except (ValueError, OSError) as e:
+                print(f"⚠️  Could not read user cache {path}: {e}")
+
+    def get(self, username, now=None):
+        """Cached entry if still fresh (id is None for handles that don't exist)"""
+        entry = self.users.get(username.lower())
+        if not entry:
+            return None
+        ttl = USER_TTL_SECONDS if entry['id'] else NOT_FOUND_TTL_SECONDS
+        return entry if (now or time.time()) - entry['resolved_at'] < ttl else None
+
+    def put(self, username, user_id):
+        self.users[username.lower()] = {'id': user_id, 'username': username, 'resolved_at': time.time()}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix='.x-users-')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': 1, 'users': self.users}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+def resolve_usernames(usernames, cache):
+    """{username: user_id or None}, looking up only handles missing from the cache.
+
+    Raises LookupFailed if any batch fails; batches resolved before it are still cached.
+    """
+    from .post_x_thread import x_get
+
+    resolved, misses = {}, []
+    for username in usernames:
+        entry = cache.get(username)
+        if entry:
+            resolved[username] = entry['id']
+        else:
+            misses.append(username)
+
+    for start in range(0, len(misses), LOOKUP_BATCH):
+        batch = misses[start:start + LOOKUP_BATCH]
+        body = x_get("https://api.twitter.com/2/users/by", {'usernames': ','.join(batch)}, 'GET /2/users/by')
+        if body is None:
+            cache.save()
+            raise LookupFailed(f"could not look up {len(misses) - start} handles")
+        found = {user['username'].lower(): user['id'] for user in body.get('data', [])}
+        for username in batch:
+            # Suspended or renamed handles come back as per-username errors
+            user_id = found.get(username.lower())
+            cache.put(username, user_id)
+            resolved[username] = user_id
+    if misses:
+        cache.save()
+    return resolved
+
+def find_list(user_id, name):
+    """ID of our list with this name, or None if it doesn't exist; raises LookupFailed"""
+    from .post_x_thread import x_get
+
+    params = {'max_results': 100}
+    while True:
+        body = x_get(f"https://api.twitter.com/2/users/{user_id}/owned_lists", params, 'GET /2/users/:id/owned_lists')
+        if body is None:
+            raise LookupFailed(f"could not list our lists to find {name!r}")
+        for owned in body.get('data', []):
+            if owned['name'] == name:
+                return owned['id']
+        if not body.get('meta', {}).get('next_token'):
+            return None
+        params['pagination_token'] = body['meta']['next_token']
+
+def list_members(list_id, cache):
+    """{user_id: username} of current members; member usernames refresh the cache for free"""
+    from .post_x_thread import x_get
+
+    members = {}
+    params = {'max_results': 100}
+    while True:
+        body = x_get(f"https://api.twitter.com/2/lists/{list_id}/members", params, 'GET /2/lists/:id/members')
+        if body is None:
+            raise LookupFailed("could not fetch the current members")
+        for user in body.get('data', []):
+            members[user['id']] = user['username']
+            cache.put(user['username'], user['id'])
+        if not body.get('meta', {}).get('next_token'):
+            return members
+        params['pagination_token'] = body['meta']['next_token']
+
+def _x_request(method, url, endpoint, auth, headers, payload=None):
+    """Membership write drawing from the shared rate-limit ledger; returns the response or an error string"""
+    from . import post_x_thread
+
+    if not post_x_thread.get_rate_limiter().acquire(post_x_thread.x_account(), endpoint):
+        return 'rate limited'
+    try:
+        if auth:  # OAuth 1.0a
+            response = _session().request(method, url, auth=auth, json=payload)
+        else:  # OAuth2 Bearer token
+            response = _session().request(method, url, headers=headers, json=payload)
+    except Exception as e:
+        return str(e)
+    post_x_thread.record_rate_limit(endpoint, response)
+    return response
+
+def create_list(name, private=True):
+    from . import post_x_thread
+
+    auth, headers = post_x_thread.get_x_auth()
+    response = _x_request('POST', "https://api.twitter.com/2/lists", 'POST /2/lists', auth, headers,
+                          {'name': name, 'private': private})
+    if isinstance(response, str) or response.status_code not in (200, 201):
+        print(f"❌ Could not create list {name!r}: {response if isinstance(response, str) else response.text}")
+        return None
+    return response.json()['data']['id']
+
+def change_members(list_id, add_ids, remove_ids, workers=MEMBER_WORKERS):
+    """Add and remove members concurrently; returns {user_id: 'added'|'removed'|error}"""
+    from . import post_x_thread
+
+    auth, headers = post_x_thread.get_x_auth()
+    url = f"https://api.twitter.com/2/lists/{list_id}/members"
+
+    def add(user_id):
+        response = _x_request('POST', url, 'POST /2/lists/:id/members', auth, headers, {'user_id': user_id})
+        if isinstance(response, str):
+            return response
+        if response.status_code == 200 and response.json().get('data', {}).get('is_member'):
+            return 'added'
+        return f"{response.status_code}: {response.text[:200]}"
+
+    def remove(user_id):
+        response = _x_request('DELETE', f"{url}/{user_id}", 'DELETE /2/lists/:id/members', auth, headers)
+        if isinstance(response, str):
+            return response
+        if response.status_code == 200 and not response.json().get('data', {}).get('is_member', True):
+            return 'removed'
+        return f"{response.status_code}: {response.text[:200]}"
+
+    jobs = [(add, user_id) for user_id in add_ids] + [(remove, user_id) for user_id in remove_ids]
+    if not jobs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return dict(zip((user_id for _, user_id in jobs), pool.map(lambda job: job[0](job[1]), jobs)))
+
+def sync_list(path, name=None, private=True, dry_run=False):
+    """Create or sync the list described by a markdown file; True if it now matches"""
+    from .reply_poller import my_user_id
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    handles = parse_handles(content)
+    name = name or list_name_for(content, path)
+    if not handles:
+        print(f"❌ No @handles found in {path}")
+        return False
+
+    # Any failed lookup aborts the sync: a handle that wasn't fetched would look
+    # "not found" and be removed, and a list that wasn't found would be created twice
+    cache = UserCache()
+    try:
+        resolved = resolve_usernames(handles, cache)
+        owner_id = my_user_id()
+        if not owner_id:
+            return False
+        list_id = find_list(owner_id, name)
+        members = list_members(list_id, cache) if list_id else {}
+    except LookupFailed as e:
+        print(f"❌ {name}: {e}, list left unchanged")
+        return False
+    finally:
+        cache.save()
+
+    unknown = [handle for handle in handles if not resolved.get(handle)]
+    for handle in unknown:
+        print(f"⚠️  @{handle} not found (suspended, renamed or typo), skipping")
+    wanted = {resolved[handle]: handle for handle in handles if resolved.get(handle)}
+    if not wanted and members:
+        # Every handle failing to resolve is far likelier a bad file than a request to empty the list
+        print(f"❌ {name}: none of the {len(handles)} handles resolved, refusing to remove all "
+              f"{len(members)} members; list left unchanged")
+        return False
+    if not list_id:
+        print(f"🆕 List {name!r} does not exist yet")
+
+    to_add = [user_id for user_id in wanted if user_id not in members]
+    to_remove = [user_id for user_id in members if user_id not in wanted]
+    print(f"📋 {name}: {len(wanted)} wanted, {len(members)} current, +{len(to_add)} -{len(to_remove)}")
+    for user_id in to_add:
+        print(f"   + @{wanted[user_id]}")
+    for user_id in to_remove:
+        print(f"   - @{members[user_id]}")
+    if dry_run:
+        print("🔍 Dry run, no changes made")
+        return True
+    if not (to_add or to_remove):
+        return True
+
+    if not list_id:
+        list_id = create_list(name, private)
+        if not list_id:
+            return False
+    outcomes = change_members(list_id, to_add, to_remove)
+    failed = {user_id: outcome for user_id, outcome in outcomes.items() if outcome not in ('added', 'removed')}
+    for user_id, outcome in failed.items():
+        print(f"   ❌ @{wanted.get(user_id) or members.get(user_id)}: {outcome}")
+    if failed:
+        print(f"⚠️  {len(failed)} membership changes failed; re-run to retry")
+    else:
+        print(f"✅ List synced: https://twitter.com/i/lists/{list_id}")
+    return not failed
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0].startswith('--'):
+        print("Usage: python3 x_list_builder.py <handles.md> [--name \"List name\"] [--public] [--dry-run]")
+        print("Example: python3 x_list_builder.py google-leaders-x-list.md")
+        sys.exit(1)
+
+    name = args[args.index('--name') + 1] if '--name' in args and args.index('--name') + 1 < len(args) else None
+    ok = sync_list(args[0], name=name, private='--public' not in args, dry_run='--dry-run' in args)
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Chunked, parallel media upload for X (Twitter)
+Part of Claude AutoBlog SlashCommands Content Nuke
+Implements the INIT/APPEND/FINALIZE/STATUS flow, streaming files from disk
+"""
+import os
+import sys
+import time
+import mimetypes
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
+
+CHUNK_SIZE = 4 * 1024 * 1024     # X accepts APPEND segments up to 5MB
+CHUNK_WORKERS = 4                # concurrent APPENDs per file (bounds memory to 4 chunks)
+FILE_WORKERS = 4                 # files uploaded at once for a thread
+CHUNK_RETRIES = 3
+STATUS_TIMEOUT = 300             # seconds to wait for video processing
+
+MAX_IMAGES_PER_TWEET = 4
+
+_local = threading.local()
+
+def _session():
+    """One requests session per worker thread so connections are reused"""
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+def _upload_headers(headers):
+    """Auth headers without the JSON content type used for /2/tweets"""
+    return {k: v for k, v in (headers or {}).items() if k.lower() != 'content-type'}
+
+def media_category(path):
+    """Return (mime_type, media_category) for a file"""
+    mime_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    if mime_type == 'image/gif':
+        return mime_type, 'tweet_gif'
+    if mime_type.startswith('video/'):
+        return mime_type, 'tweet_video'
+    return mime_type, 'tweet_image'
+
+def _init_upload(path, auth, headers):
+    mime_type, category = media_category(path)
+    data = {
+        'command': 'INIT',
+        'total_bytes': os.path.getsize(path),
+        'media_type': mime_type,
+        'media_category': category,
+    }
+    response = _session().post(UPLOAD_URL, data=data, auth=auth, headers=_upload_headers(headers))
+    if response.status_code not in (200, 201, 202):
+        raise RuntimeError(f"INIT failed for {path}: {response.status_code} {response.text}")
+    return response.json()['media_id_string']
+
+def _append_chunk(path, media_id, segment_index, auth, headers):
+    """Read one chunk from disk and APPEND it; only this chunk is held in memory"""
+    with open(path, 'rb') as f:
+        f.seek(segment_index * CHUNK_SIZE)
+        chunk = f.read(CHUNK_SIZE)
+
+    data = {'command': 'APPEND', 'media_id': media_id, 'segment_index': segment_index}
+    last_error = None
+    for attempt in range(CHUNK_RETRIES):
+        try:
+            response = _session().post(UPLOAD_URL, data=data, files={'media': chunk},
+                                       auth=auth, headers=_upload_headers(headers))
+            if 200 <= response.status_code < 300:
+                return segment_index
+            last_error = f"{response.status_code} {response.text}"
+        except requests.RequestException as e:
+            last_error = str(e)
+        time.sleep(2 ** attempt)
+    raise RuntimeError(f"APPEND segment {segment_index} failed for {path}: {last_error}")
+
+def _finalize_upload(path, media_id, auth, headers):
+    data = {'command': 'FINALIZE', 'media_id': media_id}
+    response = _session().post(UPLOAD_URL, data=data, auth=auth, headers=_upload_headers(headers))
+    if response.status_code not in (200, 201):
+        raise RuntimeError(f"FINALIZE failed for {path}: {response.status_code} {response.text}")
+    return response.json().get('processing_info')
+
+def _wait_for_processing(path, media_id, processing_info, auth, headers):
+    """Poll STATUS until X has finished processing video/GIF uploads"""
+    deadline = time.time() + STATUS_TIMEOUT
+    while processing_info and processing_info.get('state') in ('pending', 'in_progress'):
+        if time.time() > deadline:
+            raise RuntimeError(f"Timed out waiting for media processing: {path}")
+        time.sleep(processing_info.get('check_after_secs', 1))
+        response = _session().get(UPLOAD_URL, params={'command': 'STATUS', 'media_id': media_id},
+                                  auth=auth, headers=_upload_headers(headers))
+        if response.status_code != 200:
+            raise RuntimeError(f"STATUS failed for {path}: {response.status_code} {response.text}")
+        processing_info = response.json().get('processing_info')
+
+    if processing_info and processing_info.get('state') == 'failed':
+        error = processing_info.get('error', {}).get('message', 'unknown error')
+        raise RuntimeError(f"X could not process {path}: {error}")
+
+def upload_media(path, auth, headers):
+    """Upload one file with chunked APPENDs in parallel; returns the media_id string"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Media file not found: {path}")
+
+    media_id = _init_upload(path, auth, headers)
+
+    segments = max(1, -(-os.path.getsize(path) // CHUNK_SIZE))
+    with ThreadPoolExecutor(max_workers=min(CHUNK_WORKERS, segments)) as pool:
+        # list() re-raises the first failed segment
+        list(pool.map(lambda i: _append_chunk(path, media_id, i, auth, headers), range(segments)))
+
+    processing_info = _finalize_upload(path, media_id, auth, headers)
+    _wait_for_processing(path, media_id, processing_info, auth, headers)
+    return media_id
+
+def upload_all(paths, auth, headers):
+    """Upload every distinct file in parallel; returns {path: media_id}"""
+    unique_paths = list(dict.fromkeys(paths))
+    if not unique_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(FILE_WORKERS, len(unique_paths))) as pool:
+        media_ids = pool.map(lambda p: upload_media(p, auth, headers), unique_paths)
+        return dict(zip(unique_paths, media_ids))
+
+def validate_attachments(paths):
+    """Return a list of problems with one tweet's attachments (empty if fine)"""
+    problems = []
+    categories = [media_category(p)[1] for p in paths]
+    for path in paths:
+        if not os.path.exists(path):
+            problems.append(f"missing file {path}")
+    if len(paths) > MAX_IMAGES_PER_TWEET:
+        problems.append(f"{len(paths)} attachments (max {MAX_IMAGES_PER_TWEET})")
+    if len(paths) > 1 and any(c != 'tweet_image' for c in categories):
+        problems.append("videos and GIFs must be the only attachment")
+    return problems
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 x_media_upload.py /path/to/media [more files...]")
+        sys.exit(1)
+
+    from .post_x_thread import get_x_auth
+    auth, headers = get_x_auth()
+    if auth is None and headers is None:
+        sys.exit(1)
+
+    start = time.time()
+    try:
+        media_ids = upload_all(sys.argv[1:], auth, headers)
+    except Exception as e:
+        print(f"❌ Media upload failed: {e}")
+        sys.exit(1)
+
+    for path, media_id in media_ids.items():
+        print(f"✅ {path}: media_id {media_id}")
+    print(f"⏱️  Uploaded {len(media_ids)} files in {time.time() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
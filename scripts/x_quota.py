@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Monthly write-quota ledger for the X API free tier
+Part of Claude AutoBlog SlashCommands Content Nuke
+Counts successful POST /2/tweets per account and month so threads never run out mid-way
+"""
+import os
+import sys
+import time
+import sqlite3
+import calendar
+from datetime import datetime, timezone, timedelta
+
+if __name__ == "__main__" and not __package__:
+    # Run as a plain script: import siblings through the scripts package
+    sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    __package__ = 'scripts'
+
+STATE_DIR = os.path.expanduser("~/.content-nuke")
+DB_PATH = os.path.join(STATE_DIR, "quota.db")
+
+# Free tier cap (see x-threads/free-api-setup-thread.txt); override with
+# X_MONTHLY_POST_CAP in the waygate .env or the environment
+DEFAULT_MONTHLY_CAP = 1500
+
+def current_month(now=None):
+    return datetime.fromtimestamp(now or time.time(), timezone.utc).strftime('%Y-%m')
+
+def monthly_cap():
+    value = os.environ.get('X_MONTHLY_POST_CAP')
+    if not value:
+        from .post_x_thread import load_waygate_credentials
+        value = load_waygate_credentials().get('X_MONTHLY_POST_CAP')
+    return int(value) if value else DEFAULT_MONTHLY_CAP
+
+class QuotaLedger:
+    """SQLite counts of successful tweet writes per (account, UTC month)"""
+
+    def __init__(self, path=DB_PATH, cap=None, shared=False):
+        self.path = path
+        self.cap = cap if cap is not None else monthly_cap()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=not shared)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS usage (
+                account TEXT NOT NULL,
+                month TEXT NOT NULL,
+                posts INTEGER NOT NULL DEFAULT 0,
+                first_post_at REAL,
+                last_post_at REAL,
+                PRIMARY KEY (account, month)
+            );
+        """)
+
+    def record(self, account, count=1):
+        """Count successful writes; atomic across processes"""
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO usage (account, month, posts, first_post_at, last_post_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (account, month) DO UPDATE SET posts = posts + excluded.posts, "
+                "last_post_at = excluded.last_post_at",
+                (account, current_month(now), count, now, now))
+
+    def used(self, account, month=None):
+        row = self.conn.execute(
+            "SELECT posts FROM usage WHERE account = ? AND month = ?",
+            (account, month or current_month())).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self, account):
+        return max(0, self.cap - self.used(account))
+
+    def fits(self, account, count):
+        return self.remaining(account) >= count
+
+    def projection(self, account, now=None):
+        """Usage report with the projected exhaustion date at this month's pace"""
+        now = datetime.fromtimestamp(now or time.time(), timezone.utc)
+        used = self.used(account, now.strftime('%Y-%m'))
+        days_in_month = calendar.monthrange(now.year, now.month)[1]
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        month_end = month_start + timedelta(days=days_in_month)
+
+        elapsed_days = max((now - month_start).total_seconds() / 86400, 1 / 24)
+        per_day = used / elapsed_days
+        exhausted_at = None
+        if per_day and used < self.cap:
+            exhausted_at = now + timedelta(days=(self.cap - used) / per_day)
+            if exhausted_at >= month_end:
+                exhausted_at = None  # lasts the month
+        elif used >= self.cap:
+            exhausted_at = now
+
+        return {
+            'account': account,
+            'month': now.strftime('%Y-%m'),
+            'used': used,
+            'cap': self.cap,
+            'remaining': max(0, self.cap - used),
+            'per_day': per_day,
+            'projected_month_total': round(per_day * days_in_month),
+            'exhausted_at': exhausted_at,
+            'resets_at': month_end,
+        }
+
+def print_report(report):
+    print(f"📊 X write quota {report['month']} ({report['account']})")
+    print(f"   Used: {report['used']}/{report['cap']}  Remaining: {report['remaining']}")
+    print(f"   Pace: {report['per_day']:.1f}/day, projected {report['projected_month_total']} this month")
+    if report['exhausted_at']:
+        print(f"   ⚠️  Projected to run out {report['exhausted_at']:%Y-%m-%d %H:%M} UTC "
+              f"(resets {report['resets_at']:%Y-%m-%d})")
+    else:
+        print(f"   ✅ On pace to last until the reset on {report['resets_at']:%Y-%m-%d}")
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] not in ('report', 'record'):
+        print("Usage: python3 x_quota.py [report|record <count>]")
+        print("  record: count tweets posted outside these scripts")
+        sys.exit(1)
+
+    from .post_x_thread import x_account
+    ledger = QuotaLedger()
+    account = x_account()
+
+    if len(sys.argv) > 2 and sys.argv[1] == 'record':
+        ledger.record(account, int(sys.argv[2]))
+        print(f"✅ Recorded {sys.argv[2]} posts")
+
+    print_report(ledger.projection(account))
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ Content Nuke - Command-based content automation platform
 Transforms development sessions into published multi-platform content
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
 # Read VERSION file
@@ -28,7 +28,10 @@ setup(
     author='Jeremy Longshore',
     author_email='jeremylongshore@gmail.com',
     url='https://github.com/jeremylongshore/content-nuke',
-    packages=find_packages(),
+    # The modules live in scripts/ (the slash commands run them from there) but install
+    # as content_nuke: a top-level package named "scripts" would collide with others
+    packages=['content_nuke'],
+    package_dir={'content_nuke': 'scripts'},
 
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -68,11 +71,14 @@ setup(
             'tweepy>=4.14.0',
             'linkedin-api>=2.0.0',
         ],
+        'media': [
+            'Pillow>=9.0.0',
+        ],
     },
 
     entry_points={
         'console_scripts': [
-            'content-nuke=scripts.post_x_thread:main',
+            'content-nuke=content_nuke.cli:main',
         ],
     },
 
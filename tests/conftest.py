@@ -0,0 +1,77 @@
+"""
+Shared fixtures for the Content Nuke tests
+Every store lives under ~/.content-nuke and its path is fixed at import time,
+so HOME points at a scratch directory before any scripts module is imported.
+"""
+import os
+import tempfile
+
+os.environ['HOME'] = tempfile.mkdtemp(prefix='content-nuke-tests-')
+
+import itertools
+
+import pytest
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.body = body if body is not None else {}
+        self.headers = headers or {}
+        self.text = str(self.body)
+
+    def json(self):
+        return self.body
+
+class FakeHTTP:
+    """Stands in for a requests.Session: queued responses per method, every call recorded"""
+
+    def __init__(self, post=None, get=None, default=None):
+        self.responses = {'post': list(post or []), 'get': list(get or [])}
+        self.default = default
+        self.calls = []
+
+    def _respond(self, method, url, kwargs):
+        self.calls.append((method, url, kwargs))
+        queued = self.responses.get(method)
+        if queued:
+            response = queued.pop(0)
+        else:
+            response = self.default(method, url, kwargs) if self.default else FakeResponse(200)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def post(self, url, **kwargs):
+        return self._respond('post', url, kwargs)
+
+    def get(self, url, **kwargs):
+        return self._respond('get', url, kwargs)
+
+    def request(self, method, url, **kwargs):
+        return self._respond(method.lower(), url, kwargs)
+
+    def head(self, url, **kwargs):
+        return FakeResponse(200)
+
+def tweet_poster(start=1000):
+    """FakeHTTP default that accepts every tweet with increasing IDs"""
+    ids = itertools.count(start)
+
+    def respond(method, url, kwargs):
+        if method == 'post':
+            return FakeResponse(201, {'data': {'id': str(next(ids))}})
+        return FakeResponse(200, {'data': []})
+    return respond
+
+@pytest.fixture
+def x_credentials(monkeypatch):
+    """OAuth 1.0a keys in the environment (the waygate .env doesn't exist here)"""
+    for key, value in (('X_API_KEY', 'key'), ('X_API_SECRET', 'secret'),
+                       ('X_ACCESS_TOKEN', '4242-token'), ('X_ACCESS_SECRET', 'token-secret')):
+        monkeypatch.setenv(key, value)
+
+@pytest.fixture(autouse=True)
+def no_delay(monkeypatch):
+    """publish_thread sleeps between tweets; tests don't need to"""
+    import time
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
@@ -0,0 +1,26 @@
+import os
+
+def write_post(blog, name, title, date):
+    path = blog / 'content' / 'posts' / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ntitle: \"{title}\"\ndate: {date}\ntags: [testing]\n---\n\nBody\n")
+    return path
+
+def test_update_only_rereads_changed_files(tmp_path):
+    from scripts.blog_index import BlogIndex
+    blog = tmp_path / 'blog'
+    first = write_post(blog, 'first.md', 'First', '2026-01-10')
+    second = write_post(blog, 'second.md', 'Second', '2026-02-10')
+    index = BlogIndex(str(tmp_path / 'index.db'))
+
+    assert index.update(str(blog)) == (2, 0)
+    assert index.update(str(blog)) == (0, 0)
+
+    write_post(blog, 'second.md', 'Second, revised', '2026-03-01')
+    os.utime(second, (second.stat().st_atime, second.stat().st_mtime + 5))
+    assert index.update(str(blog)) == (1, 0)
+    assert index.latest([str(blog)])[0]['title'] == 'Second, revised'
+
+    first.unlink()
+    assert index.update(str(blog)) == (0, 1)
+    assert [row['title'] for row in index.latest([str(blog)], limit=5)] == ['Second, revised']
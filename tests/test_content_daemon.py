@@ -0,0 +1,97 @@
+import io
+import threading
+
+def test_routed_stdout_keeps_each_request_output_separate():
+    from scripts.content_daemon import _RoutedStdout
+
+    log = io.StringIO()
+    stdout = _RoutedStdout(log)
+    writers = [io.StringIO(), io.StringIO()]
+    both_inside = threading.Barrier(2)
+
+    def request(i):
+        with stdout.to(writers[i]):
+            stdout.write(f"start {i}\n")
+            both_inside.wait()
+            stdout.write(f"end {i}\n")
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    stdout.write("token keeper\n")
+    for thread in threads:
+        thread.join()
+
+    assert [writer.getvalue() for writer in writers] == ["start 0\nend 0\n", "start 1\nend 1\n"]
+    assert log.getvalue() == "token keeper\n"
+
+def test_client_sends_absolute_paths(tmp_path, monkeypatch):
+    from scripts import content_client
+
+    thread = tmp_path / 'thread.txt'
+    thread.write_text('TWEET 1/1:\nhello\n')
+    monkeypatch.chdir(tmp_path)
+    sent = {}
+
+    class Socket:
+        def __init__(self, *args):
+            pass
+
+        def connect(self, path):
+            pass
+
+        def sendall(self, data):
+            sent['request'] = data
+
+        def makefile(self, mode):
+            return io.BytesIO(b'{"ok": true}\n')
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+    monkeypatch.setattr(content_client.socket, 'socket', Socket)
+    assert content_client.send('post-x', ['thread.txt', 'just some tweet text']) is True
+    assert str(thread).encode() in sent['request']
+    assert b'"just some tweet text"' in sent['request']
+
+def test_client_keeps_stdin_commands_in_process(monkeypatch):
+    from scripts import content_client
+
+    monkeypatch.setattr(content_client.socket, 'socket', lambda *args: (_ for _ in ()).throw(AssertionError))
+    assert content_client.send('post-x', ['-']) is None
+
+def test_socket_is_private_and_requests_share_one_set_of_stores(tmp_path, monkeypatch):
+    import json
+    import os
+    import socket
+    import stat
+    from scripts import content_daemon, post_x_thread
+
+    monkeypatch.setattr(post_x_thread, '_ledgers', threading.local())
+    seen = []
+    def run_command(command, argv):
+        limiter = post_x_thread.get_rate_limiter()
+        limiter.available('x:4242', 'GET /2/tweets')   # a connection from another thread would raise
+        seen.append((threading.current_thread().name, limiter))
+        return True
+    monkeypatch.setattr(content_daemon, 'run_command', run_command)
+
+    path = str(tmp_path / 'daemon.sock')
+    server = content_daemon.ContentDaemon(path)
+    assert stat.S_IMODE(os.stat(path).st_mode) & 0o077 == 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        for _ in range(2):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(path)
+                sock.sendall(b'{"command": "post-x", "argv": []}\n')
+                assert json.loads(sock.makefile('rb').readline()) == {'ok': True}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert seen[0][0] != seen[1][0]
+    assert seen[0][1] is seen[1][1]
@@ -0,0 +1,28 @@
+def test_save_keeps_entries_other_runs_forgot_or_added(tmp_path):
+    from scripts.dedup_index import DedupIndex
+    path = str(tmp_path / 'posted-index.json')
+    poster = DedupIndex(path)
+    poster.record("Deleted later", 'x', post_id='1')
+
+    # Another process rolls the post back and a third records a new one
+    assert DedupIndex(path).forget(['1']) == 1
+    DedupIndex(path).record("Posted elsewhere", 'linkedin', post_id='2')
+
+    # The first process still holds the stale entry in memory when it saves again
+    poster.record("Posted next", 'x', post_id='3')
+
+    on_disk = DedupIndex(path)
+    assert not on_disk.is_published("Deleted later")
+    assert on_disk.is_published("Posted elsewhere")
+    assert on_disk.is_published("Posted next")
+
+def test_unreadable_index_is_set_aside_not_overwritten(tmp_path):
+    from scripts.dedup_index import DedupIndex
+    path = tmp_path / 'posted-index.json'
+    path.write_text('{"version": 1, "entries": {"abc": {"platform": "x", "post_id": "1"')   # truncated
+
+    DedupIndex(str(path)).record("Posted after the damage", 'x', post_id='2')
+
+    aside = [p for p in tmp_path.iterdir() if p.name.startswith('posted-index.json.corrupt-')]
+    assert len(aside) == 1 and aside[0].read_text().endswith('"post_id": "1"')
+    assert DedupIndex(str(path)).is_published("Posted after the damage")
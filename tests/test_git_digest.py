@@ -0,0 +1,76 @@
+import subprocess
+
+import pytest
+
+def commit(repo, name):
+    (repo / name).write_text(f"{name}\n")
+    subprocess.run(['git', '-C', str(repo), 'add', name], check=True)
+    subprocess.run(['git', '-C', str(repo), '-c', 'user.name=Test', '-c', 'user.email=test@example.com',
+                    'commit', '-q', '-m', f"Add {name}"], check=True)
+    return subprocess.run(['git', '-C', str(repo), 'rev-parse', 'HEAD'],
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / 'repo'
+    path.mkdir()
+    subprocess.run(['git', 'init', '-q', str(path)], check=True)
+    return path
+
+def test_scan_only_reads_commits_after_the_cursor(repo, tmp_path):
+    from scripts.git_digest import scan_repo, DigestStore
+    db = str(tmp_path / 'digest.db')
+    commit(repo, 'a.txt')
+    commit(repo, 'b.txt')
+
+    assert scan_repo(str(repo), db) == (str(repo), 2)
+    head = commit(repo, 'c.txt')
+    assert scan_repo(str(repo), db) == (str(repo), 1)
+    assert scan_repo(str(repo), db) == (str(repo), 0)
+
+    store = DigestStore(db)
+    assert store.cursor(str(repo)) == head
+    assert store.conn.execute("SELECT COUNT(*) FROM commits").fetchone()[0] == 3
+
+def test_failed_git_log_leaves_the_cursor(repo, tmp_path, monkeypatch):
+    from scripts import git_digest
+    db = str(tmp_path / 'digest.db')
+    first = commit(repo, 'a.txt')
+    git_digest.scan_repo(str(repo), db)
+    commit(repo, 'b.txt')
+
+    with pytest.raises(git_digest.LogFailed):
+        list(git_digest.iter_log(str(repo), 'no-such-revision'))
+
+    def broken_log(repo, revision_range):
+        raise git_digest.LogFailed("fatal: bad object")
+        yield
+    monkeypatch.setattr(git_digest, 'iter_log', broken_log)
+
+    _, outcome = git_digest.scan_repo(str(repo), db)
+    assert 'git log failed' in outcome
+    assert git_digest.DigestStore(db).cursor(str(repo)) == first
+
+def test_since_last_post_reports_the_post_it_used(tmp_path, monkeypatch):
+    from datetime import datetime
+    from scripts import blog_index
+    from scripts.git_digest import parse_since
+    blog = tmp_path / 'blog'
+    (blog / 'content' / 'posts').mkdir(parents=True)
+    (blog / 'content' / 'posts' / 'launch.md').write_text("---\ntitle: \"Launch notes\"\ndate: 2026-05-04\n---\n")
+    monkeypatch.setattr(blog_index, 'DEFAULT_BLOGS', [str(blog)])
+
+    since, source = parse_since(['--since-last-post'])
+    assert since == datetime(2026, 5, 4).timestamp()
+    assert source == 'last post "Launch notes" (blog)'
+
+    with pytest.raises(ValueError):
+        parse_since(['--since-last-post', '--since', '2026-01-01'])
+
+def test_since_last_post_says_when_it_falls_back(tmp_path, monkeypatch):
+    from scripts import blog_index
+    from scripts.git_digest import parse_since
+    monkeypatch.setattr(blog_index, 'DEFAULT_BLOGS', [str(tmp_path / 'missing')])
+
+    _, source = parse_since(['--since-last-post', '--days', '3'])
+    assert source == '--days 3, no published post found for --since-last-post'
@@ -0,0 +1,22 @@
+OAUTH1 = {'X_API_KEY': 'k', 'X_API_SECRET': 's', 'X_ACCESS_TOKEN': '1-t', 'X_ACCESS_SECRET': 'ts'}
+
+def results(oauth1, oauth2, linkedin='missing'):
+    return {'x-oauth1': {'status': oauth1}, 'x-oauth2': {'status': oauth2}, 'linkedin': {'status': linkedin}}
+
+def test_gate_checks_oauth1_when_posting_signs_with_it(monkeypatch):
+    from scripts.health import is_healthy
+    for key in OAUTH1:
+        monkeypatch.delenv(key, raising=False)
+
+    assert is_healthy(results('error', 'ok'), OAUTH1) is False
+    assert is_healthy(results('ok', 'expired'), OAUTH1) is True
+
+def test_gate_checks_oauth2_without_all_oauth1_keys(monkeypatch):
+    from scripts.health import is_healthy
+    for key in OAUTH1:
+        monkeypatch.delenv(key, raising=False)
+    partial = dict(OAUTH1, X_ACCESS_SECRET='')
+
+    assert is_healthy(results('missing', 'ok'), partial) is True
+    assert is_healthy(results('missing', 'expired'), partial) is False
+    assert is_healthy(results('missing', 'ok', linkedin='error'), partial) is False
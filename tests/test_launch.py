@@ -0,0 +1,31 @@
+import sys
+import uuid
+
+import pytest
+
+from conftest import FakeHTTP, FakeResponse, tweet_poster
+
+def test_linkedin_post_from_worker_thread_is_recorded(tmp_path, monkeypatch, x_credentials):
+    from scripts import launch, post_x_thread, post_linkedin, token_keeper
+    from scripts.similarity_index import SimilarityIndex
+
+    tag = uuid.uuid4().hex
+    thread = tmp_path / 'thread.txt'
+    thread.write_text(f"TWEET 1/2:\nLaunch day {tag}\n\nTWEET 2/2:\nDetails for {tag}\n")
+    linkedin = tmp_path / 'linkedin.txt'
+    linkedin.write_text(f"Launching today, a long post about {tag} and why it matters\n---\nnotes\n")
+
+    monkeypatch.setattr(post_x_thread, 'http', FakeHTTP(default=tweet_poster()))
+    monkeypatch.setattr(post_linkedin, 'http', FakeHTTP(post=[FakeResponse(201, {'id': 'urn:li:share:777'})]))
+    monkeypatch.setattr(post_linkedin, 'load_linkedin_credentials', lambda: ('li-token', 'person-1'))
+    monkeypatch.setattr(token_keeper, 'start', lambda: None)
+    monkeypatch.setattr(sys, 'argv', ['launch.py', str(thread), '--linkedin', str(linkedin), '--at', 'now'])
+
+    with pytest.raises(SystemExit) as exit:
+        launch.main()
+
+    assert exit.value.code == 0
+    assert (tmp_path / 'linkedin-POSTED.txt').read_text().startswith('POSTED TO LINKEDIN')
+    text = linkedin.read_text().split('---')[0].strip()
+    assert post_linkedin.DedupIndex().lookup(text)['post_id'] == '777'
+    assert any(record['post_id'] == '777' for _, record in SimilarityIndex().query(text))
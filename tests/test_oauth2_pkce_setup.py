@@ -0,0 +1,39 @@
+from conftest import FakeResponse
+
+def test_account_tokens_are_saved_where_posting_and_refresh_read_them(monkeypatch, tmp_path):
+    from scripts import oauth2_pkce_setup, post_x_thread, refresh_tokens
+    env = tmp_path / '.env'
+    env.write_text("X_CLIENT_ID=id\nX_CLIENT_SECRET=secret\nX_OAUTH2_ACCESS_TOKEN=main-access\n")
+    monkeypatch.setattr(refresh_tokens, 'WAYGATE_ENV_PATH', str(env))
+    monkeypatch.setattr(refresh_tokens, 'LOCK_PATH', str(tmp_path / 'refresh.lock'))
+    monkeypatch.setattr(post_x_thread, 'load_waygate_credentials', refresh_tokens.load_credentials_from_waygate)
+    monkeypatch.delenv('X_ACCOUNT', raising=False)
+
+    tokens = {'access_token': 'brand-access', 'refresh_token': 'brand-refresh-0', 'expires_in': 7200}
+    assert oauth2_pkce_setup.save_tokens_to_env(tokens, 'brand')
+    assert 'X_OAUTH2_ACCESS_TOKEN_BRAND=brand-access\n' in env.read_text()
+
+    # Without X_ACCOUNT the default account is untouched
+    assert post_x_thread.load_waygate_oauth2_credentials()[2] == 'main-access'
+
+    monkeypatch.setenv('X_ACCOUNT', 'brand')
+    assert post_x_thread.load_waygate_oauth2_credentials()[2] == 'brand-access'
+
+    used = []
+    def post(url, auth=None, data=None):
+        used.append(data['refresh_token'])
+        return FakeResponse(200, {'access_token': 'brand-access-1', 'refresh_token': 'brand-refresh-1', 'expires_in': 7200})
+    monkeypatch.setattr(refresh_tokens.requests, 'post', post)
+    assert refresh_tokens.refresh_x_token()
+    assert used == ['brand-refresh-0']
+
+    saved = env.read_text()
+    assert 'X_OAUTH2_ACCESS_TOKEN_BRAND=brand-access-1\n' in saved
+    assert 'X_OAUTH2_REFRESH_TOKEN_BRAND=brand-refresh-1\n' in saved
+    assert 'X_OAUTH2_ACCESS_TOKEN=main-access\n' in saved
+
+def test_selected_account_without_tokens_does_not_fall_back_to_the_default(monkeypatch):
+    from scripts.post_common import select_x_account
+    monkeypatch.setenv('X_ACCOUNT', 'brand')
+    creds = select_x_account({'X_OAUTH2_ACCESS_TOKEN': 'main-access', 'X_CLIENT_ID': 'id'})
+    assert creds == {'X_CLIENT_ID': 'id'}
@@ -0,0 +1,112 @@
+import os
+import signal
+import sys
+import threading
+import uuid
+
+import pytest
+
+from conftest import FakeHTTP, FakeResponse, tweet_poster
+
+def test_wakeup_while_posting_is_not_lost(tmp_path, monkeypatch):
+    from scripts import post_scheduler
+    path = str(tmp_path / 'schedule.db')
+    wake = threading.Event()
+    posted, finished = [], threading.Event()
+
+    def post_item(item):
+        posted.append(item['path'])
+        if len(posted) == 1:
+            # A new item and its wakeup arrive while the daemon is busy posting
+            post_scheduler.PostQueue(path).add('x', str(tmp_path / 'second.txt'), 0)
+            wake.set()
+            return True
+        finished.set()
+        raise KeyboardInterrupt
+    monkeypatch.setattr(post_scheduler, 'post_item', post_item)
+
+    def daemon():
+        try:
+            post_scheduler.dispatch(post_scheduler.PostQueue(path), wake)
+        except KeyboardInterrupt:
+            pass
+    worker = threading.Thread(target=daemon, daemon=True)
+    worker.start()
+
+    # Queued while the daemon sleeps with nothing due
+    post_scheduler.PostQueue(path).add('x', str(tmp_path / 'first.txt'), 0)
+    wake.set()
+
+    assert finished.wait(5)
+    worker.join(5)
+    assert [p.rsplit('/', 1)[1] for p in posted] == ['first.txt', 'second.txt']
+
+def test_retry_resumes_a_partly_posted_thread(tmp_path, monkeypatch, x_credentials):
+    from scripts import post_x_thread, post_scheduler
+    from scripts.posting_journal import COMPLETE
+
+    tag = uuid.uuid4().hex
+    thread = tmp_path / 'thread.txt'
+    thread.write_text(f"TWEET 1/3:\nOpening {tag}\n\nTWEET 2/3:\nMiddle part {tag}\n\nTWEET 3/3:\nClosing words {tag}\n")
+    http = FakeHTTP(post=[FakeResponse(201, {'data': {'id': '501'}}), FakeResponse(503)],
+                    default=tweet_poster(502))
+    monkeypatch.setattr(post_x_thread, 'http', http)
+
+    queue = post_scheduler.PostQueue(str(tmp_path / 'schedule.db'))
+    item = queue.get(queue.add('x', str(thread), 0))
+    assert post_scheduler.post_item(item) is False
+    assert post_scheduler.post_item(item) is True
+
+    tweets = [kwargs['json'] for method, url, kwargs in http.calls if method == 'post']
+    assert len(tweets) == 4   # 1 posted, 1 failed, then only the remaining 2
+    assert tweets[2]['reply'] == {'in_reply_to_tweet_id': '501'}
+    journal = post_x_thread.get_journal()
+    latest = journal.latest_for_source(str(thread))
+    assert latest['status'] == COMPLETE
+    assert [tweet['tweet_id'] for tweet in journal.tweets(latest['id'])] == ['501', '502', '503']
+
+def test_sigusr1_wakes_the_daemon_through_the_pipe():
+    from scripts.post_scheduler import Wakeup
+
+    wake = Wakeup()
+    previous_fd = signal.set_wakeup_fd(wake.write_fd)
+    previous = signal.signal(signal.SIGUSR1, lambda signum, frame: None)
+    try:
+        assert not wake.wait(0)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert wake.wait(5)
+        wake.clear()
+        assert not wake.wait(0)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+        signal.set_wakeup_fd(previous_fd)
+
+def run_cli(monkeypatch, capsys, *args):
+    from scripts import post_scheduler
+    monkeypatch.setattr(sys, 'argv', ['post_scheduler.py', *args])
+    with pytest.raises(SystemExit) as exit:
+        post_scheduler.main()
+    return exit.value.code, capsys.readouterr().out
+
+def test_add_rejects_bad_arguments_instead_of_crashing(tmp_path, monkeypatch, capsys):
+    from scripts import post_scheduler
+    thread = tmp_path / 'thread.txt'
+    thread.write_text("TWEET 1/1:\nHello\n")
+    before = len(post_scheduler.PostQueue().all())
+
+    assert run_cli(monkeypatch, capsys, 'add', str(thread), '--at') == \
+        (1, "❌ --at needs a time, e.g. --at '2025-10-20 09:00' or --at +2h\n")
+    code, out = run_cli(monkeypatch, capsys, 'add', str(thread), 'x', '--at', 'tomorrowish')
+    assert code == 1 and out.startswith("❌ Can't parse time: tomorrowish")
+    code, out = run_cli(monkeypatch, capsys, 'add', str(thread), '--at', '+2w')
+    assert code == 1 and out.startswith("❌ Can't parse time: +2w")
+    code, out = run_cli(monkeypatch, capsys, 'add', str(thread), 'mastodon')
+    assert code == 1 and out.startswith("❌ Unknown platform: mastodon")
+    assert len(post_scheduler.PostQueue().all()) == before
+
+def test_retry_and_cancel_need_an_existing_id(monkeypatch, capsys):
+    for command in ('retry', 'cancel'):
+        code, out = run_cli(monkeypatch, capsys, command, 'abc')
+        assert code == 1 and out.startswith("❌ No queued item #abc")
+        code, out = run_cli(monkeypatch, capsys, command, '999999')
+        assert code == 1 and out.startswith("❌ No queued item #999999")
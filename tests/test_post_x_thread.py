@@ -0,0 +1,23 @@
+import time
+
+from conftest import FakeHTTP, FakeResponse
+
+def test_reply_chain_lookup_uses_the_shared_rate_limit_ledger(monkeypatch, x_credentials):
+    from scripts import post_x_thread
+    lookup = {'data': [{'id': '11'},
+                       {'id': '12', 'referenced_tweets': [{'type': 'replied_to', 'id': '11'}]}]}
+    reset_at = int(time.time()) + 86400   # past the limiter's max wait, so it refuses at once
+    http = FakeHTTP(get=[FakeResponse(200, lookup, {'x-rate-limit-limit': '15', 'x-rate-limit-remaining': '0',
+                                                    'x-rate-limit-reset': str(reset_at)})])
+    monkeypatch.setattr(post_x_thread, 'http', http)
+    limiter, account = post_x_thread.get_rate_limiter(), post_x_thread.x_account()
+
+    try:
+        assert post_x_thread.verify_reply_chain(['11', '12']) == (True, [])
+        assert limiter.available(account, 'GET /2/tweets') == 0
+
+        # The window the lookup used up now holds back the next one
+        assert post_x_thread.verify_reply_chain(['11', '12'])[0] is None
+        assert len(http.calls) == 1
+    finally:
+        limiter.update(account, 'GET /2/tweets', None, 0, time.time() - 1)
@@ -0,0 +1,72 @@
+import threading
+
+from conftest import FakeResponse
+
+def test_concurrent_refreshes_use_the_rotated_token_once(monkeypatch, tmp_path):
+    from scripts import refresh_tokens
+    env = tmp_path / '.env'
+    env.write_text("# waygate\nX_CLIENT_ID=id\nX_CLIENT_SECRET=secret\n"
+                   "X_OAUTH2_REFRESH_TOKEN=refresh-0\nX_OAUTH2_EXPIRES_AT=0\nOTHER=kept\n")
+    monkeypatch.setattr(refresh_tokens, 'WAYGATE_ENV_PATH', str(env))
+    monkeypatch.setattr(refresh_tokens, 'LOCK_PATH', str(tmp_path / 'refresh.lock'))
+
+    used = []
+    def post(url, auth=None, data=None):
+        used.append(data['refresh_token'])
+        threading.Event().wait(0.05)   # let the other refresher queue up on the lock (time.sleep is patched)
+        n = len(used)
+        return FakeResponse(200, {'access_token': f'access-{n}', 'refresh_token': f'refresh-{n}', 'expires_in': 7200})
+    monkeypatch.setattr(refresh_tokens.requests, 'post', post)
+
+    outcomes = []
+    workers = [threading.Thread(target=lambda: outcomes.append(refresh_tokens.refresh_x_token(300))) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert outcomes == [True, True]
+    assert used == ['refresh-0']
+    creds = refresh_tokens.load_credentials_from_waygate()
+    assert creds['X_OAUTH2_REFRESH_TOKEN'] == 'refresh-1'
+    assert creds['X_OAUTH2_ACCESS_TOKEN'] == 'access-1'
+    assert creds['OTHER'] == 'kept'
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith('.tmp')] == []
+
+def test_forced_refresh_reads_the_token_rotated_by_the_last_one(monkeypatch, tmp_path):
+    from scripts import refresh_tokens
+    env = tmp_path / '.env'
+    env.write_text("X_CLIENT_ID=id\nX_CLIENT_SECRET=secret\nX_OAUTH2_REFRESH_TOKEN=refresh-0\n")
+    monkeypatch.setattr(refresh_tokens, 'WAYGATE_ENV_PATH', str(env))
+    monkeypatch.setattr(refresh_tokens, 'LOCK_PATH', str(tmp_path / 'refresh.lock'))
+
+    used = []
+    def post(url, auth=None, data=None):
+        used.append(data['refresh_token'])
+        return FakeResponse(200, {'access_token': 'a', 'refresh_token': f'refresh-{len(used)}', 'expires_in': 7200})
+    monkeypatch.setattr(refresh_tokens.requests, 'post', post)
+
+    assert refresh_tokens.refresh_x_token() and refresh_tokens.refresh_x_token()
+    assert used == ['refresh-0', 'refresh-1']
+
+def test_keeper_with_a_wide_margin_really_refreshes(monkeypatch, tmp_path):
+    import time
+    from scripts import refresh_tokens, token_keeper, post_x_thread
+    env = tmp_path / '.env'
+    expires_at = int(time.time()) + 1800     # inside a 1h margin, outside the default 10 minutes
+    env.write_text(f"X_CLIENT_ID=id\nX_CLIENT_SECRET=secret\nX_OAUTH2_REFRESH_TOKEN=refresh-0\n"
+                   f"X_OAUTH2_EXPIRES_AT={expires_at}\n")
+    monkeypatch.setattr(refresh_tokens, 'WAYGATE_ENV_PATH', str(env))
+    monkeypatch.setattr(refresh_tokens, 'LOCK_PATH', str(tmp_path / 'refresh.lock'))
+    monkeypatch.setattr(post_x_thread, 'get_x_auth', lambda: (None, None))
+    used = []
+    monkeypatch.setattr(refresh_tokens.requests, 'post', lambda url, auth=None, data=None: used.append(1) or
+                        FakeResponse(200, {'access_token': 'a', 'refresh_token': 'refresh-1', 'expires_in': 7200}))
+
+    keeper = token_keeper.TokenKeeper(margin=3600)
+    assert keeper.margin > token_keeper.REFRESH_MARGIN_SECONDS
+    assert keeper.next_due(refresh_tokens.load_credentials_from_waygate())['X'] <= time.time()
+
+    keeper.refresh('X')
+    assert used == [1]
+    assert keeper.next_due(refresh_tokens.load_credentials_from_waygate())['X'] > time.time()
@@ -0,0 +1,50 @@
+import random
+
+def journal_thread(status):
+    from scripts.posting_journal import PostingJournal
+    journal = PostingJournal()
+    thread_id = journal.start_thread(None, 2)
+    tweet_ids = [str(random.randrange(10 ** 17, 10 ** 18)) for _ in range(2)]
+    for position, tweet_id in enumerate(tweet_ids, 1):
+        journal.record_tweet(thread_id, position, tweet_id, text=f"tweet {position}")
+    journal.finish_thread(thread_id, status)
+    return tweet_ids
+
+def no_deletes(monkeypatch):
+    from scripts import rollback_thread
+    deleted = []
+    monkeypatch.setattr(rollback_thread, 'delete_tweet', lambda tweet_id, auth, headers: deleted.append(tweet_id) or 'deleted')
+    return deleted
+
+def test_complete_thread_is_refused(monkeypatch, x_credentials):
+    from scripts.rollback_thread import rollback
+    from scripts.posting_journal import COMPLETE
+    deleted = no_deletes(monkeypatch)
+    tweet_ids = journal_thread(COMPLETE)
+
+    assert rollback(tweet_ids[1]) == {}
+    assert deleted == []
+
+    assert set(rollback(tweet_ids[1], force=True)) == set(tweet_ids)
+    assert sorted(deleted) == sorted(tweet_ids)
+
+def test_failed_thread_is_rolled_back(monkeypatch, x_credentials):
+    from scripts.rollback_thread import rollback
+    from scripts.posting_journal import FAILED
+    deleted = no_deletes(monkeypatch)
+    tweet_ids = journal_thread(FAILED)
+
+    assert set(rollback(tweet_ids[0])) == set(tweet_ids)
+    assert sorted(deleted) == sorted(tweet_ids)
+
+def test_dedup_fallback_asks_before_deleting(tmp_path, monkeypatch, x_credentials):
+    from scripts.rollback_thread import rollback
+    from scripts.dedup_index import DedupIndex
+    deleted = no_deletes(monkeypatch)
+    thread = tmp_path / 'old-thread.txt'
+    thread.write_text("TWEET 1/1:\nPosted before the journal\n")
+    DedupIndex().record(f"Old post from {tmp_path}", 'x', post_id='77', source=str(thread))
+
+    asked = []
+    assert rollback(str(thread), confirm=lambda question: asked.append(question) or False) == {}
+    assert asked and deleted == []
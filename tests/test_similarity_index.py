@@ -0,0 +1,33 @@
+import hashlib
+
+def reference_minhash(text):
+    """The signature as defined: min over shingles of (a * h + b) % p, per permutation"""
+    from scripts.similarity_index import shingles, PERMUTATIONS, MERSENNE_PRIME, MAX_HASH, NUM_PERM
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+              for s in shingles(text)]
+    if not hashes:
+        return [MAX_HASH] * NUM_PERM
+    return [min((a * h + b) % MERSENNE_PRIME for h in hashes) & MAX_HASH for a, b in PERMUTATIONS]
+
+def test_packed_minhash_matches_the_definition():
+    from scripts.similarity_index import minhash
+    texts = ["", "one", "two words", "Shipping the new posting journal today https://example.com/x",
+             " ".join(f"word{i % 37}" for i in range(300))]
+    for text in texts:
+        assert list(minhash(text)) == reference_minhash(text)
+
+def test_permute_at_the_edges_of_the_field():
+    from scripts.similarity_index import _permute, PERMUTATIONS, MERSENNE_PRIME, SLOT_BITS, NUM_PERM
+    for h in (0, 1, MERSENNE_PRIME - 1):
+        packed = _permute(h)
+        slots = [packed >> (SLOT_BITS * i) & ((1 << SLOT_BITS) - 1) for i in range(NUM_PERM)]
+        assert slots == [(a * h + b) % MERSENNE_PRIME for a, b in PERMUTATIONS]
+
+def test_reworded_post_is_found(tmp_path):
+    from scripts.similarity_index import SimilarityIndex
+    index = SimilarityIndex(str(tmp_path / 'similarity.db'))
+    index.add("We cut the posting pipeline from nine seconds to under two by batching media uploads", 'x', post_id='1')
+    index.add("Completely unrelated note about gardening and tomatoes in late summer", 'x', post_id='2')
+
+    matches = index.query("We cut the posting pipeline from nine seconds to under two by batching all media uploads")
+    assert matches[0][1]['post_id'] == '1' and matches[0][0] >= 0.5
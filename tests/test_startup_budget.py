@@ -0,0 +1,12 @@
+import pytest
+
+@pytest.mark.parametrize('cli_args', [['--help'], ['post-x', '--help']])
+def test_cli_imports_stay_within_budget(cli_args):
+    from scripts.startup_budget import check, CHECKS
+    assert cli_args in CHECKS
+    assert check(cli_args)
+
+def test_post_x_help_does_not_post(capsys):
+    from scripts.post_x_thread import run
+    assert run(['--help']) is True
+    assert 'Usage:' in capsys.readouterr().out
@@ -0,0 +1,46 @@
+import os
+import uuid
+
+from conftest import FakeHTTP, tweet_poster
+
+def write_thread(path, status):
+    tag = uuid.uuid4().hex
+    path.write_text(f"Date: 2026-10-19\nStatus: {status}\n\n"
+                    f"TWEET 1/2:\nWatcher test {tag}\n\nTWEET 2/2:\nMore about {tag}\n")
+    return path
+
+def test_lowercase_ready_status_is_posted_once(tmp_path, monkeypatch, x_credentials):
+    from scripts import thread_watcher, post_x_thread
+
+    http = FakeHTTP(default=tweet_poster())
+    monkeypatch.setattr(post_x_thread, 'http', http)
+    path = write_thread(tmp_path / 'thread.txt', 'ready to post')
+
+    thread_watcher.process(str(path))
+    content = path.read_text()
+    assert 'Status: Posted' in content
+    assert 'Thread URL: https://twitter.com/i/web/status/' in content
+
+    # The rewrite's own IN_MOVED_TO event must not post (or rewrite) again
+    posts = [call for call in http.calls if call[0] == 'post']
+    thread_watcher.process(str(path))
+    assert [call for call in http.calls if call[0] == 'post'] == posts
+    assert path.read_text() == content
+
+def test_mark_posted_leaves_file_alone_without_ready_status(tmp_path):
+    from scripts import thread_watcher
+
+    path = write_thread(tmp_path / 'thread.txt', 'Draft')
+    before = os.stat(path)
+
+    assert thread_watcher.mark_posted(str(path), 'https://twitter.com/i/web/status/1') is False
+    assert os.stat(path).st_ino == before.st_ino
+    assert 'Status: Draft' in path.read_text()
+
+def test_mark_posted_matches_status_case_insensitively(tmp_path):
+    from scripts import thread_watcher
+
+    path = write_thread(tmp_path / 'thread.txt', 'READY TO POST')
+
+    assert thread_watcher.mark_posted(str(path), 'https://twitter.com/i/web/status/1') is True
+    assert 'Thread URL: https://twitter.com/i/web/status/1' in path.read_text()
@@ -0,0 +1,111 @@
+import uuid
+
+import pytest
+
+from conftest import FakeHTTP, FakeResponse
+
+def handles(count):
+    prefix = uuid.uuid4().hex[:8]
+    return [f"h{prefix}{i}" for i in range(count)]
+
+def list_file(tmp_path, names):
+    path = tmp_path / 'leaders.md'
+    path.write_text('# Test Leaders X List\n\n' + '\n'.join(f"- @{name}" for name in names) + '\n')
+    return str(path)
+
+class FakeX:
+    """Users, lists and members behind the endpoints x_list_builder calls"""
+
+    def __init__(self, users, lists=None, members=None, fail=()):
+        self.users = {name.lower(): (str(1000 + i), name) for i, name in enumerate(users)}
+        self.lists = lists or {}
+        self.members = members or {}
+        self.fail = set(fail)
+        self.lookups = 0
+        self.http = FakeHTTP(default=self.respond)
+
+    def respond(self, method, url, kwargs):
+        if method == 'get' and url.endswith('/2/users/by'):
+            self.lookups += 1
+            if ('users/by', self.lookups) in self.fail:
+                return FakeResponse(503, {'title': 'Service Unavailable'})
+            names = kwargs['params']['usernames'].split(',')
+            return FakeResponse(200, {'data': [{'id': self.users[n.lower()][0], 'username': self.users[n.lower()][1]}
+                                               for n in names if n.lower() in self.users]})
+        if method == 'get' and url.endswith('/owned_lists'):
+            if 'owned_lists' in self.fail:
+                return FakeResponse(500, {'title': 'Internal Error'})
+            return FakeResponse(200, {'data': [{'id': list_id, 'name': name} for name, list_id in self.lists.items()]})
+        if method == 'get' and url.endswith('/members'):
+            return FakeResponse(200, {'data': [{'id': user_id, 'username': name} for user_id, name in self.members.items()]})
+        if method == 'post' and url.endswith('/2/lists'):
+            return FakeResponse(201, {'data': {'id': 'new-list'}})
+        if method == 'post' and url.endswith('/members'):
+            return FakeResponse(200, {'data': {'is_member': True}})
+        if method == 'delete':
+            return FakeResponse(200, {'data': {'is_member': False}})
+        raise AssertionError(f"unexpected {method} {url}")
+
+    def writes(self):
+        return [(method, url) for method, url, _ in self.http.calls if method in ('post', 'delete')]
+
+@pytest.fixture
+def fake_x(monkeypatch, x_credentials):
+    from scripts import post_x_thread, x_list_builder
+
+    def install(fake):
+        monkeypatch.setattr(post_x_thread, 'http', fake.http)
+        monkeypatch.setattr(x_list_builder, '_session', lambda: fake.http)
+        return fake
+    return install
+
+def test_failed_lookup_batch_aborts_without_removing_members(tmp_path, monkeypatch, fake_x):
+    from scripts import x_list_builder
+    monkeypatch.setattr(x_list_builder, 'LOOKUP_BATCH', 2)
+
+    names = handles(4)
+    fake = fake_x(FakeX(names, lists={'Test Leaders': 'L1'}, fail=[('users/by', 2)]))
+    fake.members = {fake.users[name.lower()][0]: name for name in names}
+
+    assert x_list_builder.sync_list(list_file(tmp_path, names)) is False
+    assert fake.writes() == []
+
+def test_failed_list_lookup_does_not_create_a_duplicate(tmp_path, fake_x):
+    from scripts import x_list_builder
+
+    names = handles(2)
+    fake = fake_x(FakeX(names, lists={'Test Leaders': 'L1'}, fail=['owned_lists']))
+
+    assert x_list_builder.sync_list(list_file(tmp_path, names)) is False
+    assert fake.writes() == []
+
+def test_sync_adds_and_removes_only_the_difference(tmp_path, fake_x):
+    from scripts import x_list_builder
+
+    names = handles(3)
+    fake = fake_x(FakeX(names + ['gone'], lists={'Test Leaders': 'L1'}))
+    fake.members = {fake.users[names[0].lower()][0]: names[0], fake.users['gone'][0]: 'gone'}
+
+    assert x_list_builder.sync_list(list_file(tmp_path, names)) is True
+    writes = fake.writes()
+    assert sorted(method for method, _ in writes) == ['delete', 'post', 'post']
+    assert ('delete', f"https://api.twitter.com/2/lists/L1/members/{fake.users['gone'][0]}") in writes
+
+def test_dry_run_with_pending_changes_succeeds_without_writing(tmp_path, fake_x):
+    from scripts import x_list_builder
+
+    names = handles(2)
+    fake = fake_x(FakeX(names, lists={'Test Leaders': 'L1'}))
+
+    assert x_list_builder.sync_list(list_file(tmp_path, names), dry_run=True) is True
+    assert fake.writes() == []
+
+def test_no_resolved_handles_never_empties_the_list(tmp_path, fake_x):
+    from scripts import x_list_builder
+
+    members = handles(2)
+    fake = fake_x(FakeX(members, lists={'Test Leaders': 'L1'}))
+    fake.members = {fake.users[name.lower()][0]: name for name in members}
+
+    assert x_list_builder.sync_list(list_file(tmp_path, handles(3))) is False
+    assert fake.writes() == []